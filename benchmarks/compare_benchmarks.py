@@ -0,0 +1,76 @@
+"""
+Compares two result files of `benchmarks/simulation_benchmark.py`.
+
+For every case that succeeded in both files, prints the old and new run time, construction time and peak
+memory, and the ratio new / old (below 1 is faster or smaller). Cases that only succeeded in one of the
+files are listed with their status.
+
+Usage:
+    python benchmarks/compare_benchmarks.py before.json after.json
+"""
+
+import argparse
+import json
+
+KEY = ('topology', 'computers', 'delay', 'algorithm')
+
+
+def load_results(path) -> tuple:
+    """
+    Loads a result file.
+
+    Args:
+        path (str): The path of the JSON result file.
+
+    Returns:
+        tuple: The commit of the results and a dictionary of its cases keyed by (topology, computers, delay, algorithm).
+    """
+    with open(path) as f:
+        data = json.load(f)
+    return data.get('commit'), {tuple(result[key] for key in KEY): result for result in data['results']}
+
+
+def ratio(new, old) -> str:
+    """
+    Formats the ratio of two measurements.
+
+    Args:
+        new (float): The new measurement.
+        old (float): The old measurement.
+
+    Returns:
+        str: new / old, or "-" if old is zero.
+    """
+    return f"{new / old:6.2f}x" if old else "     -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two simulator benchmark result files")
+    parser.add_argument('old')
+    parser.add_argument('new')
+    args = parser.parse_args()
+
+    old_commit, old_results = load_results(args.old)
+    new_commit, new_results = load_results(args.new)
+    print(f"old: {old_commit}\nnew: {new_commit}\n")
+    print(f"{'case':>48}  {'run old':>9} {'run new':>9} {'ratio':>7}  {'build old':>9} {'build new':>9} {'ratio':>7}"
+          f"  {'MiB old':>8} {'MiB new':>8} {'ratio':>7}")
+
+    for case in sorted(old_results.keys() | new_results.keys(), key=lambda case: tuple(map(str, case))):
+        name = " ".join(map(str, case))
+        old = old_results.get(case, {'status': 'missing'})
+        new = new_results.get(case, {'status': 'missing'})
+        if old['status'] != 'ok' or new['status'] != 'ok':
+            if old['status'] != new['status']:
+                print(f"{name:>48}  {old['status']} -> {new['status']}")
+            continue
+
+        old_run, new_run = old['timings']['run'], new['timings']['run']
+        old_build, new_build = old['timings']['net_creation'], new['timings']['net_creation']
+        old_memory, new_memory = old['peak_rss_kib'] / 1024, new['peak_rss_kib'] / 1024
+        print(f"{name:>48}  {old_run:9.3f} {new_run:9.3f} {ratio(new_run, old_run)}  {old_build:9.3f} {new_build:9.3f}"
+              f" {ratio(new_build, old_build)}  {old_memory:8.1f} {new_memory:8.1f} {ratio(new_memory, old_memory)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Microbenchmark of the message queue backends.
+
+Runs the classic "hold" model on every backend in `initializationModule.MESSAGE_QUEUES`: the queue is filled
+with `size` pending messages, then each operation pops the earliest message and pushes a new one at
+`arrival_time + delay`. Constant delays are 1, random delays are drawn from `random.random()`, as in
+`Communication.send_message`. Every backend is checked to pop the same sequence as the heap.
+
+Usage:
+    python benchmarks/queue_benchmark.py --sizes 1000 100000 1000000 --operations 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulator.initializationModule as initializationModule
+
+
+def hold(queue_class, size, operations, delay_type, seed):
+    """
+    Runs the hold model on a queue backend.
+
+    Args:
+        queue_class (type): The queue backend.
+        size (int): The number of pending messages.
+        operations (int): The number of pop/push operations to time.
+        delay_type (str): "Constant" or "Random".
+        seed (int): Seed for the delays.
+
+    Returns:
+        tuple: The number of operations per second and a checksum of the popped sequence.
+    """
+    rng = random.Random(seed)
+    delay = (lambda: 1) if delay_type == "Constant" else rng.random
+    queue = queue_class()
+    for i in range(size):
+        queue.push(delay(), i, i, None)
+
+    checksum = 0
+    start = time.perf_counter()
+    for i in range(operations):
+        message = queue.pop()
+        checksum = (checksum * 31 + message.counter) % 1000000007
+        queue.push(message.arrival_time + delay(), message.dest_id, i, None)
+    elapsed = time.perf_counter() - start
+    return operations / elapsed, checksum
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Message queue backend microbenchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--operations', type=int, default=500000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'delay':<10}{'pending':>10}  " + "".join(f"{name:>14}" for name in initializationModule.MESSAGE_QUEUES))
+    for delay_type in ("Constant", "Random"):
+        for size in args.sizes:
+            rates = []
+            expected = None
+            for name, queue_class in initializationModule.MESSAGE_QUEUES.items():
+                rate, checksum = hold(queue_class, size, args.operations, delay_type, args.seed)
+                if expected is None:
+                    expected = checksum
+                elif checksum != expected:
+                    print(f"error: {name} popped a different sequence than the heap", file=sys.stderr)
+                rates.append(rate)
+            print(f"{delay_type:<10}{size:>10}  " + "".join(f"{rate / 1e6:>10.3f} M/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+End-to-end benchmark of the simulator.
+
+Runs network construction and `runModule.initiateRun` for every combination of topology, size, delay type and
+bundled algorithm, each case in its own process so that its peak memory is measured in isolation. Every case
+reports the construction phases recorded in `Initialization.timings` (ID assignment, topology generation,
+algorithm load, delay creation), the run time, the number of messages and the peak resident set size.
+A case that fails or exceeds the timeout skips the larger sizes of the same combination.
+
+The results are saved as JSON, to be compared between commits with `benchmarks/compare_benchmarks.py`.
+
+Usage:
+    python benchmarks/simulation_benchmark.py --output before.json
+    python benchmarks/simulation_benchmark.py --topologies Line Tree --sizes 100 1000 --output after.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import simulator.topologyModule as topologyModule
+
+TOPOLOGIES = ["Random", "Line", "Clique", "Tree", "Star"]
+SIZES = [100, 1000, 10000, 100000, 1000000]
+DELAYS = ["Random", "Constant"]
+ALGORITHMS = ["BFSalgorithm", "broadcastAlgorithm"]
+
+
+def run_case(topology, computers, delay, algorithm, seed) -> dict:
+    """
+    Builds and runs a single case in the current process.
+
+    Args:
+        topology (str): The topology type.
+        computers (int): The number of computers.
+        delay (str): The delay type.
+        algorithm (str): The name of the bundled algorithm.
+        seed (int): Seed for the random number generators.
+
+    Returns:
+        dict: The phase timings in seconds, the number of messages and the peak resident set size in KiB.
+    """
+    import resource
+
+    import simulator.communication as communication
+    import simulator.headlessModule as headlessModule
+    import simulator.initializationModule as initializationModule
+    import simulator.runModule as runModule
+
+    network_variables = headlessModule.apply_overrides({}, {
+        'Number of Computers': computers,
+        'Topology': topology,
+        'ID Type': 'Sequential',
+        'Delay': delay,
+        'Root': 'Min ID',
+        'Algorithm': algorithm,
+        'Logging': 'Short',
+    })
+    headlessModule.seed_simulator(seed)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        network = initializationModule.Initialization(network_variables)
+        comm = communication.Communication(network)
+        net_creation = time.perf_counter() - start
+        start = time.perf_counter()
+        runModule.initiateRun(network, comm)
+        run = time.perf_counter() - start
+
+    return {
+        'timings': dict(network.timings, net_creation=net_creation, run=run),
+        'messages': network.message_queue.counter,
+        'peak_rss_kib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def spawn_case(topology, computers, delay, algorithm, seed, timeout) -> dict:
+    """
+    Runs a single case in a child process.
+
+    Args:
+        topology (str): The topology type.
+        computers (int): The number of computers.
+        delay (str): The delay type.
+        algorithm (str): The name of the bundled algorithm.
+        seed (int): Seed for the random number generators.
+        timeout (float): The number of seconds after which the case is stopped.
+
+    Returns:
+        dict: The case, its status ("ok", "timeout" or "error") and, if it succeeded, its results.
+    """
+    case = {'topology': topology, 'computers': computers, 'delay': delay, 'algorithm': algorithm}
+    command = [sys.executable, os.path.abspath(__file__), '--case', json.dumps(dict(case, seed=seed))]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout, cwd=ROOT)
+    except subprocess.TimeoutExpired:
+        return dict(case, status='timeout')
+    if completed.returncode != 0:
+        return dict(case, status='error', error=completed.stderr.strip().splitlines()[-1:])
+    return dict(case, status='ok', **json.loads(completed.stdout))
+
+
+def git_commit() -> str:
+    """
+    Returns the current commit of the repository.
+
+    Returns:
+        str: The commit hash, or None if it cannot be determined.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=ROOT,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end simulator benchmark")
+    parser.add_argument('--topologies', nargs='+', default=TOPOLOGIES, choices=TOPOLOGIES + topologyModule.TOPOLOGIES)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--delays', nargs='+', default=DELAYS, choices=["Random", "Constant", "Exponential", "Distance"])
+    parser.add_argument('--algorithms', nargs='+', default=ALGORITHMS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=300, help="seconds per case (default: %(default)s)")
+    parser.add_argument('--output', default='benchmark.json', help="JSON results file (default: %(default)s)")
+    parser.add_argument('--case', help=argparse.SUPPRESS)  # runs a single case, used by the child processes
+    args = parser.parse_args()
+
+    if args.case:
+        case = json.loads(args.case)
+        print(json.dumps(run_case(case['topology'], case['computers'], case['delay'], case['algorithm'], case['seed'])))
+        return
+
+    results = []
+    for topology in args.topologies:
+        for delay in args.delays:
+            for algorithm in args.algorithms:
+                feasible = True
+                for computers in sorted(args.sizes):
+                    if not feasible:
+                        result = {'topology': topology, 'computers': computers, 'delay': delay,
+                                  'algorithm': algorithm, 'status': 'skipped'}
+                    else:
+                        result = spawn_case(topology, computers, delay, algorithm, args.seed, args.timeout)
+                        feasible = result['status'] == 'ok'
+                    results.append(result)
+
+                    if result['status'] == 'ok':
+                        timings = result['timings']
+                        print(f"{topology:>7} {computers:>8} {delay:>8} {algorithm:>18}  topology {timings['topology']:8.3f}s"
+                              f"  load {timings['algorithm_load']:7.3f}s  run {timings['run']:8.3f}s"
+                              f"  {result['messages']:>10} msgs  {result['peak_rss_kib'] / 1024:8.1f} MiB")
+                    else:
+                        print(f"{topology:>7} {computers:>8} {delay:>8} {algorithm:>18}  {result['status']}")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'results': results,
+        }, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
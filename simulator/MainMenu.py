@@ -15,9 +15,9 @@ import os
 NETWORK_VARIABLES = 'network_variables.json'
 CHECKBOX_LAYOUT_GEOMETRY = (800, 100, 500, 600)
 COMBOBOX_OPTIONS = {
-    "Topology": "Random, Clique, Line, Tree, Star",
-    "ID Type": "Random, Sequential",
-    "Delay": "Random, Constant",
+    "Topology": "Random, Clique, Line, Tree, Star, Gnp, Gnm, Barabasi-Albert, Watts-Strogatz, Regular, Grid, Torus, Hypercube, Ring, File",
+    "ID Type": "Random, Sequential, Permuted, Sparse",
+    "Delay": "Random, Constant, Exponential, Distance",
     "Display": "Text, Graph",
     "Root": "No Root, Min ID, Random",
     "Logging": "Short, Medium, Long",
@@ -122,6 +122,10 @@ class MenuWindow(QMainWindow):
         upload_file_button.setGeometry(50, 150, 200, 30)
         upload_file_button.clicked.connect(lambda: self.on_upload_algorithm())
 
+        upload_edge_list_button = QPushButton("Upload Edge List", self)
+        upload_edge_list_button.setGeometry(270, 150, 200, 30)
+        upload_edge_list_button.clicked.connect(lambda: self.on_upload_edge_list())
+
         self.submit_button = QPushButton("Submit", self) 
         self.submit_button.setGeometry(550, 750, 150, 30)
         self.submit_button.clicked.connect(lambda: self.on_submit_all())
@@ -229,11 +233,25 @@ class MenuWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, 'Error', 'Please select a Python file (.py)', QMessageBox.Ok)
 
+
+    def on_upload_edge_list(self):
+        """
+        Handle the upload of an edge list file for the File topology.
+        """
+        fname, _ = QFileDialog.getOpenFileName(self, 'Upload Edge List', '/home', "Edge Lists (*.txt *.tsv *.gz *.edges);;All Files (*)")
+        if fname:
+            self.update_value("Topology File", fname)
+            self.update_value("Topology", "File")
+
    
     def on_submit_all(self):
         """
         Handle the final submission of all settings and save them to a JSON file.
+        The File topology can only be submitted with an uploaded edge list.
         """
+        if self.checkbox_values.get("Topology") == "File" and not os.path.isfile(self.checkbox_values.get("Topology File") or ""):
+            QMessageBox.warning(self, 'Error', 'The File topology needs an edge list. Please upload one with Upload Edge List, or choose another topology.', QMessageBox.Ok)
+            return
         with open(NETWORK_VARIABLES, "w") as f:
             json.dump(self.checkbox_values, f, indent=4)
         self.close()
@@ -0,0 +1,268 @@
+"""
+Command-line entry point for the Distributed Networks Simulator.
+
+Runs the simulator headlessly, without the PyQt5 main menu, e.g.:
+
+    python -m simulator run --config network_variables.json --n 100000 --topology Random --seed 7
+    python -m simulator replicate --n 1000 --topology Random --id-type Random --delay Random --runs 200
+    python -m simulator run --n 1000 --trace run.trace && python -m simulator trace-to-text run.trace --output output.txt
+    python -m simulator run --n 100000 --checkpoint run.ckpt --checkpoint-every 500000; python -m simulator resume run.ckpt
+    python -m simulator run --n 1000000 --topology Barabasi-Albert --degree 6
+    python -m simulator run --n 1000000 --topology Gnm --degree 20 --seed 1 --topology-cache cache/
+    python -m simulator run --topology File --topology-file com-orkut.ungraph.txt.gz
+    python -m simulator run --n 1000000 --topology Gnm --node-store Columnar
+    python -m simulator run --n 2000 --change-trace run.changes && python -m simulator replay run.changes
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+import simulator.headlessModule as headlessModule
+import simulator.topologyModule as topologyModule
+
+
+def add_network_arguments(parser):
+    """
+    Adds the arguments that override network variables to the given parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser to add the arguments to.
+    """
+    parser.add_argument('--config', default=headlessModule.NETWORK_VARIABLES,
+                        help="network variables JSON file (default: %(default)s)")
+    parser.add_argument('--n', type=int, dest='computers', help="number of computers")
+    parser.add_argument('--topology', choices=["Random", "Clique", "Line", "Tree", "Star", *topologyModule.TOPOLOGIES, "File"])
+    parser.add_argument('--topology-file', help="edge list of the File topology, possibly gzipped; sets the number of computers")
+    parser.add_argument('--degree', type=int, help="average, attachment, lattice or exact degree of the model topologies")
+    parser.add_argument('--rewiring', type=float, help="rewiring probability of the Watts-Strogatz topology")
+    parser.add_argument('--id-type', choices=["Random", "Sequential", "Permuted", "Sparse"])
+    parser.add_argument('--delay', choices=["Random", "Constant", "Exponential", "Distance"])
+    parser.add_argument('--root', choices=["No Root", "Min ID", "Random"])
+    parser.add_argument('--algorithm', help="algorithm file path, or the name of a bundled algorithm")
+    parser.add_argument('--logging', choices=["Short", "Medium", "Long"])
+    parser.add_argument('--queue', choices=["Auto", "Heap", "Calendar", "Ladder"], help="message queue backend")
+    parser.add_argument('--engine', choices=["Event", "Round", "Parallel"], help="execution engine")
+    parser.add_argument('--partitions', type=int, help="number of worker processes of the Parallel engine")
+    parser.add_argument('--node-store', choices=["Objects", "Columnar"], help="a Computer object per computer, or NumPy columns of their fields")
+    parser.add_argument('--delay-floor', type=float, help="lower bound of non-constant delays")
+    parser.add_argument('--seed', type=int, help="seed for the random number generators")
+    parser.add_argument('--topology-cache', help="directory of generated networks, reused by seeded runs of the same network")
+
+
+def network_variables_from_args(args) -> dict:
+    """
+    Loads the configuration file and applies the command-line overrides.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        dict: The network variables for the run.
+    """
+    network_variables = headlessModule.load_network_variables(args.config)
+    overrides = {
+        'Number of Computers': args.computers,
+        'Topology': args.topology,
+        'Topology File': args.topology_file,
+        'Degree': args.degree,
+        'Rewiring': args.rewiring,
+        'ID Type': args.id_type,
+        'Delay': args.delay,
+        'Root': args.root,
+        'Algorithm': args.algorithm,
+        'Logging': args.logging,
+        'Queue': args.queue,
+        'Engine': args.engine,
+        'Node Store': args.node_store,
+        'Partitions': args.partitions,
+        'Delay Floor': args.delay_floor,
+        'Topology Cache': args.topology_cache,
+    }
+    return headlessModule.apply_overrides(network_variables, overrides)
+
+
+def run_command(args):
+    """
+    Runs a single headless simulation and prints the timings.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    network_variables = network_variables_from_args(args)
+    if args.trace:
+        network_variables['Trace File'] = args.trace
+    if args.trace_writer:
+        network_variables['Trace Writer'] = args.trace_writer
+    if args.metrics:
+        network_variables['Metrics'] = True
+    if args.change_trace:
+        network_variables['Change Trace'] = args.change_trace
+    if args.checkpoint:
+        network_variables['Checkpoint File'] = args.checkpoint
+    if args.checkpoint_every:
+        network_variables['Checkpoint Every'] = args.checkpoint_every
+    if args.output:
+        sys.stdout = open(args.output, "w")
+
+    try:
+        _, comm, timings = headlessModule.run_headless(network_variables, args.seed)
+    except ValueError as error:
+        sys.exit(f"Error: {error}")
+    report_run(timings, comm, args.metrics)
+
+
+def resume_command(args):
+    """
+    Resumes a simulation from a checkpoint and prints the timings.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    if args.output:
+        sys.stdout = open(args.output, "w")
+
+    try:
+        _, comm, timings = headlessModule.resume_headless(args.checkpoint, args.trace, bool(args.metrics))
+    except ValueError as error:
+        sys.exit(f"Error: {error}")
+    report_run(timings, comm, args.metrics)
+
+
+def replay_command(args):
+    """
+    Replays a change trace in the graph visualizer.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    from PyQt5.QtWidgets import QApplication
+    import visualizations.graphVisualization as graphVisualization
+
+    app = QApplication(sys.argv)
+    try:
+        graphVisualization.replay_change_trace(args.change_trace)
+    except ValueError as error:
+        sys.exit(f"Error: {error}")
+    sys.exit(app.exec_())
+
+
+def report_run(timings, comm, metrics_path):
+    """
+    Prints the timings of a run and writes its metrics.
+
+    Args:
+        timings (dict): The timings returned by the headless run.
+        comm (Communication): The communication instance of the run.
+        metrics_path (str): The JSON file to write the metrics to, or None.
+    """
+    print("--- Total Simulation Time : %s seconds ---" % (timings['total']))
+    print("--- Net Creation Time : %s seconds ---" % (timings['net_creation']))
+    print("--- Algorithm Run Time : %s seconds ---" % (timings['algorithm_run']))
+
+    if metrics_path:
+        with open(metrics_path, 'w') as f:
+            json.dump(comm.metrics.to_dict(), f, indent=4)
+
+
+def replicate_command(args):
+    """
+    Runs replications of the configuration over a process pool and prints the statistics table.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    import simulator.replicationModule as replicationModule
+
+    network_variables = network_variables_from_args(args)
+    base_seed = args.seed if args.seed is not None else 0
+    results = replicationModule.run_replications(network_variables, args.runs, args.workers, base_seed)
+    summary = replicationModule.summarize(results)
+    print(replicationModule.format_table(results, summary))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['run', 'seed', *replicationModule.STATISTICS])
+            writer.writeheader()
+            writer.writerows(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'network_variables': network_variables, 'runs': results, 'summary': summary}, f, indent=4)
+
+
+def trace_to_text_command(args):
+    """
+    Converts a binary trace to the text format of Long logging, and reports on stderr the messages the
+    trace writer dropped, if any.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    import simulator.traceModule as traceModule
+
+    try:
+        if args.output:
+            with open(args.output, 'w') as f:
+                _, dropped = traceModule.trace_to_text(args.trace, f)
+        else:
+            _, dropped = traceModule.trace_to_text(args.trace, sys.stdout)
+    except (OSError, ValueError) as error:
+        sys.exit(f"Error: {error}")
+    if dropped:
+        print(f"--- Trace: {dropped} messages dropped ---", file=sys.stderr)
+
+
+def main(argv=None):
+    """
+    Parses the command line and dispatches to the selected command.
+
+    Args:
+        argv (list, optional): The command-line arguments. Defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(prog="python -m simulator", description="Distributed Networks Simulator")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="run a simulation without the GUI")
+    add_network_arguments(run_parser)
+    run_parser.add_argument('--output', help="write the simulation output to this file instead of stdout")
+    run_parser.add_argument('--trace', help="write the delivered messages to this binary trace file instead of logging them")
+    run_parser.add_argument('--metrics', help="record the run's metrics and write them to this JSON file")
+    run_parser.add_argument('--trace-writer', choices=["Sync", "Block", "Drop"],
+                            help="write the trace on the engine thread, or on a background thread that the engine waits for "
+                                 "(Block) or drops records for (Drop) when it falls behind (default: Block)")
+    run_parser.add_argument('--change-trace', help="record the changes of the computers to this file, to replay them in the visualizer")
+    run_parser.add_argument('--checkpoint', help="periodically write a checkpoint of the run to this file")
+    run_parser.add_argument('--checkpoint-every', type=int, help="messages delivered between checkpoints (default: 100000)")
+    run_parser.set_defaults(func=run_command)
+
+    resume_parser = subparsers.add_parser('resume', help="resume a simulation from a checkpoint")
+    resume_parser.add_argument('checkpoint', help="checkpoint file")
+    resume_parser.add_argument('--output', help="write the simulation output to this file instead of stdout")
+    resume_parser.add_argument('--trace', help="write the messages delivered after the checkpoint to this binary trace file")
+    resume_parser.add_argument('--metrics', help="record the metrics of the resumed run and write them to this JSON file")
+    resume_parser.set_defaults(func=resume_command)
+
+    replicate_parser = subparsers.add_parser('replicate', help="run seeded replications over a process pool")
+    add_network_arguments(replicate_parser)
+    replicate_parser.add_argument('--runs', type=int, default=10, help="number of replications (default: %(default)s)")
+    replicate_parser.add_argument('--workers', type=int, help="number of worker processes (default: number of CPUs)")
+    replicate_parser.add_argument('--csv', help="write the per-run statistics to this CSV file")
+    replicate_parser.add_argument('--json', help="write the per-run statistics and their summary to this JSON file")
+    replicate_parser.set_defaults(func=replicate_command)
+
+    replay_parser = subparsers.add_parser('replay', help="replay a change trace in the graph visualizer")
+    replay_parser.add_argument('change_trace', help="change trace file recorded with run --change-trace")
+    replay_parser.set_defaults(func=replay_command)
+
+    trace_parser = subparsers.add_parser('trace-to-text', help="convert a binary trace to the Long logging text format")
+    trace_parser.add_argument('trace', help="binary trace file")
+    trace_parser.add_argument('--output', help="write the text to this file instead of stdout")
+    trace_parser.set_defaults(func=trace_to_text_command)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
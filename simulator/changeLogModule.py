@@ -0,0 +1,274 @@
+"""
+Change log of the Graph display.
+
+This module defines `ChangeLog`, the double-ended sequence used for the node changes recorded during a run
+(`Initialization.node_values_change`) and for the undo stack of the graph window. Both ends are O(1), and
+once more than a configurable number of records is held in memory, the records away from the ends are
+pickled in segments to a temporary file and read back through a memory map when they are reached. The
+space of the segments read back is reclaimed, so the file stays proportional to the records it holds.
+"""
+
+import mmap
+import pickle
+import tempfile
+from collections import deque
+
+MEMORY_RECORDS = 1 << 20  # records held in memory before segments are spilled to disk
+SEGMENT_RECORDS = 1 << 15  # records per spilled segment
+
+
+class ChangeLog:
+    """
+    A deque of change records whose middle part spills to disk.
+
+    The records are kept in order as a front deque, a deque of spilled segments and a back deque. Records
+    are added and removed at the ends of the front and back deques; when the log holds more than
+    `memory_records` records in memory, the part of the larger deque next to the segments is spilled,
+    and a spilled segment is loaded back once the deque next to it is empty. A loaded segment at the end of
+    the spill file is truncated away; once at most half of the file is still in use, the remaining
+    segments are compacted into a new file.
+
+    Attributes:
+        memory_records (int): The number of records held in memory before spilling.
+        segment_records (int): The number of records per spilled segment.
+        front (deque): The records before the spilled segments.
+        segments (deque): The (offset, size, count) of the spilled segments in the spill file, in order.
+        back (deque): The records after the spilled segments.
+        spilled (int): The number of records in the spilled segments.
+        spilled_size (int): The number of bytes of the spilled segments.
+        file_size (int): The size of the spill file in bytes.
+        file (file): The spill file, created on the first spill.
+        map (mmap.mmap): A read-only memory map of the spill file, remapped when the file grows.
+    """
+
+    def __init__(self, memory_records=MEMORY_RECORDS, segment_records=SEGMENT_RECORDS):
+        """
+        Initializes an empty change log.
+
+        Args:
+            memory_records (int, optional): The number of records held in memory before spilling.
+                Defaults to MEMORY_RECORDS.
+            segment_records (int, optional): The number of records per spilled segment. Defaults to SEGMENT_RECORDS.
+        """
+        self.memory_records = max(memory_records, 2 * segment_records)
+        self.segment_records = segment_records
+        self.front = deque()
+        self.segments = deque()
+        self.back = deque()
+        self.spilled = 0
+        self.spilled_size = 0
+        self.file_size = 0
+        self.file = None
+        self.map = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of records in the log.
+
+        Returns:
+            int: The number of records, in memory and spilled.
+        """
+        return len(self.front) + self.spilled + len(self.back)
+
+    def __iter__(self):
+        """
+        Iterates over the records in order, reading the spilled segments without loading them.
+
+        Yields:
+            The records of the log.
+        """
+        yield from self.front
+        for segment in self.segments:
+            yield from self.read_segment(segment)
+        yield from self.back
+
+    def append(self, record):
+        """
+        Adds a record at the end of the log.
+
+        Args:
+            record: The record.
+        """
+        self.back.append(record)
+        if len(self.back) > self.segment_records and len(self.front) + len(self.back) > self.memory_records:
+            self.spill_back()
+
+    def appendleft(self, record):
+        """
+        Adds a record at the start of the log.
+
+        Args:
+            record: The record.
+        """
+        self.front.appendleft(record)
+        if len(self.front) > self.segment_records and len(self.front) + len(self.back) > self.memory_records:
+            self.spill_front()
+
+    def popleft(self):
+        """
+        Removes and returns the first record of the log.
+
+        Returns:
+            The first record.
+
+        Raises:
+            IndexError: If the log is empty.
+        """
+        if not self.front:
+            if self.segments:
+                self.load_segment(self.segments.popleft(), self.front)
+            elif self.back:
+                return self.back.popleft()
+            else:
+                raise IndexError("pop from an empty change log")
+        return self.front.popleft()
+
+    def pop(self):
+        """
+        Removes and returns the last record of the log.
+
+        Returns:
+            The last record.
+
+        Raises:
+            IndexError: If the log is empty.
+        """
+        if not self.back:
+            if self.segments:
+                self.load_segment(self.segments.pop(), self.back)
+            elif self.front:
+                return self.front.pop()
+            else:
+                raise IndexError("pop from an empty change log")
+        return self.back.pop()
+
+    def spill_back(self):
+        """
+        Spills the oldest records of the back deque as a segment after the other segments.
+        """
+        records = [self.back.popleft() for _ in range(self.segment_records)]
+        self.segments.append(self.write_segment(records))
+
+    def spill_front(self):
+        """
+        Spills the newest records of the front deque as a segment before the other segments.
+        """
+        records = [self.front.pop() for _ in range(self.segment_records)]
+        records.reverse()
+        self.segments.appendleft(self.write_segment(records))
+
+    def write_segment(self, records) -> tuple:
+        """
+        Appends a segment to the spill file.
+
+        Args:
+            records (list): The records of the segment, in order.
+
+        Returns:
+            tuple: The (offset, size, count) of the segment.
+        """
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(prefix='changelog-')
+        data = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+        offset = self.file_size
+        self.file.seek(offset)
+        self.file.write(data)
+        self.file_size += len(data)
+        self.spilled += len(records)
+        self.spilled_size += len(data)
+        return offset, len(data), len(records)
+
+    def read_segment(self, segment) -> list:
+        """
+        Reads a spilled segment through the memory map.
+
+        Args:
+            segment (tuple): The (offset, size, count) of the segment.
+
+        Returns:
+            list: The records of the segment, in order.
+        """
+        offset, size, _ = segment
+        if self.map is None or offset + size > len(self.map):
+            self.remap()
+        return pickle.loads(self.map[offset:offset + size])
+
+    def remap(self):
+        """
+        Maps the whole spill file, after writing out its buffered data.
+        """
+        self.file.flush()
+        if self.map is not None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def load_segment(self, segment, target):
+        """
+        Moves a spilled segment back into memory.
+
+        Args:
+            segment (tuple): The (offset, size, count) of the segment.
+            target (deque): The empty deque that receives the records.
+        """
+        target.extend(self.read_segment(segment))
+        offset, size, count = segment
+        self.spilled -= count
+        self.spilled_size -= size
+        if not self.segments:
+            self.truncate(0)
+        elif offset + size == self.file_size:
+            self.truncate(max(offset + size for offset, size, _ in self.segments))
+        if self.segments and self.spilled_size * 2 <= self.file_size:
+            self.compact()
+
+    def truncate(self, size):
+        """
+        Cuts the spill file after its first `size` bytes, which must hold all the spilled segments.
+
+        Args:
+            size (int): The new size of the spill file in bytes.
+        """
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.truncate(size)
+        self.file_size = size
+
+    def compact(self):
+        """
+        Copies the spilled segments, in order, into a new spill file that replaces the current one.
+        """
+        if self.map is None or len(self.map) < self.file_size:
+            self.remap()
+        compacted = tempfile.TemporaryFile(prefix='changelog-')
+        segments = deque()
+        for offset, size, count in self.segments:
+            segments.append((compacted.tell(), size, count))
+            compacted.write(self.map[offset:offset + size])
+        self.close_file()
+        self.file = compacted
+        self.file_size = compacted.tell()
+        self.segments = segments
+
+    def close_file(self):
+        """
+        Closes the memory map and deletes the spill file.
+        """
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.file_size = 0
+
+    def close(self):
+        """
+        Drops all the records and deletes the spill file.
+        """
+        self.front.clear()
+        self.segments.clear()
+        self.back.clear()
+        self.spilled = 0
+        self.spilled_size = 0
+        self.close_file()
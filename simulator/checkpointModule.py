@@ -0,0 +1,101 @@
+"""
+Checkpoints of a running simulation.
+
+A checkpoint holds the whole state of a simulation between two events: the network with its pending
+message queue (entries and counter), every computer's attributes, the simulated time and the network's
+NumPy generator, together with the state of the global `random` and `numpy.random` generators. Resuming
+from a checkpoint continues to the same final result as the uninterrupted run.
+
+Algorithm modules are reloaded from their path, so state kept in module-level globals of an algorithm is
+not part of a checkpoint. Checkpoints are pickles: only resume from files you trust.
+"""
+
+import copyreg
+import gzip
+import os
+import pickle
+import random
+
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def restore_view(data, format):
+    """
+    Rebuilds a pickled memoryview.
+
+    Args:
+        data (bytes): The contents of the view.
+        format (str): The struct format of its elements.
+
+    Returns:
+        memoryview: A view of a copy of the contents.
+    """
+    return memoryview(data).cast(format)
+
+
+def reduce_view(view):
+    """
+    Pickles a memoryview, e.g. the `connectedEdges` of a computer held by a queued multicast, as a copy of
+    its contents.
+
+    Args:
+        view (memoryview): The view.
+
+    Returns:
+        tuple: The function and arguments that rebuild the view.
+    """
+    return restore_view, (view.tobytes(), view.format)
+
+
+def save_checkpoint(path, network):
+    """
+    Writes a checkpoint of the network.
+
+    The checkpoint is written to a temporary file that then replaces `path`, so an interrupted write never
+    leaves a truncated checkpoint behind.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        network (Initialization): The network, between two events.
+    """
+    state = {
+        'version': CHECKPOINT_VERSION,
+        'network': network,
+        'random_state': random.getstate(),
+        'numpy_random_state': np.random.get_state(),
+    }
+    temporary_path = path + '.tmp'
+    with gzip.open(temporary_path, 'wb', compresslevel=1) as f:
+        pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = copyreg.dispatch_table.copy()
+        pickler.dispatch_table[memoryview] = reduce_view
+        pickler.dump(state)
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Reads a checkpoint and restores the state of the random number generators.
+
+    Args:
+        path (str): The path of the checkpoint file.
+
+    Returns:
+        Initialization: The restored network.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of a supported version.
+    """
+    try:
+        with gzip.open(path, 'rb') as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError) as error:
+        raise ValueError(f"{path} is not a checkpoint file: {error}")
+    if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a version {CHECKPOINT_VERSION} checkpoint")
+
+    random.setstate(state['random_state'])
+    np.random.set_state(state['numpy_random_state'])
+    return state['network']
@@ -5,8 +5,15 @@ This module handles the sending and receiving of messages between computers in t
 """
 
 import random
-from simulator.computer import Computer
+
+import numpy as np
+
+from simulator.computer import Computer, ReadOnlyList
+from simulator.message import Message
 import simulator.initializationModule as initializationModule
+import simulator.traceModule as traceModule
+
+FANOUT_THRESHOLD = 32  # degree from which send_to_all computes the arrival times with NumPy
 
 
 class Communication:
@@ -15,6 +22,7 @@ class Communication:
     
     Attributes:
         network (Initialization): The network initialization object containing the computers and configurations.
+        trace (TraceWriter): The binary trace of the delivered messages, or None if the network has no trace file.
     """
 
     def __init__(self, network: initializationModule.Initialization):
@@ -25,11 +33,34 @@ class Communication:
             network (Initialization): The initialized network containing the computers.
         """
         self.network = network
+        self.trace = None
+        if network.trace_file:
+            self.trace = traceModule.open_trace(network.trace_file, network.trace_writer)
+
+    def start_run(self):
+        """
+        Called by the engine before the first `init` call.
+        """
+
+    def finish_run(self):
+        """
+        Called by the engine once the run is over: writes the end of the trace file, if there is one, and
+        reports the messages it dropped, and closes the change trace file, if there is one.
+        """
+        if self.network.change_trace_file:
+            self.network.node_values_change.close()
+        if self.trace is not None:
+            self.trace.close()
+            if self.trace.dropped:
+                print(f"--- Trace: {self.trace.dropped} messages dropped ---")
         
     # Send a message from the source computer to the destination computer
     def send_message(self, source, dest, message_info, sent_time = None):
         """
         Sends a message from the source computer to the destination computer, with optional arrival time.
+
+        The delay is the precomputed delay of the edge between them. A message to a computer that is not a
+        neighbor gets a delay of 1 with Constant delays, or a uniform delay above the delay floor otherwise.
         
         Args:
             source (int): The ID of the source computer sending the message.
@@ -38,29 +69,41 @@ class Communication:
             sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
         """
         current_computer =  self.network.network_dict.get(source)
+        delay = current_computer.delay_to(dest)
+        if delay is None:
+            if self.network.delay_type == 'Constant':
+                delay = 1
+            else:
+                delay = self.network.delay_floor + (1 - self.network.delay_floor) * random.random()
+        self.post_message(current_computer, dest, delay, message_info, sent_time)
+
+    def post_message(self, source_computer: Computer, dest, delay, message_info, sent_time = None):
+        """
+        Queues a message with a known delay, unless the source computer has terminated.
 
-        if not current_computer.state == "terminated":
+        Args:
+            source_computer (Computer): The computer sending the message.
+            dest (int): The ID of the destination computer receiving the message.
+            delay (float): The delay of the message.
+            message_info (str): The content of the message being sent.
+            sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
+        """
+        if not source_computer.state == "terminated":
             # creating a new message which will be put into the queue
             if sent_time is None:
                 sent_time = 0
-                  
-            if self.network.delay_type == 'Random':
-                delay = random.random()
-            elif self.network.delay_type == 'Constant':
-                delay = 1
-                
-            message = {
-            'source_id': source,
-            'dest_id': dest,
-            'arrival_time': sent_time + delay,
-            'content': message_info,
-            }
-            self.network.message_queue.push(message)
+            self.network.message_queue.push(sent_time + delay, source_computer.id, dest, message_info)
     
     
     def send_to_all(self, source_id, message_info, sent_time = None):
         """
         Sends a message from the source computer to all connected computers.
+
+        The source's state is checked once, the arrival times are computed from the source's delay table
+        in one pass and the messages are inserted into the queue in bulk. If every message arrives at the
+        same time (e.g. Constant delays), a single multicast entry is queued for the whole fan-out; it holds
+        the source's read-only `connectedEdges`, or a tuple copy of a plain list, so the destinations cannot
+        change before it is delivered.
         
         Args:
             source_id (int): The ID of the source computer sending the message.
@@ -68,27 +111,72 @@ class Communication:
             sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
         """
         source_computer = self.network.network_dict.get(source_id)
-        for index, connected_computer_id in enumerate(source_computer.connectedEdges):
-            self.send_message(source_id, connected_computer_id, message_info, sent_time)
+        if source_computer.state == "terminated":
+            return
+        if sent_time is None:
+            sent_time = 0
+
+        # one NumPy call for the arrival times of high-degree fan-outs, plain Python for the small ones
+        if len(source_computer.connectedEdges) >= FANOUT_THRESHOLD:
+            arrival_times = (sent_time + np.asarray(source_computer.delays)).tolist()
+        else:
+            arrival_times = [sent_time + delay for delay in source_computer.delays]
+        if not arrival_times:
+            return
+        if arrival_times.count(arrival_times[0]) == len(arrival_times):
+            dest_ids = source_computer.connectedEdges
+            if type(dest_ids) is not ReadOnlyList: # a list, e.g. in a Parallel partition, is copied
+                dest_ids = tuple(dest_ids)
+            self.network.message_queue.push_multicast(arrival_times[0], source_id, dest_ids, message_info)
+        else:
+            self.network.message_queue.push_many(arrival_times, source_id, source_computer.connectedEdges, message_info)
 
             
-    def receive_message(self, message : dict, comm):
+    def receive_message(self, message : Message, comm):
         """
         Receives a message and runs the appropriate algorithm on the destination computer.
+
+        The message is written to the trace if there is one, and printed otherwise with Long logging.
         
         Args:
-            message (dict): The message that was received.
+            message (Message): The message that was received.
             comm (Communication): The communication object handling the message passing.
         """
-        if self.network.logging_type=="Long":
+        if self.trace is not None:
+            self.trace.write(message)
+        elif self.network.logging_type=="Long":
             print(message)
             
-        received_id = message['dest_id']
-        received_computer = self.network.network_dict.get(received_id)
-        self.run_algorithmm(received_computer, 'mainAlgorithm', message['arrival_time'], message['content'] )
+        received_computer = self.network.network_dict.get(message.dest_id)
+        self.run_algorithmm(received_computer, 'mainAlgorithm', message.arrival_time, message.content)
 
         
-        
+    def receive_batch(self, comp: Computer, messages: list, positions: list, outbox):
+        """
+        Runs the main algorithm of a computer on all the messages it receives in a round.
+
+        The algorithm function is looked up once per batch instead of once per message. The changes for the
+        Graph display and the change trace are still recorded after every message, as the Event engine does.
+
+        Args:
+            comp (Computer): The destination computer of all the messages.
+            messages (list): All the messages of the round.
+            positions (list): The positions in `messages` of the messages sent to this computer.
+            outbox (RoundBuffer): The buffer collecting the messages sent during the round.
+        """
+        algorithm_function = getattr(comp.algorithm_file, 'mainAlgorithm', None)
+        if not callable(algorithm_function):
+            print(f"Error: Function 'mainAlgorithm' not found in {comp.algorithm_file}.py")
+            return None
+
+        track_changes = self.network.track_changes
+        for position in positions:
+            message = messages[position]
+            outbox.current = position
+            algorithm_function(comp, self, message.arrival_time, message.content)
+            if track_changes and comp.has_changed():
+                self.network.node_values_change.append((comp.id, comp.take_changes()))
+
     def run_algorithmm(self, comp: Computer, function_name: str, arrival_time = None, message_content=None):
         """
         Runs the specified algorithm on the given computer, handling the provided message content and arrival time.
@@ -106,9 +194,8 @@ class Communication:
             elif function_name == 'mainAlgorithm':
                 algorithm_function(comp, self, arrival_time, message_content)
         
-            if self.network.display_type == "Graph" and comp.has_changed():
-                self.network.node_values_change.append(comp.__dict__.copy())
-                comp.reset_flag()
+            if self.network.track_changes and comp.has_changed():
+                self.network.node_values_change.append((comp.id, comp.take_changes()))
         else:
             print(f"Error: Function '{function_name}' not found in {comp.algorithm_file}.py")
             return None
\ No newline at end of file
@@ -1,35 +1,155 @@
 """
 Computer module representing a node in the distributed network simulation.
 
-This module defines the `Computer` class, which is used to represent a computer node in the network, including its connections, delays, and other properties.
+This module defines the `Computer` class, which is used to represent a computer node in the network, including its connections, delays, and other properties,
+and the `TrackedComputer` class, which also records the fields changed by the algorithm for the Graph display.
 """
 
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class _Missing:
+    """
+    The old value of a field that did not exist before it was changed.
+    """
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"  # pickled by reference, so the sentinel stays unique
+
+
+MISSING = _Missing()
+
+
+class ReadOnlyList(Sequence):
+    """
+    A read-only, list-like view of a computer's slice of one of the network's arrays, e.g. its `connectedEdges`.
+
+    It is indexed, iterated, compared, printed and concatenated like a list, without copying the slice, but
+    it cannot be changed, since the slice is shared with the network's adjacency.
+
+    Attributes:
+        view (memoryview): A read-only view of the slice, or a list if the view was unpickled.
+    """
+
+    __slots__ = ('view',)
+
+    def __init__(self, view):
+        """
+        Wraps a view.
+
+        Args:
+            view (memoryview): A read-only view of the slice, or a list.
+        """
+        self.view = view
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items.
+        """
+        return len(self.view)
+
+    def __getitem__(self, index):
+        """
+        Returns an item, or a list of the items of a slice.
+
+        Args:
+            index (int or slice): The index or slice.
+        """
+        items = self.view[index]
+        return items.tolist() if isinstance(items, memoryview) else items
+
+    def __iter__(self):
+        """
+        Iterates over the items.
+        """
+        return iter(self.view)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Returns the items as a NumPy array, without copying a memoryview.
+        """
+        return np.asarray(self.view, dtype=dtype)
+
+    def __reduce__(self):
+        """
+        Pickles the items as a list, e.g. in a checkpoint or a queued multicast.
+
+        Returns:
+            tuple: The class and the list of the items.
+        """
+        return ReadOnlyList, (self.tolist(),)
+
+    def tolist(self) -> list:
+        """
+        Returns the items as a list.
+        """
+        return self.view.tolist() if isinstance(self.view, memoryview) else list(self.view)
+
+    def __eq__(self, other):
+        """
+        Returns whether another list, or read-only list, holds the same items.
+        """
+        if isinstance(other, ReadOnlyList):
+            return self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None  # compares like a list
+
+    def __add__(self, other):
+        """
+        Returns the list of the items followed by the items of another list.
+        """
+        if isinstance(other, ReadOnlyList):
+            other = other.tolist()
+        return self.tolist() + other if isinstance(other, list) else NotImplemented
+
+    def __radd__(self, other):
+        """
+        Returns another list followed by the list of the items.
+        """
+        return other + self.tolist() if isinstance(other, list) else NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the list of the items.
+        """
+        return repr(self.tolist())
+
+
 class Computer:
     """
     A class representing a computer in the network.
     
     Attributes:
         id (int): The ID of the computer.
-        connectedEdges (list of int): List of computer IDs to which this computer is connected.
+        connectedEdges (ReadOnlyList): The IDs of the computers to which this computer is connected, a read-only view of the network's adjacency.
         algorithm_file (module): The algorithm file associated with this computer.
         state (str): The state of the computer (e.g., active, idle, terminated).
         is_root (bool): Whether this computer is designated as the root node in the network.
         color (str): The color associated with this computer, used in visualization.
-        _has_changed (bool): A private flag indicating whether the computer's state has changed.
+        delays (ReadOnlyList): The delays of the connected edges, aligned with `connectedEdges`.
+        _edge_slots (dict): A lazily built dictionary mapping neighbor IDs to their index in `connectedEdges`.
     """
     
     def __init__(self,  ):     
         """
         Initializes a Computer object with default values for attributes.
         """
-        self._has_changed = False
-                
         self.id = None
         self.connectedEdges = []
         self.algorithm_file=None
         self.state = None
         self.is_root = False
         self.color = "olivedrab"
+        self.delays = []
+        self._edge_slots = None
 
     def __str__(self):
         """
@@ -38,45 +158,63 @@ class Computer:
         Returns:
             str: The string representation of the computer.
         """
-        return f"id = {self.id}\nconnected edges = {self.connectedEdges}\n"
+        return f"id = {self.id}\nconnected edges = {list(self.connectedEdges)}\n"
     
-    def __setattr__(self, name, value):
+    def __getstate__(self):
         """
-        Overrides the default setattr method to set the `_has_changed` flag when non-private attributes change.
-        
-        Args:
-            name (str): The name of the attribute being set.
-            value (Any): The value to set the attribute to.
+        Returns the picklable state of the computer, used by checkpoints.
+
+        The algorithm module, the views of the network's adjacency and delay table and the neighbor cache
+        are left out; the network restores them when it is unpickled.
+
+        Returns:
+            dict: The attributes of the computer.
         """
-        # Only set the flag if the attribute is not private
-        if not name.startswith('_') and getattr(self, name, None) != value:
-            self._has_changed = True
-        super().__setattr__(name, value)
+        state = self.__dict__.copy()
+        state['algorithm_file'] = None
+        state['connectedEdges'] = []
+        state['delays'] = []
+        state['_edge_slots'] = None
+        return state
 
     def reset_flag(self):
         """
-        Resets the `_has_changed` flag to False.
+        Forgets the recorded changes. A plain computer does not record changes.
         """
-        self._has_changed = False
 
     def has_changed(self):
         """
-        Returns whether the computer's state has changed.
+        Returns whether the computer's state has changed. A plain computer does not record changes.
         
         Returns:
-            bool: True if the state has changed, False otherwise.
+            bool: Always False.
         """
-        return self._has_changed
+        return False
     
     def getConnectedEdges(self):
         """
-        Returns the list of IDs of connected computers (edges).
+        Returns the IDs of connected computers (edges).
         
         Returns:
-            list of int: The connected edges for this computer.
+            ReadOnlyList: The connected edges for this computer.
         """
         return self.connectedEdges
     
+    def delay_to(self, dest):
+        """
+        Returns the delay of the edge to a neighbor in O(1).
+
+        Args:
+            dest (int): The ID of the neighbor.
+
+        Returns:
+            float: The delay of the edge, or None if `dest` is not a neighbor.
+        """
+        if self._edge_slots is None:
+            self._edge_slots = {neighbor: index for index, neighbor in enumerate(self.connectedEdges)}
+        index = self._edge_slots.get(dest)
+        return None if index is None else self.delays[index]
+
     def getDelays(self):
         """
         Returns the list of delays for the connected edges.
@@ -85,3 +223,65 @@ class Computer:
             list of float: The delays associated with the connected edges.
         """
         return self.delays
+
+
+class TrackedComputer(Computer):
+    """
+    A computer that records which of its public fields the algorithm changes, for the Graph display.
+
+    Every write to a public attribute is compared with the current value, and a changed field is recorded
+    with its value before the first change and its latest value.
+
+    Attributes:
+        _changes (dict): The changed field names mapped to (old value, new value). The old value of a field
+            that did not exist is MISSING.
+    """
+
+    def __init__(self):
+        """
+        Initializes a TrackedComputer object with default values for attributes and no recorded changes.
+        """
+        self._changes = {}
+        super().__init__()
+
+    def __setattr__(self, name, value):
+        """
+        Records the change of a public attribute, then sets it.
+
+        Args:
+            name (str): The name of the attribute being set.
+            value (Any): The value to set the attribute to.
+        """
+        if name[0] != '_':
+            old = self.__dict__.get(name, MISSING)
+            if old is not value and old != value:
+                changes = self._changes
+                change = changes.get(name)
+                changes[name] = (old if change is None else change[0], value)
+        object.__setattr__(self, name, value)
+
+    def reset_flag(self):
+        """
+        Forgets the recorded changes.
+        """
+        self._changes = {}
+
+    def has_changed(self):
+        """
+        Returns whether the computer's state has changed since the changes were last taken.
+
+        Returns:
+            bool: True if a field has changed, False otherwise.
+        """
+        return bool(self._changes)
+
+    def take_changes(self) -> dict:
+        """
+        Returns the recorded changes and forgets them.
+
+        Returns:
+            dict: The changed field names mapped to (old value, new value).
+        """
+        changes = self._changes
+        self._changes = {}
+        return changes
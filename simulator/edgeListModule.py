@@ -0,0 +1,240 @@
+"""
+Streaming reader of real-world edge-list graphs.
+
+An edge list (SNAP or KONECT style) has one edge per line: the labels of its two endpoints, separated by
+whitespace and possibly followed by more columns (weights, timestamps), which are ignored. Lines starting
+with '#' or '%' are comments. Files starting with the gzip magic number are decompressed on the fly.
+
+The file is read in chunks of whole lines, and every chunk is parsed into arrays of endpoint labels at
+once (integer labels with `numpy.fromstring`), so the text is never held in memory. The labels, integers or arbitrary strings, are then mapped to
+computer indices 0 .. n - 1 in label order, and every undirected edge is kept once, without self-loops;
+`Initialization.build_adjacency` adds both directions of every edge.
+"""
+
+import gzip
+import warnings
+
+import numpy as np
+
+import simulator.topologyModule as topologyModule
+
+CHUNK_BYTES = 1 << 22  # bytes of text parsed at once
+COMMENT_PREFIXES = (b'#', b'%')
+GZIP_MAGIC = b'\x1f\x8b'
+INT64 = np.iinfo(np.int64)
+WHITESPACE = np.zeros(256, dtype=bool)  # the bytes bytes.split() splits at
+WHITESPACE[list(b' \t\n\r\x0b\x0c')] = True
+
+
+def open_edge_list(path):
+    """
+    Opens an edge list file for reading, decompressing it if it is gzipped.
+
+    Args:
+        path (str): The path of the edge list file.
+
+    Returns:
+        file: The open binary file.
+
+    Raises:
+        ValueError: If the file cannot be opened.
+    """
+    try:
+        with open(path, 'rb') as f:
+            magic = f.read(2)
+        return gzip.open(path, 'rb') if magic == GZIP_MAGIC else open(path, 'rb')
+    except OSError as error:
+        raise ValueError(f"Cannot open the edge list {path}: {error}")
+
+
+def read_chunks(file, chunk_bytes=CHUNK_BYTES):
+    """
+    Reads a file in chunks that end at line boundaries.
+
+    Args:
+        file (file): The open binary file.
+        chunk_bytes (int, optional): The approximate size of a chunk. Defaults to CHUNK_BYTES.
+
+    Yields:
+        bytes: The next chunk of whole lines.
+    """
+    rest = b''
+    while True:
+        data = file.read(chunk_bytes)
+        if not data:
+            break
+        end = data.rfind(b'\n') + 1
+        if end == 0:  # no line ends in this chunk
+            rest += data
+            continue
+        yield rest + data[:end]
+        rest = data[end:]
+    if rest:
+        yield rest
+
+
+def parse_integers(data):
+    """
+    Parses whitespace-separated integers.
+
+    Args:
+        data (bytes): The text.
+
+    Returns:
+        numpy.ndarray: The integers as int64, or None if some token is not an integer or is out of range.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=np.int64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+    if len(values) and (values.max() == INT64.max or values.min() == INT64.min):  # clipped labels
+        return None
+    return values
+
+
+def uniform_columns(data) -> int:
+    """
+    Returns the number of columns of a chunk if all its non-blank lines hold the same number of columns.
+
+    Args:
+        data (bytes): The chunk.
+
+    Returns:
+        int: The number of columns, or 0 if the rows are ragged or the chunk is blank.
+    """
+    text = np.frombuffer(data, dtype=np.uint8)
+    space = WHITESPACE[text]
+    token_starts = np.flatnonzero(~space & np.concatenate(([True], space[:-1])))
+    if len(token_starts) == 0:
+        return 0
+    token_lines = np.searchsorted(np.flatnonzero(text == ord('\n')), token_starts)
+    columns = np.bincount(token_lines)
+    columns = columns[columns > 0]
+    return int(columns[0]) if (columns == columns[0]).all() else 0
+
+
+def parse_chunk(data) -> tuple:
+    """
+    Returns the endpoint labels of the edges in a chunk of whole lines.
+
+    A chunk of integer labels whose lines all hold the same number of columns is parsed at once; chunks
+    with comment lines or non-integer labels are split into tokens instead, and chunks with ragged rows
+    line by line.
+
+    Args:
+        data (bytes): The chunk.
+
+    Returns:
+        tuple: The labels of the first and of the second endpoint of every edge, as two numpy arrays of
+        int64, or of byte strings if some label is not an integer.
+
+    Raises:
+        ValueError: If a line holds a single label.
+    """
+    if not any(prefix in data for prefix in COMMENT_PREFIXES):
+        columns = uniform_columns(data)
+        values = parse_integers(data) if columns >= 2 else None
+        if values is not None:
+            values = values.reshape(-1, columns)
+            return values[:, 0].copy(), values[:, 1].copy()
+
+    lines = [line for line in data.split(b'\n') if not line.lstrip().startswith(COMMENT_PREFIXES)]
+    data = b'\n'.join(lines)
+    columns = uniform_columns(data)
+    if columns >= 2:
+        tokens = data.split()
+        return integer_labels(np.array(tokens[0::columns])), integer_labels(np.array(tokens[1::columns]))
+
+    pairs = []
+    for line in lines:
+        labels = line.split(None, 2)
+        if len(labels) == 1:
+            raise ValueError(f"Edge list line {line!r} holds a single label")
+        if labels:
+            pairs.append(labels[:2])
+    if not pairs:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pairs = np.array(pairs)
+    return integer_labels(pairs[:, 0]), integer_labels(pairs[:, 1])
+
+
+def integer_labels(labels):
+    """
+    Converts byte string labels to integers, if they all are integers.
+
+    Args:
+        labels (numpy.ndarray): The labels, as byte strings.
+
+    Returns:
+        numpy.ndarray: The labels as int64, or the byte strings if some label is not an integer.
+    """
+    try:
+        return labels.astype(np.int64)
+    except (ValueError, OverflowError):
+        return labels
+
+
+def remap_labels(labels) -> tuple:
+    """
+    Maps labels to the indices 0 .. n - 1 in label order.
+
+    Args:
+        labels (numpy.ndarray): The labels of the endpoints of the edges.
+
+    Returns:
+        tuple: The index of every label, as a numpy array, and the distinct labels in index order.
+    """
+    order = np.argsort(labels)
+    sorted_labels = labels[order]
+    new = np.ones(len(labels), dtype=bool)
+    new[1:] = sorted_labels[1:] != sorted_labels[:-1]
+    indices = np.empty(len(labels), dtype=np.int64)
+    indices[order] = np.cumsum(new) - 1
+    return indices, sorted_labels[new]
+
+
+def read_edge_list(path, chunk_bytes=CHUNK_BYTES) -> tuple:
+    """
+    Reads an edge list, maps its labels to computer indices and drops duplicate edges and self-loops.
+
+    Args:
+        path (str): The path of the edge list file, possibly gzipped.
+        chunk_bytes (int, optional): The size of the chunks the file is parsed in. Defaults to CHUNK_BYTES.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays, and the label of every
+        computer, as a numpy array of int64 or of strings.
+
+    Raises:
+        ValueError: If the file cannot be read, has a malformed line or holds no edge.
+    """
+    sources, targets = [], []
+    with open_edge_list(path) as file:
+        try:
+            for data in read_chunks(file, chunk_bytes):
+                first, second = parse_chunk(data)
+                sources.append(first)
+                targets.append(second)
+        except (OSError, EOFError) as error:
+            raise ValueError(f"Cannot read the edge list {path}: {error}")
+    if not sources or not sum(map(len, sources)):
+        raise ValueError(f"The edge list {path} holds no edge")
+
+    chunks = sources + targets
+    if any(chunk.dtype.kind == 'S' for chunk in chunks):  # some label is not an integer
+        chunks = [chunk if chunk.dtype.kind == 'S' else chunk.astype('S') for chunk in chunks]
+    labels = np.concatenate(chunks)
+    del sources, targets, chunks
+    edge_count = len(labels) // 2
+    indices, labels = remap_labels(labels)
+    if labels.dtype.kind == 'S':
+        labels = labels.astype(str)
+
+    n = len(labels)
+    first, second = indices[:edge_count], indices[edge_count:]
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    keep = low != high
+    first, second = topologyModule.pair_keys_to_edges(topologyModule.distinct_keys(low[keep] * n + high[keep]), n)
+    return first, second, labels
@@ -0,0 +1,187 @@
+"""
+Headless (batch) execution of the network simulation.
+
+This module builds and runs a simulation straight from a network variables dictionary, without going
+through the PyQt5 main menu. It never imports PyQt5 or NetworkX, so it can be used for scripted,
+large-scale Text-mode runs on machines without a display.
+"""
+
+import json
+import os
+import random
+import time
+
+import numpy as np
+
+import simulator.initializationModule as initializationModule
+import simulator.checkpointModule as checkpointModule
+import simulator.communication as communication
+import simulator.runModule as runModule
+
+NETWORK_VARIABLES = 'network_variables.json'
+ALGORITHMS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'algorithms')
+
+
+def load_network_variables(path=NETWORK_VARIABLES):
+    """
+    Load network variables from a JSON file.
+
+    Args:
+        path (str, optional): The path of the JSON file. Defaults to NETWORK_VARIABLES.
+
+    Returns:
+        dict: The loaded network variables, or an empty dictionary if the file is missing or malformed.
+    """
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def resolve_algorithm_path(algorithm_path):
+    """
+    Resolve an algorithm path, falling back to the bundled `algorithms` directory.
+
+    A path that does not exist (e.g. a path saved on another machine) or a bare algorithm name such as
+    "BFSalgorithm" is looked up by its file name in the bundled algorithms directory.
+
+    Args:
+        algorithm_path (str): The algorithm path or name.
+
+    Returns:
+        str: The resolved path, or the original value if no bundled algorithm matches.
+    """
+    if algorithm_path == 'no_alg_provided' or os.path.isfile(algorithm_path):
+        return algorithm_path
+
+    file_name = os.path.basename(algorithm_path.replace('\\', '/'))
+    if not file_name.endswith('.py'):
+        file_name += '.py'
+    bundled_path = os.path.join(ALGORITHMS_DIR, file_name)
+    if os.path.isfile(bundled_path):
+        return bundled_path
+    return algorithm_path
+
+
+def apply_overrides(network_variables: dict, overrides: dict) -> dict:
+    """
+    Returns a copy of the network variables with the given overrides applied.
+
+    Overrides whose value is None are ignored. The display is always forced to "Text", since a
+    headless run has no GUI.
+
+    Args:
+        network_variables (dict): The base network variables.
+        overrides (dict): Network variable names mapped to their new values.
+
+    Returns:
+        dict: The updated network variables.
+    """
+    result = dict(network_variables)
+    for key, value in overrides.items():
+        if value is not None:
+            result[key] = value
+    result['Display'] = 'Text'
+    result['Algorithm'] = resolve_algorithm_path(result.get('Algorithm', 'no_alg_provided'))
+    return result
+
+
+def seed_simulator(seed):
+    """
+    Seeds every random number generator used by the simulator.
+
+    Args:
+        seed (int): The seed. If None, the generators are left untouched.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+
+def create_communication(network, metrics=False):
+    """
+    Creates the communication instance of a network.
+
+    Args:
+        network (Initialization): The network.
+        metrics (bool, optional): Whether to record the metrics of the run. Defaults to False.
+
+    Returns:
+        Communication: An `InstrumentedCommunication` if metrics are recorded, a `Communication` otherwise.
+    """
+    if metrics:
+        import simulator.metricsModule as metricsModule
+        return metricsModule.InstrumentedCommunication(network)
+    return communication.Communication(network)
+
+
+def run_headless(network_variables: dict, seed=None):
+    """
+    Creates the network and runs the algorithm on it without any GUI.
+
+    If the "Metrics" network variable is set, the communication instance records the metrics of the run
+    in its `metrics` attribute.
+
+    Args:
+        network_variables (dict): The network variables (already overridden and validated).
+        seed (int, optional): Seed for the random number generators. Defaults to None.
+
+    Returns:
+        tuple: The network, the communication instance and a dictionary of timings in seconds.
+    """
+    start_time = time.time()
+    seed_simulator(seed)
+    if seed is not None:
+        network_variables = dict(network_variables, Seed=seed)  # the key of the topology cache
+
+    network = initializationModule.Initialization(network_variables)
+    if network.logging_type != "Short":
+        print(network)
+    comm = create_communication(network, network_variables.get('Metrics'))
+    net_creation_time = time.time() - start_time
+
+    runModule.initiateRun(network, comm)
+    algorithm_run_time = time.time() - start_time - net_creation_time
+
+    timings = {
+        'total': time.time() - start_time,
+        'net_creation': net_creation_time,
+        'algorithm_run': algorithm_run_time,
+    }
+    return network, comm, timings
+
+
+def resume_headless(checkpoint_path, trace_file=None, metrics=False):
+    """
+    Restores a simulation from a checkpoint and runs it to the end without any GUI.
+
+    The restored network keeps writing checkpoints to its checkpoint file. Its trace file is replaced by
+    `trace_file`, so the trace of the interrupted run is not overwritten.
+
+    Args:
+        checkpoint_path (str): The path of the checkpoint file.
+        trace_file (str, optional): The trace file of the resumed part of the run. Defaults to None.
+        metrics (bool, optional): Whether to record the metrics of the resumed part of the run. Defaults to False.
+
+    Returns:
+        tuple: The network, the communication instance and a dictionary of timings in seconds.
+
+    Raises:
+        ValueError: If the file is not a checkpoint.
+    """
+    start_time = time.time()
+    network = checkpointModule.load_checkpoint(checkpoint_path)
+    network.trace_file = trace_file
+    comm = create_communication(network, metrics)
+    net_creation_time = time.time() - start_time
+
+    runModule.initiateRun(network, comm, resumed=True)
+    algorithm_run_time = time.time() - start_time - net_creation_time
+
+    timings = {
+        'total': time.time() - start_time,
+        'net_creation': net_creation_time,
+        'algorithm_run': algorithm_run_time,
+    }
+    return network, comm, timings
@@ -2,7 +2,7 @@
 Network Initialization and Topology Creation for Distributed Networks.
 
 This module contains classes and functions used to initialize and configure a simulated network
-using different topologies (Tree, Star, Line, Clique, etc.). The module also handles network algorithms,
+using different topologies (Tree, Star, Line, Clique, etc., and the model topologies of `topologyModule`). The module also handles network algorithms,
 computer ID assignments, and delay creation for network edges.
 """
 import importlib
@@ -10,120 +10,592 @@ import json
 import os
 import random
 import sys
+import time
 
 import numpy as np
-from simulator.computer import Computer
+from simulator.computer import Computer, ReadOnlyList, TrackedComputer
+import simulator.changeLogModule as changeLogModule
+import simulator.edgeListModule as edgeListModule
+import simulator.nodeStoreModule as nodeStoreModule
+import simulator.replayModule as replayModule
+import simulator.topologyModule as topologyModule
+import simulator.topologyCacheModule as topologyCacheModule
+from simulator.changeLogModule import ChangeLog
+from simulator.message import Message, Multicast
+from simulator.topologyModule import UnionFind  # re-exported: UnionFind used to be defined in this module
 import heapq
 import math
+from collections import deque
+from functools import partial
+from itertools import repeat
 
-class UnionFind:
+class CustomMinHeap:
     """
-    A class to represent the Union-Find (Disjoint Set) data structure.
+    A class to represent a custom min-heap for managing messages.
     
     Attributes:
-        parent (list): The parent pointers for each node.
-        rank (list): The rank of each tree (used for union by rank).
+        heap (list): A list of `Message` and `Multicast` records used to represent the heap.
+        pending (deque): The messages of the last popped multicast that were not popped yet.
+        counter (int): A counter used to ensure unique priorities in the heap.
     """
 
-    def __init__(self, size):
+    def __init__(self):
+        """
+        Initializes the custom min-heap.
         """
-        Initializes the Union-Find structure with a given size.
+        self.heap = []
+        self.pending = deque()
+        self.counter = 0  # unique sequence count
+        
+    def push(self, arrival_time, source_id, dest_id, content):
+        """
+        Pushes a message onto the heap.
         
         Args:
-            size (int): Number of elements (nodes).
+            arrival_time (float): The time at which the message arrives.
+            source_id (int): The ID of the source computer.
+            dest_id (int): The ID of the destination computer.
+            content (str): The content of the message.
         """
-        self.parent = list(range(size))
-        self.rank = [1] * size
+        heapq.heappush(self.heap, Message(arrival_time, self.counter, source_id, dest_id, content))
+        self.counter += 1
 
-    def find(self, node):
+    def push_many(self, arrival_times, source_id, dest_ids, content):
         """
-        Finds the root of the node with path compression.
-        
+        Pushes the messages of a fan-out onto the heap, in destination order.
+
+        When the fan-out is larger than the heap, the messages are appended and the heap is rebuilt in
+        linear time instead of being pushed one by one.
+
         Args:
-            node (int): The node to find the root of.
-            
+            arrival_times (list): The arrival time of every message.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        messages = map(Message._make, zip(arrival_times, range(self.counter, self.counter + len(dest_ids)),
+                                          repeat(source_id), dest_ids, repeat(content)))
+        self.counter += len(dest_ids)
+        if len(dest_ids) > len(self.heap):
+            self.heap.extend(messages)
+            heapq.heapify(self.heap)
+        else:
+            for message in messages:
+                heapq.heappush(self.heap, message)
+
+    def push_multicast(self, arrival_time, source_id, dest_ids, content):
+        """
+        Pushes a single multicast entry for a fan-out whose messages share an arrival time.
+
+        Args:
+            arrival_time (float): The time at which the messages arrive.
+            source_id (int): The ID of the source computer.
+            dest_ids (Sequence): The ID of every destination computer, an immutable sequence kept until the
+                multicast is popped.
+            content (str): The content shared by the messages.
+        """
+        heapq.heappush(self.heap, Multicast(arrival_time, self.counter, source_id, dest_ids, content))
+        self.counter += len(dest_ids)
+        
+    def pop(self) -> Message:
+        """
+        Pops the message with the smallest arrival time from the heap.
+
+        A popped multicast is expanded, and its remaining messages are popped next.
+        
+        Returns:
+            Message: The message with the smallest arrival time.
+        """
+        if self.pending:
+            return self.pending.popleft()
+        entry = heapq.heappop(self.heap)
+        if type(entry) is Multicast:
+            self.pending.extend(entry.expand())
+            return self.pending.popleft()
+        return entry
+
+    def pop_round(self) -> list:
+        """
+        Pops every message that has the smallest arrival time.
+
+        Returns:
+            list: The messages with the smallest arrival time, in counter order.
+        """
+        heap = self.heap
+        messages = list(self.pending)
+        self.pending.clear()
+        arrival_time = messages[0].arrival_time if messages else heap[0].arrival_time
+        while heap and heap[0].arrival_time == arrival_time:
+            entry = heapq.heappop(heap)
+            if type(entry) is Multicast:
+                messages.extend(entry.expand())
+            else:
+                messages.append(entry)
+        return messages
+        
+    def empty(self) -> bool: 
+        """
+        Checks whether the heap is empty.
+        
         Returns:
-            int: The root of the node.
+            bool: True if the heap is empty, False otherwise.
         """
-        if self.parent[node] != node:
-            self.parent[node] = self.find(self.parent[node])  # Path compression
-        return self.parent[node]
+        return not self.heap and not self.pending
 
-    def union(self, node1, node2):
+    def size(self) -> int:
         """
-        Unites two sets by connecting the roots of the two nodes.
+        Returns the size of the heap.
         
+        Returns:
+            int: The number of entries in the heap, a multicast counting as one.
+        """
+        return len(self.heap) + len(self.pending)
+
+
+class CalendarQueue:
+    """
+    A bucketed calendar queue for managing messages with few distinct arrival times.
+
+    Messages are kept in one FIFO bucket per arrival time, and a small heap holds the distinct arrival times.
+    With constant delays every arrival time is an integer and only a handful of buckets are alive at once,
+    so push and pop are O(1). Messages in a bucket are appended in counter order, which gives the same
+    tie-breaking as `CustomMinHeap`.
+
+    Attributes:
+        buckets (dict): A dictionary mapping each arrival time to a deque of `Message` and `Multicast` records.
+        times (list): A heap of the arrival times that have a bucket.
+        counter (int): A counter used to ensure unique priorities in the queue.
+        length (int): The number of entries in the queue, a multicast counting as one.
+    """
+
+    def __init__(self):
+        """
+        Initializes the calendar queue.
+        """
+        self.buckets = {}
+        self.times = []
+        self.counter = 0  # unique sequence count
+        self.length = 0
+
+    def push(self, arrival_time, source_id, dest_id, content):
+        """
+        Pushes a message into the bucket of its arrival time.
+
         Args:
-            node1 (int): First node.
-            node2 (int): Second node.
-        """
-        root1 = self.find(node1)
-        root2 = self.find(node2)
-
-        if root1 != root2:
-            # Union by rank
-            if self.rank[root1] > self.rank[root2]:
-                self.parent[root2] = root1
-            elif self.rank[root1] < self.rank[root2]:
-                self.parent[root1] = root2
+            arrival_time (float): The time at which the message arrives.
+            source_id (int): The ID of the source computer.
+            dest_id (int): The ID of the destination computer.
+            content (str): The content of the message.
+        """
+        bucket = self.buckets.get(arrival_time)
+        if bucket is None:
+            bucket = self.buckets[arrival_time] = deque()
+            heapq.heappush(self.times, arrival_time)
+        bucket.append(Message(arrival_time, self.counter, source_id, dest_id, content))
+        self.counter += 1
+        self.length += 1
+
+    def push_many(self, arrival_times, source_id, dest_ids, content):
+        """
+        Pushes the messages of a fan-out, looking a bucket up only when the arrival time changes.
+
+        Args:
+            arrival_times (list): The arrival time of every message.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        bucket_time = None
+        bucket = None
+        for message in map(Message._make, zip(arrival_times, range(self.counter, self.counter + len(dest_ids)),
+                                              repeat(source_id), dest_ids, repeat(content))):
+            if message.arrival_time != bucket_time:
+                bucket_time = message.arrival_time
+                bucket = self.buckets.get(bucket_time)
+                if bucket is None:
+                    bucket = self.buckets[bucket_time] = deque()
+                    heapq.heappush(self.times, bucket_time)
+            bucket.append(message)
+        self.counter += len(dest_ids)
+        self.length += len(dest_ids)
+
+    def push_multicast(self, arrival_time, source_id, dest_ids, content):
+        """
+        Pushes a single multicast entry for a fan-out whose messages share an arrival time.
+
+        Args:
+            arrival_time (float): The time at which the messages arrive.
+            source_id (int): The ID of the source computer.
+            dest_ids (Sequence): The ID of every destination computer, an immutable sequence kept until the
+                multicast is popped.
+            content (str): The content shared by the messages.
+        """
+        bucket = self.buckets.get(arrival_time)
+        if bucket is None:
+            bucket = self.buckets[arrival_time] = deque()
+            heapq.heappush(self.times, arrival_time)
+        bucket.append(Multicast(arrival_time, self.counter, source_id, dest_ids, content))
+        self.counter += len(dest_ids)
+        self.length += 1
+
+    def pop(self) -> Message:
+        """
+        Pops the oldest message of the earliest bucket.
+
+        A popped multicast is expanded in place at the front of its bucket.
+
+        Returns:
+            Message: The message with the smallest arrival time.
+        """
+        if not self.times:
+            raise IndexError("pop from an empty queue")
+        arrival_time = self.times[0]
+        bucket = self.buckets[arrival_time]
+        message = bucket.popleft()
+        if type(message) is Multicast:
+            messages = message.expand()
+            message = messages[0]
+            bucket.extendleft(reversed(messages[1:]))
+            self.length += len(messages) - 1
+        if not bucket:
+            del self.buckets[arrival_time]
+            heapq.heappop(self.times)
+        self.length -= 1
+        return message
+
+    def pop_round(self):
+        """
+        Pops the whole bucket of the earliest arrival time.
+
+        Returns:
+            list: The messages with the smallest arrival time, in counter order.
+        """
+        arrival_time = heapq.heappop(self.times)
+        bucket = self.buckets.pop(arrival_time)
+        self.length -= len(bucket)
+        messages = []
+        for entry in bucket:
+            if type(entry) is Multicast:
+                messages.extend(entry.expand())
             else:
-                self.parent[root2] = root1
-                self.rank[root1] += 1
+                messages.append(entry)
+        return messages
 
+    def empty(self) -> bool:
+        """
+        Checks whether the queue is empty.
 
-class CustomMinHeap:
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self.length == 0
+
+    def size(self) -> int:
+        """
+        Returns the size of the queue.
+
+        Returns:
+            int: The number of entries in the queue, a multicast counting as one.
+        """
+        return self.length
+
+
+class LadderRung:
     """
-    A class to represent a custom min-heap for managing messages.
-    
+    A single rung of a `LadderQueue`: equal-width buckets covering a time range.
+
     Attributes:
-        heap (list): A list used to represent the heap.
-        counter (int): A counter used to ensure unique priorities in the heap.
+        start (float): The time at which the first bucket starts.
+        width (float): The width of each bucket.
+        buckets (list): A list of unsorted lists of `Message` and `Multicast` records.
+        current (int): The index of the first bucket that has not been consumed yet.
     """
 
+    __slots__ = ('start', 'width', 'buckets', 'current')
+
+    def __init__(self, start, width, bucket_count):
+        """
+        Initializes an empty rung.
+
+        Args:
+            start (float): The time at which the first bucket starts.
+            width (float): The width of each bucket.
+            bucket_count (int): The number of buckets.
+        """
+        self.start = start
+        self.width = width
+        self.buckets = [[] for _ in range(bucket_count)]
+        self.current = 0
+
+    def bucket_index(self, arrival_time) -> int:
+        """
+        Returns the index of the bucket covering the given time, clamped to the last bucket.
+
+        Args:
+            arrival_time (float): The time to look up.
+
+        Returns:
+            int: The bucket index.
+        """
+        return min(int((arrival_time - self.start) / self.width), len(self.buckets) - 1)
+
+    def next_bucket(self):
+        """
+        Consumes and returns the next non-empty bucket.
+
+        Returns:
+            list: The bucket's messages, or None if the rung is exhausted.
+        """
+        while self.current < len(self.buckets):
+            bucket = self.buckets[self.current]
+            self.buckets[self.current] = None
+            self.current += 1
+            if bucket:
+                return bucket
+        return None
+
+
+class LadderQueue:
+    """
+    A ladder queue for managing messages with many distinct (random) arrival times.
+
+    New messages are appended unsorted to `top`. When the queue runs dry, `top` is spread over a rung of
+    buckets; an over-full bucket is spread again over a finer rung, and a small bucket is sorted into
+    `bottom`, a heap from which messages are popped. Most messages are therefore only appended to a list
+    and sorted in small batches, giving amortized O(1) operations with millions of pending messages.
+    Messages are ordered by `(arrival_time, counter)` exactly as in `CustomMinHeap`.
+
+    Attributes:
+        top (list): Unsorted entries at or after `top_start`.
+        top_start (float): The time from which entries go to `top`.
+        rungs (list): The `LadderRung` objects, from the coarsest to the finest.
+        bottom (list): A heap of the entries that will be popped next.
+        pending (deque): The messages of the last popped multicast that were not popped yet.
+        counter (int): A counter used to ensure unique priorities in the queue.
+        length (int): The number of entries in the queue, a multicast counting as one.
+    """
+
+    BUCKET_THRESHOLD = 50  # buckets larger than this are spread over a new rung
+    MAX_RUNGS = 8
+
     def __init__(self):
         """
-        Initializes the custom min-heap.
+        Initializes the ladder queue.
         """
-        self.heap = []
+        self.top = []
+        self.top_start = -math.inf
+        self.rungs = []
+        self.bottom = []
+        self.pending = deque()
         self.counter = 0  # unique sequence count
-        
-    def push(self, message_format):
+        self.length = 0
+
+    def push(self, arrival_time, source_id, dest_id, content):
         """
-        Pushes a message onto the heap.
-        
+        Pushes a message into the top, a rung or the bottom, depending on its arrival time.
+
         Args:
-            message_format (dict): The message format containing arrival time.
+            arrival_time (float): The time at which the message arrives.
+            source_id (int): The ID of the source computer.
+            dest_id (int): The ID of the destination computer.
+            content (str): The content of the message.
         """
-        heapq.heappush(self.heap, (message_format['arrival_time'], self.counter, message_format))
+        self.insert(Message(arrival_time, self.counter, source_id, dest_id, content))
         self.counter += 1
-        
-    def pop(self) -> dict:
+
+    def push_multicast(self, arrival_time, source_id, dest_ids, content):
         """
-        Pops the message with the smallest arrival time from the heap.
-        
+        Pushes a single multicast entry for a fan-out whose messages share an arrival time.
+
+        Args:
+            arrival_time (float): The time at which the messages arrive.
+            source_id (int): The ID of the source computer.
+            dest_ids (Sequence): The ID of every destination computer, an immutable sequence kept until the
+                multicast is popped.
+            content (str): The content shared by the messages.
+        """
+        self.insert(Multicast(arrival_time, self.counter, source_id, dest_ids, content))
+        self.counter += len(dest_ids)
+
+    def insert(self, message):
+        """
+        Inserts an entry into the top, a rung or the bottom, depending on its arrival time.
+
+        Args:
+            message (Message or Multicast): The entry to insert.
+        """
+        arrival_time = message.arrival_time
+        self.length += 1
+
+        if arrival_time >= self.top_start:
+            self.top.append(message)
+            return
+        for rung in self.rungs:
+            index = int((arrival_time - rung.start) / rung.width)
+            if index >= rung.current:
+                buckets = rung.buckets
+                buckets[index if index < len(buckets) else -1].append(message)
+                return
+        heapq.heappush(self.bottom, message)
+
+    def push_many(self, arrival_times, source_id, dest_ids, content):
+        """
+        Pushes the messages of a fan-out, in destination order.
+
+        Args:
+            arrival_times (list): The arrival time of every message.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        for arrival_time, dest_id in zip(arrival_times, dest_ids):
+            self.push(arrival_time, source_id, dest_id, content)
+
+    def pop(self) -> Message:
+        """
+        Pops the message with the smallest arrival time.
+
+        A popped multicast is expanded, and its remaining messages are popped next.
+
         Returns:
-            dict: The message with the smallest arrival time.
+            Message: The message with the smallest arrival time.
         """
-        priority, priority2, message_format = heapq.heappop(self.heap)
-        return message_format
-        
-    def empty(self) -> bool: 
+        self.length -= 1
+        if self.pending:
+            return self.pending.popleft()
+        if not self.bottom:
+            self.refill_bottom()
+        entry = heapq.heappop(self.bottom)
+        if type(entry) is Multicast:
+            self.pending.extend(entry.expand())
+            self.length += len(self.pending)
+            return self.pop()
+        return entry
+
+    def pop_round(self) -> list:
         """
-        Checks whether the heap is empty.
-        
+        Pops every message that has the smallest arrival time.
+
+        Messages with the same arrival time may be split between the bottom and the top, so this pops one
+        message at a time.
+
         Returns:
-            bool: True if the heap is empty, False otherwise.
+            list: The messages with the smallest arrival time, in counter order.
+        """
+        messages = [self.pop()]
+        arrival_time = messages[0].arrival_time
+        while self.length:
+            if self.pending:
+                messages.append(self.pop())
+                continue
+            if not self.bottom:
+                self.refill_bottom()
+            if self.bottom[0].arrival_time != arrival_time:
+                break
+            messages.append(self.pop())
+        return messages
+
+    def refill_bottom(self):
+        """
+        Refills the bottom from the finest non-empty rung, or from the top if all rungs are exhausted.
+        """
+        while not self.bottom:
+            if self.rungs:
+                bucket = self.rungs[-1].next_bucket()
+                if bucket is None:
+                    self.rungs.pop()
+                    continue
+                self.spread(bucket)
+            else:
+                if not self.top:
+                    raise IndexError("pop from an empty queue")
+                messages, self.top = self.top, []
+                self.top_start = max(message.arrival_time for message in messages)
+                self.spread(messages)
+
+    def spread(self, messages):
+        """
+        Spreads messages over a new rung, or sorts them into the bottom if there are few of them.
+
+        Args:
+            messages (list): The messages to spread.
+        """
+        low = min(message.arrival_time for message in messages)
+        high = max(message.arrival_time for message in messages)
+        if len(messages) <= self.BUCKET_THRESHOLD or low == high or len(self.rungs) >= self.MAX_RUNGS:
+            messages.sort()
+            self.bottom = messages  # a sorted list is a valid heap
+            return
+
+        rung = LadderRung(low, (high - low) / len(messages), len(messages))
+        for message in messages:
+            rung.buckets[rung.bucket_index(message.arrival_time)].append(message)
+        self.rungs.append(rung)
+
+    def empty(self) -> bool:
+        """
+        Checks whether the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
         """
-        return len(self.heap) == 0
+        return self.length == 0
 
     def size(self) -> int:
         """
-        Returns the size of the heap.
-        
+        Returns the size of the queue.
+
         Returns:
-            int: The number of elements in the heap.
+            int: The number of entries in the queue, a multicast counting as one.
         """
-        return len(self.heap)
+        return self.length
+
+
+MESSAGE_QUEUES = {
+    "Heap": CustomMinHeap,
+    "Calendar": CalendarQueue,
+    "Ladder": LadderQueue,
+}
+
+
+def create_message_queue(queue_type="Auto", delay_type="Random"):
+    """
+    Creates the message queue backend.
+
+    With "Auto", a `CalendarQueue` is used for constant (integer) delays and a `CustomMinHeap` for random
+    delays; in CPython the C-implemented heap is faster than `LadderQueue` for random delays (see
+    benchmarks/queue_benchmark.py).
+
+    Args:
+        queue_type (str, optional): "Auto", "Heap", "Calendar" or "Ladder". Defaults to "Auto".
+        delay_type (str, optional): The network's delay type, used by "Auto". Defaults to "Random".
+
+    Returns:
+        The message queue.
+    """
+    if queue_type == "Auto":
+        queue_type = "Calendar" if delay_type == "Constant" else "Heap"
+    return MESSAGE_QUEUES[queue_type]()
+
+
+def import_algorithm_module(algorithm_module_path):
+    """
+    Imports an algorithm module from its file path.
+
+    Args:
+        algorithm_module_path (str): The file path to the algorithm module.
+
+    Returns:
+        module: The imported algorithm module, or None if it could not be imported.
+    """
+    directory, file_name = os.path.split(algorithm_module_path)
+    base_file_name, _ = os.path.splitext(file_name)
+    try:
+        sys.path.insert(0,directory)
+        return importlib.import_module(base_file_name)
+    except ImportError:
+        print(f"Error: Unable to import {base_file_name}.py")
+        return None
 
 
 class Initialization:
@@ -132,11 +604,27 @@ class Initialization:
 
     Attributes:
         network_variables (dict): The dictionary containing network configuration data.
-        connected_computers (list): A list of Computer objects representing network nodes.
-        message_queue (CustomMinHeap): A custom min-heap for message management.
-        node_values_change (list): A list for tracking changes in node values for display.
-        edges_delays (dict): A dictionary of delays associated with network edges.
-        network_dict (dict): A dictionary mapping computer IDs to Computer objects.
+        connected_computers (list): A list of Computer objects representing network nodes, or a `ComputerList`
+            of views with the Columnar node store.
+        node_store (NodeStore): The columns of the computers' fields with the Columnar node store, None otherwise.
+        message_queue: The message queue backend (`CustomMinHeap`, `CalendarQueue` or `LadderQueue`) of `Message` records.
+        node_values_change (ChangeLog): The (computer ID, {field: (old value, new value)}) changes of the computers,
+            in event order, for the Graph display, or a `ChangeTraceWriter` recording them if there is a change trace file.
+        edges_delays (numpy.ndarray): The delay of every edge slot, aligned with the adjacency.
+        adjacency_offsets (numpy.ndarray): Computer i's edge slots are adjacency_offsets[i] .. adjacency_offsets[i + 1] - 1.
+        adjacency (numpy.ndarray): The index of the neighbor of every edge slot (CSR adjacency), sorted within every computer.
+        neighbor_ids (numpy.ndarray): The ID of the neighbor of every edge slot, viewed by the computers' `connectedEdges`.
+        computer_ids (numpy.ndarray): The ID of every computer, in network order.
+        node_labels (numpy.ndarray): The edge list label of every computer of the File topology, in network
+            order, or None for the other topologies.
+        computer_index (dict): A dictionary mapping computer IDs to their index in `connected_computers`.
+        network_dict (dict): A dictionary mapping computer IDs to Computer objects, or a `ComputerDict` of views
+            with the Columnar node store.
+        current_time (float): The simulated time, i.e. the arrival time of the last delivered message.
+        timings (dict): The duration in seconds of every construction phase: 'file_read' for the File topology,
+            'ids', 'topology', 'algorithm_load' and 'delays', then 'cache_save' if the network is saved to the
+            topology cache; or only 'cache_load' and 'algorithm_load' if it is loaded from the cache, without
+            reading the edge list of a File topology.
     """
 
     def __init__(self, network_variables):
@@ -147,26 +635,110 @@ class Initialization:
             network_variables (dict): The network configuration dictionary.
         """
         self.update_network_variables(network_variables)
-        self.connected_computers = [Computer() for _ in range(self.computer_number)]
-        self.message_queue = CustomMinHeap()
-        self.node_values_change = [] # for graph display
-        self.edges_delays = {} # holds the delays of each edge in the network
+        self.timings = {}
+        self.node_labels = self.file_edges = None
 
-        self.create_computer_ids()
-        
-        self.network_dict = {}
-        for comp in self.connected_computers:
-            self.network_dict[comp.id] = comp
-        self.root_selection()
+        # a seeded network is determined by its configuration, so it can come from the topology cache
+        cache_key = cache_path = cache_entry = None
+        if self.topology_cache and self.seed is not None:
+            cache_key = topologyCacheModule.cache_key(self)
+        if cache_key is not None:
+            cache_path = topologyCacheModule.entry_path(self.topology_cache, cache_key)
+            cache_entry = topologyCacheModule.open_entry(cache_path, cache_key)
 
-        self.create_connected_computers()
-        self.load_algorithms(self.algorithm_path)
-        #self.delays_creation() # used for creating delays for edges, not used in current version     
+        if cache_entry is not None: # the entry sets the number of computers
+            self.computer_number = len(cache_entry['arrays']['computer_ids'])
+        elif self.topologyType == "File": # the edge list sets the number of computers
+            phase_start = time.perf_counter()
+            self.read_topology_file()
+            self.record_phase('file_read', phase_start)
+        self.create_computers()
+        self.message_queue = create_message_queue(self.queue_type, self.delay_type)
+        self.node_values_change = ChangeLog(self.change_log_records) # for graph display
+        self.edges_delays = None # holds the delays of each edge in the network, aligned with the adjacency
+        self.current_time = 0 # arrival time of the last delivered message
+
+        phase_start = time.perf_counter()
+        if cache_entry is not None:
+            topologyCacheModule.load_topology(cache_entry, self)
+            phase_start = self.record_phase('cache_load', phase_start)
+            self.load_algorithms(self.algorithm_path)
+            self.record_phase('algorithm_load', phase_start)
+        else:
+            self.create_computer_ids()
+            self.root_selection()
+            phase_start = self.record_phase('ids', phase_start)
+
+            self.create_connected_computers()
+            phase_start = self.record_phase('topology', phase_start)
+            self.load_algorithms(self.algorithm_path)
+            phase_start = self.record_phase('algorithm_load', phase_start)
+            self.delays_creation()
+            phase_start = self.record_phase('delays', phase_start)
+            if cache_path:
+                topologyCacheModule.save_topology(cache_path, self, cache_key)
+                self.record_phase('cache_save', phase_start)
         
-        for comp in self.connected_computers: # resets the changed flag
-            comp.reset_flag()
+        if self.track_changes:
+            for comp in self.connected_computers: # forgets the changes made while building the network
+                comp.reset_flag()
+        if self.change_trace_file:
+            self.node_values_change = replayModule.ChangeTraceWriter(self.change_trace_file, self)
         
     
+    def __getstate__(self):
+        """
+        Returns the picklable state of the network, used by checkpoints.
+
+        A resumed network does not record a change trace, since the trace file already holds the changes made
+        after the checkpoint.
+
+        Returns:
+            dict: The attributes of the network, with the change log as a list.
+        """
+        state = self.__dict__.copy()
+        if self.change_trace_file:
+            state['node_values_change'] = []
+            state['change_trace_file'] = None
+            state['track_changes'] = self.display_type == "Graph"
+        else:
+            state['node_values_change'] = list(self.node_values_change)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the network from a checkpoint: rebuilds the change log, reloads the algorithm module and
+        gives the computers back their adjacency and delay views.
+
+        Args:
+            state (dict): The state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self.node_values_change = ChangeLog(self.change_log_records)
+        for change in state['node_values_change']:
+            self.node_values_change.append(change)
+        self.load_algorithms(self.algorithm_path)
+        self.attach_adjacency_views()
+        self.attach_delay_views()
+        if self.track_changes:
+            for comp in self.connected_computers: # the views are not changes made by the algorithm
+                comp.reset_flag()
+
+    def record_phase(self, phase, phase_start) -> float:
+        """
+        Records the duration of a construction phase.
+
+        Args:
+            phase (str): The name of the phase.
+            phase_start (float): The `time.perf_counter()` value at which the phase started.
+
+        Returns:
+            float: The `time.perf_counter()` value at which the phase ended.
+        """
+        now = time.perf_counter()
+        self.timings[phase] = now - phase_start
+        return now
+
     def update_network_variables(self, network_variables_data):
         """
         Updates network parameters from the given configuration dictionary.
@@ -182,6 +754,23 @@ class Initialization:
         self.delay_type = network_variables_data.get('Delay', 'Random')
         self.algorithm_path = network_variables_data.get('Algorithm', 'no_alg_provided')
         self.logging_type = network_variables_data.get('Logging', 'Short')
+        self.queue_type = network_variables_data.get('Queue', 'Auto')
+        self.engine_type = network_variables_data.get('Engine', 'Event')
+        self.partitions = int(network_variables_data.get('Partitions', 2))
+        self.delay_floor = float(network_variables_data.get('Delay Floor', 0))
+        self.trace_file = network_variables_data.get('Trace File')
+        self.trace_writer = network_variables_data.get('Trace Writer', 'Block')
+        self.change_log_records = int(network_variables_data.get('Change Log Records', changeLogModule.MEMORY_RECORDS))
+        self.checkpoint_file = network_variables_data.get('Checkpoint File')
+        self.checkpoint_every = int(network_variables_data.get('Checkpoint Every', 100000))
+        self.change_trace_file = network_variables_data.get('Change Trace')
+        self.degree = network_variables_data.get('Degree') # None: the topology's default degree
+        self.rewiring = float(network_variables_data.get('Rewiring', topologyModule.REWIRING))
+        self.topology_file = network_variables_data.get('Topology File') # edge list of the File topology
+        self.topology_cache = network_variables_data.get('Topology Cache') # directory of the topology cache
+        self.seed = network_variables_data.get('Seed') # the seed of the run, if the generators were just seeded with it
+        self.node_store_type = network_variables_data.get('Node Store', 'Objects')
+        self.track_changes = self.display_type == "Graph" or bool(self.change_trace_file)  # only then are changes recorded
     
     def __str__(self) -> list:
         """
@@ -198,6 +787,8 @@ class Initialization:
         f"Root Type: {self.root_type}",
         f"Algorithm Path: {self.algorithm_path}",
         f"Logging Type: {self.logging_type}",
+        f"Queue Type: {self.queue_type}",
+        f"Engine Type: {self.engine_type}",
         ]
             
         result.append("\nComputers:")
@@ -205,43 +796,140 @@ class Initialization:
         
         return "\n".join(result)
             
-    # used for creating delays for edges, not used in current version     
-    """ def delays_creation(self):
+    def delays_creation(self):
+        """
+        Precomputes the delay of every edge into `edges_delays`, a flat array aligned with the adjacency.
+
+        The delays of computer i's edges are `edges_delays[adjacency_offsets[i]:adjacency_offsets[i + 1]]`,
+        in the order of its `connectedEdges`, and every computer gets a zero-copy `delays` view of them.
+        Both directions of an edge share the same delay. The delays are float64, except the Constant delays,
+        which are int64.
+        """
         delay_functions = {
         "Random": self.random_delay,
         "Constant": self.constant_delay,
+        "Exponential": self.exponential_delay,
+        "Distance": self.distance_delay,
         }
-        id_function = delay_functions[self.delay_type]
-        id_function()
-            
-    # Creates random delay for every edge
-    def random_delay(self):
-        for comp in self.connected_computers:
-            comp.delays = [None] * len(comp.connectedEdges)
-            for i, connected in enumerate(comp.connectedEdges):
-                edge_tuple = (comp.id, connected) if comp.id < connected else (connected, comp.id) # unique representation of the edge as a tuple
-                
-                if edge_tuple not in self.edges_delays: # if not already in edgesDelays, generate a random delay, and insert into edgesDelays
-                    random_num = random.random()
-                    self.edges_delays[edge_tuple] = random_num
-                
-                comp.delays[i] = self.edges_delays[edge_tuple]
-                
-    # Creates constant delay for every edge
-    def constant_delay(self):
-        for comp in self.connected_computers:
-            comp.delays = [None] * len(comp.connectedEdges)
-            for i, connected in enumerate(comp.connectedEdges):
-                edge_tuple = (comp.id, connected) if comp.id < connected else (connected, comp.id) # unique representation of the edge as a tuple
-                
-                if edge_tuple not in self.edges_delays: # if not already in edgesDelays, generate a delay of 1 and insert into edgesDelays
-                    self.edges_delays[edge_tuple] =1
-                
-                comp.delays[i] = self.edges_delays[edge_tuple] """
+        delay_function = delay_functions[self.delay_type]
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        sources = np.repeat(np.arange(self.computer_number, dtype=np.int64), np.diff(self.adjacency_offsets))
+        targets = self.adjacency
+        # the slots from the smaller index hold every edge once, in (smaller, larger) order; the slots from the
+        # larger index list the same edges ordered by (larger, smaller), so both directions share the delay
+        forward = sources < targets
+        edge_delays = delay_function(sources[forward], targets[forward])
+        self.edges_delays = np.empty(len(targets), dtype=edge_delays.dtype)
+        self.edges_delays[forward] = edge_delays
+        self.edges_delays[~forward] = edge_delays[np.argsort(targets[forward], kind='stable')]
+        self.attach_delay_views()
+
+    def create_computers(self):
+        """
+        Creates the computers: a `Computer` object per computer, or with the Columnar node store, a
+        `NodeStore` holding their fields and the views standing in for them.
+
+        Raises:
+            ValueError: If the Columnar node store is used with the Graph display or a change trace.
+        """
+        if self.node_store_type == "Columnar":
+            if self.track_changes:
+                raise ValueError("The Columnar node store does not record node changes: it only supports the Text display, without a change trace")
+            self.node_store = nodeStoreModule.NodeStore(self.computer_number)
+            self.connected_computers = nodeStoreModule.ComputerList(self.node_store)
+            return
+        self.node_store = None
+        computer_class = TrackedComputer if self.track_changes else Computer
+        self.connected_computers = [computer_class() for _ in range(self.computer_number)]
+
+    def attach_adjacency_views(self):
+        """
+        Gives every computer its zero-copy, read-only `connectedEdges` view of `neighbor_ids`.
+        """
+        if self.node_store is not None: # the views slice it on access
+            self.node_store.attach_adjacency(self.adjacency_offsets, self.adjacency, self.neighbor_ids)
+            return
+        neighbors_view = memoryview(self.neighbor_ids).toreadonly()
+        for index, comp in enumerate(self.connected_computers):
+            comp.connectedEdges = ReadOnlyList(neighbors_view[self.adjacency_offsets[index]:self.adjacency_offsets[index + 1]])
+
+    def attach_delay_views(self):
+        """
+        Gives every computer its zero-copy, read-only `delays` view of `edges_delays`.
+        """
+        if self.node_store is not None: # the views slice it on access
+            self.node_store.attach_delays(self.edges_delays)
+            return
+        delays_view = memoryview(self.edges_delays).toreadonly()
+        for index, comp in enumerate(self.connected_computers):
+            comp.delays = ReadOnlyList(delays_view[self.adjacency_offsets[index]:self.adjacency_offsets[index + 1]])
+
+    def random_delay(self, first, second):
+        """
+        Uniform delays in [delay floor, 1).
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: The delay of every edge.
+        """
+        return self.delay_floor + (1 - self.delay_floor) * self.rng.random(len(first))
+
+    def constant_delay(self, first, second):
+        """
+        A delay of 1 on every edge, kept as an int so that arrival times stay integers, as they are logged.
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: The delay of every edge, as int64.
+        """
+        return np.ones(len(first), dtype=np.int64)
+
+    def exponential_delay(self, first, second):
+        """
+        Exponential delays above the delay floor, with the same mean as the uniform delays.
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: The delay of every edge.
+        """
+        return self.delay_floor + self.rng.exponential((1 - self.delay_floor) / 2, len(first))
+
+    def distance_delay(self, first, second):
+        """
+        Delays proportional to the distance between the endpoints, placed at random in the unit square.
+
+        The delays lie in [delay floor, 1]; the positions are kept in `positions`.
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+
+        Returns:
+            numpy.ndarray: The delay of every edge.
+        """
+        self.positions = self.rng.random((self.computer_number, 2))
+        distances = np.linalg.norm(self.positions[first] - self.positions[second], axis=1)
+        return self.delay_floor + (1 - self.delay_floor) * distances / math.sqrt(2)
 
     def create_connected_computers(self):
         """
         Creates the network topology based on the specified topology type and configuration.
+
+        The topology function returns the edges of a connected topology as arrays of computer indices,
+        which are stored as a CSR adjacency, in a single pass.
+
+        Raises:
+            ValueError: If the parameters of a model topology are invalid.
         """
         topology_functions = {
             "Random": self.create_random_topology,
@@ -249,80 +937,164 @@ class Initialization:
             "Clique": self.create_clique_topology,
             "Tree": self.create_tree_topology,
             "Star": self.create_star_topology,
+            "File": self.create_file_topology,
             }
+        for topology in topologyModule.TOPOLOGIES:
+            topology_functions[topology] = partial(self.create_model_topology, topology)
         
         topology_function = topology_functions[self.topologyType]
-        
-        # check network connectivity
-        connected = False
-        while not connected:
-            topology_function()
-            connected = self.is_connected()
+        self.build_adjacency(*topology_function()) # every topology is connected by construction
+        self.attach_adjacency_views()
 
-    def is_connected(self):
+    def build_adjacency(self, first, second):
         """
-        Checks if the network is connected by using Union-Find.
+        Builds the CSR adjacency of the network from its edges.
+
+        Duplicate edges and self-loops are dropped, and the neighbors of every computer are sorted by index.
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+        """
+        first = np.asarray(first, dtype=np.int64)
+        second = np.asarray(second, dtype=np.int64)
+        keep = first != second
+        first, second = first[keep], second[keep]
+
+        # one key source * n + target per direction of every edge; sorting them orders the edge slots
+        slot_keys = np.concatenate((first * self.computer_number + second, second * self.computer_number + first))
+        slot_keys.sort()
+        if len(slot_keys):
+            slot_keys = slot_keys[np.concatenate(([True], slot_keys[1:] != slot_keys[:-1]))]
+        sources = slot_keys // self.computer_number
+        self.adjacency = slot_keys % self.computer_number
+        self.adjacency_offsets = np.zeros(self.computer_number + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self.computer_number), out=self.adjacency_offsets[1:])
+        self.neighbor_ids = self.computer_ids[self.adjacency]
+
+    def edges(self):
+        """
+        Returns every edge of the network once, read from the CSR adjacency.
 
         Returns:
-            bool: True if the network is connected, False otherwise.
+            list: The (ID, ID) pairs of the edges, the smaller ID first.
         """
-        uf = UnionFind(len(self.connected_computers))
+        sources = np.repeat(self.computer_ids, np.diff(self.adjacency_offsets))
+        first = sources < self.neighbor_ids
+        return list(zip(sources[first].tolist(), self.neighbor_ids[first].tolist()))
 
-        for node in self.connected_computers:
-            for neighbor in node.connectedEdges:
-                uf.union(self.connected_computers.index(node), self.connected_computers.index(self.find_computer(neighbor)))
+    def is_connected(self):
+        """
+        Checks if the network is connected by using Union-Find on the CSR adjacency.
 
-        root = uf.find(0)
-        return all(uf.find(i) == root for i in range(len(self.connected_computers)))
+        Returns:
+            bool: True if the network is connected, False otherwise.
+        """
+        sources = np.repeat(np.arange(self.computer_number, dtype=np.int64), np.diff(self.adjacency_offsets))
+        forward = sources < self.adjacency # every edge once
+        return not topologyModule.component_roots(sources[forward], self.adjacency[forward], self.computer_number).any()
 
     def create_computer_ids(self):
         """
         Creates IDs for the computers in the network based on the selected ID type.
+
+        The ID function returns the IDs of all the computers as one array, `computer_ids`, in network order;
+        the computers get their `id` from it, and the maps from IDs to indices (`computer_index`) and to
+        computers (`network_dict`) are built with it.
         """
         id_functions = {
         "Random": self.create_random_ids,
         "Sequential": self.create_sequential_ids,
+        "Permuted": self.create_permuted_ids,
+        "Sparse": self.create_sparse_ids,
         }
         
         id_function = id_functions[self.id_type]
-        id_function()
+        self.assign_computer_ids(id_function())
 
+    def assign_computer_ids(self, computer_ids):
+        """
+        Gives the computers their IDs and builds the maps from IDs to indices and to computers.
+
+        Args:
+            computer_ids (numpy.ndarray): The ID of every computer, in network order.
+        """
+        self.computer_ids = computer_ids
+        ids = computer_ids.tolist()
+        self.computer_index = dict(zip(ids, range(self.computer_number)))
+        if self.node_store is not None:
+            self.node_store.fill_column('id', computer_ids)
+            self.node_store.index = self.computer_index
+            self.network_dict = nodeStoreModule.ComputerDict(self.node_store)
+            return
+        for comp, comp_id in zip(self.connected_computers, ids):
+            comp.id = comp_id
+        self.network_dict = dict(zip(ids, self.connected_computers))
 
     def create_random_ids(self):
         """
-        Creates random, unique IDs for the computers.
+        Creates random, unique IDs between 100 and 100 * computer_number - 1, sampled without replacement
+        and sorted.
+
+        Returns:
+            numpy.ndarray: The ID of every computer.
         """
-        used_ids = set()
-        for comp in self.connected_computers:
-            comp_id = random.randint(100, 100 * self.computer_number - 1)
-            while comp_id in used_ids:
-                comp_id = random.randint(100, 100 * self.computer_number - 1)
-            comp.id = comp_id
-            used_ids.add(comp_id)
-        
-        # Sort the connected_computers list by their ids after assigning them
-        self.connected_computers.sort(key=lambda x: x.id)
+        rng = np.random.default_rng(random.getrandbits(64))
+        span = max(100 * self.computer_number - 100, self.computer_number)
+        ids = rng.choice(span, self.computer_number, replace=False) + 100
+        ids.sort()
+        return ids.astype(np.int64)
 
     def create_sequential_ids(self):
         """
         Creates sequential IDs for the computers.
+
+        Returns:
+            numpy.ndarray: The ID of every computer.
         """
-        for i, comp in enumerate(self.connected_computers):
-            comp.id = i
-            
+        return np.arange(self.computer_number, dtype=np.int64)
+
+    def create_permuted_ids(self):
+        """
+        Creates the IDs 0 .. computer_number - 1 in random order, so that the IDs do not follow the topology.
+
+        Returns:
+            numpy.ndarray: The ID of every computer.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        return rng.permutation(self.computer_number).astype(np.int64)
+
+    def create_sparse_ids(self):
+        """
+        Creates random, unique non-negative 64-bit IDs, sorted. Repeated IDs are drawn again.
+
+        Returns:
+            numpy.ndarray: The ID of every computer.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        ids = np.empty(0, dtype=np.int64)
+        while len(ids) < self.computer_number:
+            ids = topologyModule.distinct_keys(np.concatenate((ids, rng.integers(0, 2 ** 63 - 1, self.computer_number - len(ids), dtype=np.int64))))
+        return ids
 
     def create_random_topology(self):
         """
         Creates a random topology for the network.
+
+        Every computer is connected to a random number of others; if that leaves more than one component,
+        the components are joined by one edge each.
+
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
         """
-        ids_list = [comp.id for comp in self.connected_computers]
+        first, second = [], []
 
-        if len(self.connected_computers) == 2:
+        if self.computer_number == 2:
             # Connect the first computer to the second
-            self.connected_computers[0].connectedEdges.append(self.connected_computers[1].id)
-            self.connected_computers[1].connectedEdges.append(self.connected_computers[0].id)
+            first.append(0)
+            second.append(1)
 
-        elif len(self.connected_computers) == 3:
+        elif self.computer_number == 3:
             # All possible connected graphs for 3 nodes
             connected_graphs = [
                 [(0, 1), (1, 2)],
@@ -333,108 +1105,116 @@ class Initialization:
 
             # Choose one random connected graph
             chosen_edges = random.choice(connected_graphs)
-
-            # Create the connections based on the chosen graph
             for u, v in chosen_edges:
-                self.connected_computers[u].connectedEdges.append(self.connected_computers[v].id)
-                self.connected_computers[v].connectedEdges.append(self.connected_computers[u].id)
+                first.append(u)
+                second.append(v)
 
         else:
-            for i, comp in enumerate(self.connected_computers):
+            others = range(self.computer_number - 1)
+            for i in range(self.computer_number):
                 # Determine a random number of edges (between 1 and 2 * log(computer_number - 1))
                 num_edges = random.randint(1, 2 * int(math.log(self.computer_number - 1)))
-                # Choose num_edges unique vertices (excluding comp.id)
-                connected_to_vertices = random.sample([j for j in ids_list if j != comp.id], num_edges)
-
-                # Add connections
-                comp.connectedEdges.extend(connected_to_vertices)
-
-                # Ensure bi-directional connection
-                for connected_to_id in connected_to_vertices:
-                    for comp_other in self.connected_computers:
-                        if comp_other.id == connected_to_id:
-                            comp_other.connectedEdges.append(comp.id)
-                            break
-
-            # Remove duplicates
-            for comp in self.connected_computers:
-                comp.connectedEdges = sorted(list(set(comp.connectedEdges)))
-        
-        # Sort the connected_computers list by their ids (optional, if needed)
-        self.connected_computers.sort(key=lambda x: x.id)
+                # Choose num_edges unique vertices other than i: positions among the others, shifted past i
+                connected_to_vertices = random.sample(others, num_edges)
+                first.extend(repeat(i, num_edges))
+                second.extend(j + (j >= i) for j in connected_to_vertices)
+
+        first, second = np.array(first, dtype=np.int64), np.array(second, dtype=np.int64)
+        roots = topologyModule.component_roots(first, second, self.computer_number)
+        if roots.any():
+            first, second = topologyModule.join_components(first, second, roots, np.random.default_rng(random.getrandbits(64)))
+        return first, second
+
+    def create_model_topology(self, topology):
+        """
+        Creates one of the model topologies of `topologyModule`, sized by the 'Degree' and 'Rewiring' network variables.
+
+        Args:
+            topology (str): The topology type, one of `topologyModule.TOPOLOGIES`.
+
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        return topologyModule.generate(topology, self.computer_number, rng, self.degree, self.rewiring)
+
+    def read_topology_file(self):
+        """
+        Reads the edge list of the File topology, whose labels set the number of computers.
+
+        The edges are kept in `file_edges` until the topology is created.
+
+        Raises:
+            ValueError: If no edge list is given or it cannot be read.
+        """
+        if not self.topology_file:
+            raise ValueError("The File topology needs a 'Topology File' edge list")
+        first, second, self.node_labels = edgeListModule.read_edge_list(self.topology_file)
+        self.computer_number = len(self.node_labels)
+        self.file_edges = (first, second)
+
+    def create_file_topology(self):
+        """
+        Creates the topology read from the edge list; if it has more than one component, the components
+        are joined by one edge each.
+
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+        """
+        first, second = self.file_edges
+        self.file_edges = None
+        return topologyModule.connect(first, second, self.computer_number, np.random.default_rng(random.getrandbits(64)))
 
     def create_line_topology(self):
         """
         Creates a line topology for the network, where each computer is connected to the next one in sequence.
-        """
-        for i in range(self.computer_number - 1):
-            # Connect each computer to the next one in line
-            self.connected_computers[i].connectedEdges.append(self.connected_computers[i+1].id)
-            self.connected_computers[i + 1].connectedEdges.append(self.connected_computers[i].id)  # Ensure bi-directional connection
 
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+        """
+        first = np.arange(self.computer_number - 1, dtype=np.int64)
+        return first, first + 1
 
     def create_clique_topology(self):     
         """
         Creates a clique topology for the network, where each computer is connected to every other computer.
-        """   
-        # Connect each computer to every other computer
-        for i in range(self.computer_number):
-            for j in range(i + 1, self.computer_number):
-                # Ensure bi-directional connection
-                self.connected_computers[i].connectedEdges.append(self.connected_computers[j].id)
-                self.connected_computers[j].connectedEdges.append(self.connected_computers[i].id)
-
-        # Removing duplicates
-        for comp in self.connected_computers:
-            comp.connectedEdges = list(set(comp.connectedEdges)) 
 
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+        """   
+        return np.triu_indices(self.computer_number, 1)
 
     def create_tree_topology(self):
         """
         Creates a tree topology for the network using a randomly generated Prüfer sequence.
-        """
-        # Generate a Prüfer sequence
-        prufer_sequence = [random.choice(self.connected_computers) for _ in range(self.computer_number - 2)]
-        
-        # sort the connected computers by id
-        extra_list = sorted(self.connected_computers, key=lambda comp: comp.id)
-
-        # Connect nodes in L with nodes in S
-        while len(extra_list) > 2:
-            for i in extra_list:
-                if len(extra_list) <= 2:
-                    break
-                
-                if i not in prufer_sequence:
-                    j = prufer_sequence[0]  # Always connect to the first node in S
-                    i.connectedEdges.append(j.id)
-                    j.connectedEdges.append(i.id)
-                    prufer_sequence.remove(j)
-                    extra_list.remove(i)
-
-        # Connect the last two nodes in L
-        if len(extra_list) == 2:
-            extra_list[0].connectedEdges.append(extra_list[1].id)
-            extra_list[1].connectedEdges.append(extra_list[0].id)
 
+        Every labeled tree has exactly one Prüfer sequence, so a uniformly random sequence gives a uniformly
+        random labeled tree.
+
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        prufer_sequence = rng.integers(0, self.computer_number, max(self.computer_number - 2, 0)).tolist()
+        return topologyModule.prufer_edges(prufer_sequence, self.computer_number)
       
     def create_star_topology(self):
         """
         Creates a star topology for the network, where all computers are connected to a central hub (root node).
+
+        Returns:
+            tuple: The indices of the two endpoints of every edge, as two numpy arrays.
         """
-        root = None
-        for comp in self.connected_computers:
+        root = 0
+        for index, comp in enumerate(self.connected_computers):
             if getattr(comp, 'is_root', False):
-                root = comp
+                root = index
                 break
-        if root is None:
-            root = self.connected_computers[0]
-            
+
         # Connect all other nodes to the hub
-        for comp in self.connected_computers:
-            if comp.id != root.id:
-                root.connectedEdges.append(comp.id)
-                comp.connectedEdges.append(root.id)  # Ensure bi-directional connection
+        others = np.arange(self.computer_number, dtype=np.int64)
+        others = others[others != root]
+        return np.full(len(others), root, dtype=np.int64), others
 
 
     def load_algorithms(self, algorithm_module_path):
@@ -448,18 +1228,14 @@ class Initialization:
             print("No algorithm was provided")
             exit()
 
-        try:
-            directory, file_name = os.path.split(algorithm_module_path)
-            base_file_name, _ = os.path.splitext(file_name)
-            sys.path.insert(0,directory)
-
-            algorithm_module = importlib.import_module(base_file_name)
-            for comp in self.connected_computers:
-                comp.algorithm_file = algorithm_module
-
-        except ImportError:
-            print(f"Error: Unable to import {base_file_name}.py")
+        algorithm_module = import_algorithm_module(algorithm_module_path)
+        if algorithm_module is None:
             return None
+        if self.node_store is not None:
+            self.node_store.load_algorithm(algorithm_module)
+            return
+        for comp in self.connected_computers:
+            comp.algorithm_file = algorithm_module
 
     def root_selection(self):
         """
@@ -469,7 +1245,7 @@ class Initialization:
             selected_computer = random.choice(self.connected_computers)
             selected_computer.is_root=True
         elif self.root_type=="Min ID":
-            selected_computer = min(self.connected_computers, key=lambda computer: computer.id)
+            selected_computer = self.connected_computers[int(np.argmin(self.computer_ids))]
             selected_computer.is_root=True
 
     def find_computer(self, id: int) -> Computer:
@@ -482,10 +1258,7 @@ class Initialization:
         Returns:
             Computer: The computer object with the specified ID, or None if not found.
         """
-        for comp in self.connected_computers:
-            if comp.id == id:
-                return comp
-        return None
+        return self.network_dict.get(id)
 
 def main():
     init = Initialization()
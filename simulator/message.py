@@ -0,0 +1,92 @@
+"""
+Message records for the simulated network.
+
+This module defines the `Message` record used for every message in flight, from `Communication.send_message`
+through the message queue to `Communication.receive_message` and the Long logger, and the `Multicast` entry
+that holds a fan-out with a single arrival time in the queue until it is delivered.
+"""
+
+from itertools import repeat
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+
+class Message(NamedTuple):
+    """
+    A compact, immutable record of a single message in flight.
+
+    A `Message` is a tuple without a per-instance `__dict__`, ordered by `(arrival_time, counter)`, so the
+    message queue stores it directly instead of wrapping a dictionary in another tuple. `counter` is unique
+    per queue, which guarantees that two messages are never compared past it.
+
+    Attributes:
+        arrival_time (float): The time at which the message arrives at its destination.
+        counter (int): The queue's sequence number, used to break ties between equal arrival times.
+        source_id (int): The ID of the source computer.
+        dest_id (int): The ID of the destination computer.
+        content (Any): The content of the message.
+    """
+
+    arrival_time: float
+    counter: int
+    source_id: int
+    dest_id: int
+    content: Any
+
+    def as_dict(self) -> dict:
+        """
+        Returns the message in the dictionary format used by the Long logger.
+
+        Returns:
+            dict: The source, destination, arrival time and content of the message.
+        """
+        return {
+            'source_id': self.source_id,
+            'dest_id': self.dest_id,
+            'arrival_time': self.arrival_time,
+            'content': self.content,
+        }
+
+    def __str__(self) -> str:
+        """
+        Provides the Long logging representation of the message.
+
+        Returns:
+            str: The string representation of the message.
+        """
+        return str(self.as_dict())
+
+
+class Multicast(NamedTuple):
+    """
+    A single queue entry for a message sent to several destinations with the same arrival time.
+
+    The content is stored once, with the list of destinations. A multicast takes the counters `counter` to
+    `counter + len(dest_ids) - 1`, exactly the counters its messages would have had if they were pushed one
+    by one, so it is ordered among other entries by `(arrival_time, counter)` and expanded into per-destination
+    `Message` records only when it is popped. A queue's `size()` counts a multicast as one entry.
+
+    Attributes:
+        arrival_time (float): The time at which the messages arrive.
+        counter (int): The queue's sequence number of the first message.
+        source_id (int): The ID of the source computer.
+        dest_ids (Sequence): The IDs of the destination computers, in sending order: the sender's read-only
+            `connectedEdges` or a tuple, so they cannot change while the multicast is queued.
+        content (Any): The content shared by the messages.
+    """
+
+    arrival_time: float
+    counter: int
+    source_id: int
+    dest_ids: Sequence
+    content: Any
+
+    def expand(self) -> list:
+        """
+        Expands the multicast into one message per destination.
+
+        Returns:
+            list: The `Message` records, in counter order.
+        """
+        return list(map(Message._make, zip(repeat(self.arrival_time), range(self.counter, self.counter + len(self.dest_ids)),
+                                           repeat(self.source_id), self.dest_ids, repeat(self.content))))
@@ -0,0 +1,229 @@
+"""
+Per-run metrics of the simulation.
+
+This module collects message counts per computer and per edge, the number of messages in flight (peak and
+averaged over the simulated time), the event rate and the time spent inside every algorithm function.
+The counting is done by `InstrumentedCommunication`, which replaces `Communication` only when metrics are
+enabled, so a run without metrics executes exactly the same code as before.
+"""
+
+import time
+from collections import Counter
+from itertools import repeat
+
+from simulator.communication import Communication
+
+
+class Metrics:
+    """
+    A registry of the metrics of a single run.
+
+    Attributes:
+        sent (Counter): The number of messages sent by every computer ID.
+        received (Counter): The number of messages received by every computer ID.
+        edge_sent (Counter): The number of messages sent on every (source ID, destination ID) edge.
+        edge_received (Counter): The number of messages received on every (source ID, destination ID) edge.
+        messages_sent (int): The total number of messages sent.
+        messages_received (int): The total number of messages received.
+        peak_in_flight (int): The largest number of messages in flight when a message was delivered.
+        in_flight_area (float): The number of messages in flight integrated over the simulated time.
+        last_time (float): The simulated time of the last delivery.
+        callbacks (dict): Every algorithm function name mapped to its [number of calls, total seconds].
+        start_time (float): The wall-clock time at which the run started.
+        run_time (float): The wall-clock duration of the run, once it finished.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self.sent = Counter()
+        self.received = Counter()
+        self.edge_sent = Counter()
+        self.edge_received = Counter()
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.peak_in_flight = 0
+        self.in_flight_area = 0.0
+        self.last_time = 0
+        self.callbacks = {}
+        self.start_time = None
+        self.run_time = 0.0
+
+    def observe(self, arrival_time):
+        """
+        Samples the number of messages in flight just before messages arriving at the given time are delivered.
+
+        Args:
+            arrival_time (float): The arrival time of the messages about to be delivered.
+        """
+        in_flight = self.messages_sent - self.messages_received
+        if arrival_time != self.last_time:
+            self.in_flight_area += in_flight * (arrival_time - self.last_time)
+            self.last_time = arrival_time
+        if in_flight > self.peak_in_flight:
+            self.peak_in_flight = in_flight
+
+    def to_dict(self) -> dict:
+        """
+        Returns the metrics as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The totals, the in-flight statistics, the event rate, the callback timings and the per-computer
+            and per-edge counts. Edges are keyed "source->destination".
+        """
+        return {
+            'messages_sent': self.messages_sent,
+            'messages_received': self.messages_received,
+            'peak_in_flight': self.peak_in_flight,
+            'mean_in_flight': self.in_flight_area / self.last_time if self.last_time else 0.0,
+            'final_time': self.last_time,
+            'run_time': self.run_time,
+            'events_per_second': self.messages_received / self.run_time if self.run_time else 0.0,
+            'callbacks': {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in self.callbacks.items()},
+            'sent_per_node': dict(self.sent),
+            'received_per_node': dict(self.received),
+            'sent_per_edge': {f"{source}->{dest}": count for (source, dest), count in self.edge_sent.items()},
+            'received_per_edge': {f"{source}->{dest}": count for (source, dest), count in self.edge_received.items()},
+        }
+
+
+class InstrumentedCommunication(Communication):
+    """
+    A `Communication` that records the metrics of the run.
+
+    The partitioned engine runs the algorithms in worker processes with their own `Communication`, so only
+    the run time and the message totals are recorded for it.
+
+    Attributes:
+        metrics (Metrics): The metrics of the run.
+    """
+
+    def __init__(self, network):
+        """
+        Initializes the instrumented communication with the given network.
+
+        Args:
+            network (Initialization): The initialized network containing the computers.
+        """
+        super().__init__(network)
+        self.metrics = Metrics()
+
+    def start_run(self):
+        """
+        Starts the wall clock of the run.
+        """
+        super().start_run()
+        self.metrics.start_time = time.perf_counter()
+
+    def finish_run(self):
+        """
+        Stops the wall clock of the run, and fills in the totals the partitioned engine does not report.
+        """
+        metrics = self.metrics
+        metrics.run_time = time.perf_counter() - metrics.start_time
+        if self.network.engine_type == "Parallel":  # every sent message was delivered
+            metrics.messages_sent = metrics.messages_received = self.network.message_queue.counter
+            metrics.last_time = self.network.current_time
+        super().finish_run()
+
+    def post_message(self, source_computer, dest, delay, message_info, sent_time = None):
+        """
+        Counts and queues a message with a known delay, unless the source computer has terminated.
+
+        Args:
+            source_computer (Computer): The computer sending the message.
+            dest (int): The ID of the destination computer receiving the message.
+            delay (float): The delay of the message.
+            message_info (str): The content of the message being sent.
+            sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
+        """
+        if source_computer.state != "terminated":
+            metrics = self.metrics
+            metrics.messages_sent += 1
+            metrics.sent[source_computer.id] += 1
+            metrics.edge_sent[(source_computer.id, dest)] += 1
+        super().post_message(source_computer, dest, delay, message_info, sent_time)
+
+    def send_to_all(self, source_id, message_info, sent_time = None):
+        """
+        Counts and sends a message from the source computer to all connected computers.
+
+        Args:
+            source_id (int): The ID of the source computer sending the message.
+            message_info (str): The content of the message being sent.
+            sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
+        """
+        source_computer = self.network.network_dict.get(source_id)
+        if source_computer.state != "terminated":
+            metrics = self.metrics
+            metrics.messages_sent += len(source_computer.connectedEdges)
+            metrics.sent[source_id] += len(source_computer.connectedEdges)
+            metrics.edge_sent.update(zip(repeat(source_id), source_computer.connectedEdges))
+        super().send_to_all(source_id, message_info, sent_time)
+
+    def receive_message(self, message, comm):
+        """
+        Counts a message and delivers it.
+
+        Args:
+            message (Message): The message that was received.
+            comm (Communication): The communication object handling the message passing.
+        """
+        metrics = self.metrics
+        metrics.observe(message.arrival_time)
+        metrics.messages_received += 1
+        metrics.received[message.dest_id] += 1
+        metrics.edge_received[(message.source_id, message.dest_id)] += 1
+        super().receive_message(message, comm)
+
+    def receive_batch(self, comp, messages, positions, outbox):
+        """
+        Counts the messages a computer receives in a round, and delivers them as one timed 'mainAlgorithm' call
+        per message.
+
+        Args:
+            comp (Computer): The destination computer of all the messages.
+            messages (list): All the messages of the round.
+            positions (list): The positions in `messages` of the messages sent to this computer.
+            outbox (RoundBuffer): The buffer collecting the messages sent during the round.
+        """
+        metrics = self.metrics
+        metrics.observe(messages[positions[0]].arrival_time)
+        metrics.messages_received += len(positions)
+        metrics.received[comp.id] += len(positions)
+        metrics.edge_received.update((messages[position].source_id, comp.id) for position in positions)
+
+        start = time.perf_counter()
+        super().receive_batch(comp, messages, positions, outbox)
+        self.record_callback('mainAlgorithm', len(positions), time.perf_counter() - start)
+
+    def run_algorithmm(self, comp, function_name: str, arrival_time = None, message_content=None):
+        """
+        Runs and times the specified algorithm on the given computer.
+
+        Args:
+            comp (Computer): The computer object on which to run the algorithm.
+            function_name (str): The name of the function (algorithm) to be executed.
+            arrival_time (float, optional): The time the message arrived, if applicable.
+            message_content (str, optional): The content of the message being processed by the algorithm.
+        """
+        start = time.perf_counter()
+        super().run_algorithmm(comp, function_name, arrival_time, message_content)
+        self.record_callback(function_name, 1, time.perf_counter() - start)
+
+    def record_callback(self, function_name, calls, seconds):
+        """
+        Adds calls of an algorithm function and the time spent in them.
+
+        Args:
+            function_name (str): The name of the algorithm function.
+            calls (int): The number of calls.
+            seconds (float): The time spent in the calls.
+        """
+        timing = self.metrics.callbacks.get(function_name)
+        if timing is None:
+            self.metrics.callbacks[function_name] = [calls, seconds]
+        else:
+            timing[0] += calls
+            timing[1] += seconds
@@ -0,0 +1,778 @@
+"""
+Columnar (struct-of-arrays) store of the computers' fields.
+
+With the 'Columnar' node store the network keeps no `Computer` objects: the fields of the computers are
+columns of a `NodeStore`, and lightweight `ComputerView` proxies, created on access, stand in for the
+computers. An algorithm reads and writes `self.distance` on a view as on a `Computer`, so existing
+algorithms run unchanged.
+
+The fields every computer has are typed NumPy columns: `id` (int64), `is_root` (bool), and `state` and
+`color`, categorical columns of strings (int32 codes into the list of their distinct values, which may also
+include None). An algorithm can give its own fields typed columns with a module-level `NODE_FIELDS`
+dictionary, e.g. `NODE_FIELDS = {'distance': 'float32', 'parent': 'int32'}`; the values written to a
+declared numeric field are converted to its type, and the field reads as zero until it is written. Every
+other field, and a fixed field that gets a value of another type, is held in a generic column, a list of
+values.
+
+The views of the adjacency (`connectedEdges`) and of the delays (`delays`) are sliced from the network's
+CSR arrays on access and cannot be assigned, and every computer shares the algorithm module. The store does
+not record the changes of the computers, so it only runs with the Text display, without a change trace.
+"""
+
+import numpy as np
+
+from simulator.computer import Computer, MISSING, ReadOnlyList
+
+FIXED_FIELDS = {'id': np.int64, 'is_root': np.bool_, 'state': str, 'color': str}  # the fields of every computer
+SCALAR_TYPES = {'b': bool, 'i': int, 'u': int, 'f': float}  # the Python type read from an array of a kind
+NUMPY_SCALAR_TYPES = {'b': np.bool_, 'i': np.integer, 'u': np.integer, 'f': np.floating}  # NumPy scalars of a kind
+
+
+class ArrayColumn:
+    """
+    A column of bools, ints or floats, held in a NumPy array.
+
+    Attributes:
+        array (numpy.ndarray): The value of every computer.
+        view (memoryview): A view of `array`, which reads and writes single values as Python scalars.
+        scalar_type (type): The Python type of the values, written without conversion.
+        numpy_type (type): The NumPy scalar type of the values, written as the matching Python scalars.
+        declared (bool): Whether the algorithm declared the field, in which case other values are converted.
+    """
+
+    def __init__(self, size, dtype, declared=False):
+        """
+        Initializes a column of zeros.
+
+        Args:
+            size (int): The number of computers.
+            dtype: The NumPy type of the values.
+            declared (bool, optional): Whether the algorithm declared the field. Defaults to False.
+        """
+        self.array = np.zeros(size, dtype=dtype)
+        self.view = memoryview(self.array)
+        self.scalar_type = SCALAR_TYPES[self.array.dtype.kind]
+        self.numpy_type = NUMPY_SCALAR_TYPES[self.array.dtype.kind]
+        self.declared = declared
+
+    def __getstate__(self):
+        """
+        Returns the picklable state of the column, without the view of its array.
+
+        Returns:
+            dict: The attributes of the column.
+        """
+        state = self.__dict__.copy()
+        del state['view']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the column and the view of its array.
+
+        Args:
+            state (dict): The state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self.view = memoryview(self.array)
+
+    def get(self, index):
+        """
+        Returns the field of a computer.
+
+        Args:
+            index (int): The index of the computer.
+
+        Returns:
+            The value of the field, as a Python scalar.
+        """
+        return self.view[index]
+
+    def set(self, index, value) -> bool:
+        """
+        Sets the field of a computer, if the value fits the column.
+
+        Args:
+            index (int): The index of the computer.
+            value: The value.
+
+        Returns:
+            bool: True if the value was written, False if it does not fit the column.
+        """
+        try:
+            if type(value) is self.scalar_type:
+                self.view[index] = value
+            elif isinstance(value, self.numpy_type):
+                self.view[index] = value.item()
+            elif self.declared:
+                self.array[index] = value
+            else:
+                return False
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return True
+
+    def fill(self, values):
+        """
+        Sets the field of every computer.
+
+        Args:
+            values: The value of every computer, in network order, or a single value for all of them.
+        """
+        self.array[:] = values
+
+
+class CategoryColumn:
+    """
+    A column of strings or None, held as int32 codes into the list of the distinct values.
+
+    Attributes:
+        codes (numpy.ndarray): The code of every computer's value.
+        view (memoryview): A view of `codes`.
+        categories (list): The distinct values, in the order they were first written.
+        category_codes (dict): The code of every distinct value.
+        declared (bool): Whether the algorithm declared the field.
+    """
+
+    def __init__(self, size, dtype=None, declared=False):
+        """
+        Initializes a column in which every computer has the field None.
+
+        Args:
+            size (int): The number of computers.
+            dtype: Unused, the codes are int32.
+            declared (bool, optional): Whether the algorithm declared the field. Defaults to False.
+        """
+        self.codes = np.zeros(size, dtype=np.int32)
+        self.view = memoryview(self.codes)
+        self.categories = [None]
+        self.category_codes = {None: 0}
+        self.declared = declared
+
+    __getstate__ = ArrayColumn.__getstate__
+
+    def __setstate__(self, state):
+        """
+        Restores the column and the view of its codes.
+
+        Args:
+            state (dict): The state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self.view = memoryview(self.codes)
+
+    def get(self, index):
+        """
+        Returns the field of a computer.
+
+        Args:
+            index (int): The index of the computer.
+
+        Returns:
+            str: The value of the field, or None.
+        """
+        return self.categories[self.view[index]]
+
+    def set(self, index, value) -> bool:
+        """
+        Sets the field of a computer, adding the value to the categories if it is new.
+
+        Args:
+            index (int): The index of the computer.
+            value: The value.
+
+        Returns:
+            bool: True if the value was written, False if it is not a string or None.
+        """
+        code = self.category_codes.get(value) if type(value) is str or value is None else None
+        if code is None:
+            if type(value) is not str:
+                return False
+            code = self.category_codes[value] = len(self.categories)
+            self.categories.append(value)
+        self.view[index] = code
+        return True
+
+    def fill(self, value):
+        """
+        Sets the field of every computer to the same value.
+
+        Args:
+            value (str): The value.
+        """
+        self.set(0, value)
+        self.codes[:] = self.codes[0]
+
+
+class ObjectColumn:
+    """
+    The generic column, holding values of any type in a list.
+
+    Attributes:
+        values (list): The value of every computer, MISSING if the computer does not have the field.
+        declared (bool): Whether the algorithm declared the field.
+    """
+
+    def __init__(self, size, dtype=None, declared=False):
+        """
+        Initializes a column in which no computer has the field.
+
+        Args:
+            size (int): The number of computers.
+            dtype: Unused.
+            declared (bool, optional): Whether the algorithm declared the field. Defaults to False.
+        """
+        self.values = [MISSING] * size
+        self.declared = declared
+
+    @classmethod
+    def copy_of(cls, column, size):
+        """
+        Returns a generic column holding the same fields as another column.
+
+        Args:
+            column: The column.
+            size (int): The number of computers.
+
+        Returns:
+            ObjectColumn: The new column.
+        """
+        copy = cls(0)
+        copy.values = [column.get(index) for index in range(size)]
+        return copy
+
+    def get(self, index):
+        """
+        Returns the field of a computer.
+
+        Args:
+            index (int): The index of the computer.
+
+        Returns:
+            The value of the field, or MISSING if the computer does not have it.
+        """
+        return self.values[index]
+
+    def set(self, index, value) -> bool:
+        """
+        Sets the field of a computer; the generic column holds any value.
+
+        Args:
+            index (int): The index of the computer.
+            value: The value.
+
+        Returns:
+            bool: Always True.
+        """
+        self.values[index] = value
+        return True
+
+
+def new_column(size, dtype, declared=False):
+    """
+    Returns a column of a NumPy type.
+
+    Args:
+        size (int): The number of computers.
+        dtype: The NumPy type, e.g. 'float32', int, str or object.
+        declared (bool, optional): Whether the algorithm declared the field. Defaults to False.
+
+    Returns:
+        The column.
+
+    Raises:
+        ValueError: If no column holds values of the type.
+    """
+    try:
+        kind = np.dtype(dtype).kind
+    except TypeError:
+        kind = None
+    if kind in SCALAR_TYPES:
+        return ArrayColumn(size, dtype, declared)
+    if kind in ('U', 'S'):
+        return CategoryColumn(size, declared=declared)
+    if kind == 'O':
+        return ObjectColumn(size, declared=declared)
+    raise ValueError(f"Node fields of type {dtype} are not supported")
+
+
+def field_property(name) -> property:
+    """
+    Returns the property through which the views of a store read a field.
+
+    Args:
+        name (str): The name of the field.
+
+    Returns:
+        property: A property reading the field from the column of the view's store.
+    """
+    def get(view):
+        value = view._store.columns[name].get(view._index)
+        if value is MISSING:
+            raise AttributeError(f"'Computer' object has no attribute '{name}'")
+        return value
+    return property(get, doc=f"The '{name}' field of the computer.")
+
+
+class NodeStore:
+    """
+    The fields of all the computers of a network, one column per field.
+
+    Attributes:
+        size (int): The number of computers.
+        columns (dict): The field names mapped to their column.
+        view_class (type): The store's own subclass of `ComputerView`, with a property per column.
+        algorithm_file (module): The algorithm module, shared by every computer.
+        index (dict): A dictionary mapping computer IDs to their index, the network's `computer_index`.
+        offsets (memoryview): The network's `adjacency_offsets`.
+        adjacency (numpy.ndarray): The network's CSR adjacency.
+        neighbors (memoryview): A view of the network's `neighbor_ids`, sliced into `connectedEdges`.
+        delays (memoryview): A view of the network's `edges_delays`, sliced into `delays`.
+    """
+
+    def __init__(self, size):
+        """
+        Initializes the store with the fields every computer has, set to their `Computer` defaults.
+
+        Args:
+            size (int): The number of computers.
+        """
+        self.size = size
+        self.columns = {}
+        self.view_class = type('ComputerView', (ComputerView,), {'__slots__': ()})
+        self.algorithm_file = None
+        self.index = {}
+        self.offsets = self.adjacency = self.neighbors = self.delays = None
+        defaults = vars(Computer())
+        for name, dtype in FIXED_FIELDS.items():
+            column = self.add_column(name, new_column(size, dtype))
+            if defaults[name] is not None:  # the IDs are assigned later
+                column.fill(defaults[name])
+
+    def __getstate__(self):
+        """
+        Returns the picklable state of the store, used by checkpoints.
+
+        The view class, the algorithm module and the views of the network's arrays are left out; the view
+        class is rebuilt when the store is unpickled, and the network restores the others.
+
+        Returns:
+            dict: The attributes of the store.
+        """
+        state = self.__dict__.copy()
+        state['view_class'] = state['algorithm_file'] = None
+        state['offsets'] = state['neighbors'] = state['delays'] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the store and rebuilds its view class.
+
+        Args:
+            state (dict): The state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self.view_class = type('ComputerView', (ComputerView,), {'__slots__': ()})
+        for name in self.columns:
+            setattr(self.view_class, name, field_property(name))
+
+    def add_column(self, name, column):
+        """
+        Adds the column of a field and its property to the store's view class.
+
+        Args:
+            name (str): The name of the field.
+            column: The column.
+
+        Returns:
+            The column.
+
+        Raises:
+            AttributeError: If the name is one of the attributes of the views, like `connectedEdges`.
+        """
+        if hasattr(ComputerView, name):
+            raise AttributeError(f"The Columnar node store does not support setting '{name}' of a computer")
+        self.columns[name] = column
+        setattr(self.view_class, name, field_property(name))
+        return column
+
+    def fill_column(self, name, values):
+        """
+        Sets a field of every computer from an array.
+
+        Args:
+            name (str): The name of a field with a typed column.
+            values (numpy.ndarray): The value of every computer, in network order.
+        """
+        self.columns[name].fill(values)
+
+    def load_algorithm(self, algorithm_module):
+        """
+        Gives every computer the algorithm module and creates typed columns for the fields it declares in
+        `NODE_FIELDS`.
+
+        Args:
+            algorithm_module (module): The algorithm module.
+
+        Raises:
+            ValueError: If a declared type is not supported or a declared name is not a valid field.
+        """
+        self.algorithm_file = algorithm_module
+        for name, dtype in getattr(algorithm_module, 'NODE_FIELDS', {}).items():
+            if name in self.columns:  # a field of every computer, or declared before the checkpoint
+                continue
+            try:
+                self.add_column(name, new_column(self.size, dtype, declared=True))
+            except AttributeError as error:
+                raise ValueError(f"Cannot declare the node field '{name}': {error}")
+
+    def attach_adjacency(self, offsets, adjacency, neighbor_ids):
+        """
+        Attaches the network's CSR adjacency, which the views slice on access.
+
+        Args:
+            offsets (numpy.ndarray): The network's `adjacency_offsets`.
+            adjacency (numpy.ndarray): The network's `adjacency`.
+            neighbor_ids (numpy.ndarray): The network's `neighbor_ids`.
+        """
+        self.offsets = memoryview(offsets)
+        self.adjacency = adjacency
+        self.neighbors = memoryview(neighbor_ids).toreadonly()
+
+    def attach_delays(self, delays):
+        """
+        Attaches the network's delay table, which the views slice on access.
+
+        Args:
+            delays (numpy.ndarray): The network's `edges_delays`.
+        """
+        self.delays = memoryview(delays).toreadonly()
+
+    def set(self, index, name, value):
+        """
+        Sets a field of a computer that its column does not take as is: a new field gets a generic column,
+        and a field of every computer that gets a value of another type moves to a generic column.
+
+        Args:
+            index (int): The index of the computer.
+            name (str): The name of the field.
+            value: The value.
+
+        Raises:
+            AttributeError: If the name is one of the attributes of the views, like `connectedEdges`.
+            ValueError: If the value cannot be converted to the declared type of the field.
+        """
+        if name == 'algorithm_file':
+            self.algorithm_file = value
+            return
+        column = self.columns.get(name)
+        if column is None:
+            column = self.add_column(name, ObjectColumn(self.size))
+        elif column.declared:
+            raise ValueError(f"{value!r} does not fit the declared type of the node field '{name}'")
+        else:
+            column = self.columns[name] = ObjectColumn.copy_of(column, self.size)
+        column.set(index, value)
+
+
+class ComputerView:
+    """
+    A lightweight stand-in for a `Computer`, reading and writing its fields in a `NodeStore`.
+
+    Views are created on access and hold no state of their own: two views of the same computer are equal.
+    Every store has its own subclass, whose properties read the fields from the store's columns.
+
+    Attributes:
+        _store (NodeStore): The store holding the computer's fields.
+        _index (int): The index of the computer in the network.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        """
+        Initializes a view of a computer.
+
+        Args:
+            store (NodeStore): The store holding the computer's fields.
+            index (int): The index of the computer in the network.
+        """
+        set_store(self, store)
+        set_index(self, index)
+
+    def __setattr__(self, name, value):
+        """
+        Sets a field of the computer in its column.
+
+        Args:
+            name (str): The name of the field.
+            value (Any): The value.
+
+        Raises:
+            AttributeError: If the name is one of the attributes of the views, like `connectedEdges`.
+            ValueError: If the value cannot be converted to the declared type of the field.
+        """
+        column = self._store.columns.get(name)
+        if column is None or not column.set(self._index, value):
+            self._store.set(self._index, name, value)
+
+    def __reduce__(self):
+        """
+        Pickles the view as its store and index.
+
+        Returns:
+            tuple: The function and arguments that rebuild the view.
+        """
+        return new_view, (self._store, self._index)
+
+    def __eq__(self, other):
+        """
+        Returns whether another object is a view of the same computer.
+        """
+        return isinstance(other, ComputerView) and self._store is other._store and self._index == other._index
+
+    def __hash__(self):
+        """
+        Returns the hash of the view, the index of its computer.
+        """
+        return hash(self._index)
+
+    def __str__(self):
+        """
+        Provides a string representation of the computer's ID, connections, and delays.
+
+        Returns:
+            str: The string representation of the computer.
+        """
+        return f"id = {self.id}\nconnected edges = {list(self.connectedEdges)}\n"
+
+    @property
+    def connectedEdges(self):
+        """
+        ReadOnlyList: The IDs of the computers to which this computer is connected, a read-only view of the
+        network's adjacency.
+        """
+        store = self._store
+        if store.neighbors is None:
+            return []
+        return ReadOnlyList(store.neighbors[store.offsets[self._index]:store.offsets[self._index + 1]])
+
+    @property
+    def delays(self):
+        """
+        ReadOnlyList: The delays of the connected edges, aligned with `connectedEdges`.
+        """
+        store = self._store
+        if store.delays is None:
+            return []
+        return ReadOnlyList(store.delays[store.offsets[self._index]:store.offsets[self._index + 1]])
+
+    @property
+    def algorithm_file(self):
+        """
+        module: The algorithm module, shared by every computer.
+        """
+        return self._store.algorithm_file
+
+    def reset_flag(self):
+        """
+        Forgets the recorded changes. A view does not record changes.
+        """
+
+    def has_changed(self):
+        """
+        Returns whether the computer's state has changed. A view does not record changes.
+
+        Returns:
+            bool: Always False.
+        """
+        return False
+
+    def getConnectedEdges(self):
+        """
+        Returns the IDs of connected computers (edges).
+
+        Returns:
+            ReadOnlyList: The connected edges for this computer.
+        """
+        return self.connectedEdges
+
+    def delay_to(self, dest):
+        """
+        Returns the delay of the edge to a neighbor, found by binary search in the computer's row of the
+        adjacency.
+
+        Args:
+            dest (int): The ID of the neighbor.
+
+        Returns:
+            float: The delay of the edge, or None if `dest` is not a neighbor.
+        """
+        store = self._store
+        dest_index = store.index.get(dest)
+        if dest_index is None:
+            return None
+        start, end = store.offsets[self._index], store.offsets[self._index + 1]
+        slot = start + int(np.searchsorted(store.adjacency[start:end], dest_index))
+        if slot < end and store.adjacency[slot] == dest_index:
+            return store.delays[slot]
+        return None
+
+    def getDelays(self):
+        """
+        Returns the list of delays for the connected edges.
+
+        Returns:
+            ReadOnlyList: The delays associated with the connected edges.
+        """
+        return self.delays
+
+
+set_store = ComputerView._store.__set__
+set_index = ComputerView._index.__set__
+
+
+def new_view(store, index) -> ComputerView:
+    """
+    Creates the view of a computer, faster than calling the view class.
+
+    Args:
+        store (NodeStore): The store holding the computer's fields.
+        index (int): The index of the computer in the network.
+
+    Returns:
+        ComputerView: The view, an instance of the store's view class.
+    """
+    view = object.__new__(store.view_class)
+    set_store(view, store)
+    set_index(view, index)
+    return view
+
+
+class ComputerList:
+    """
+    The computers of a columnar network in network order, as views; stands in for `connected_computers`.
+
+    Attributes:
+        store (NodeStore): The store holding the computers' fields.
+    """
+
+    def __init__(self, store):
+        """
+        Initializes the list.
+
+        Args:
+            store (NodeStore): The store holding the computers' fields.
+        """
+        self.store = store
+
+    def __len__(self) -> int:
+        """
+        Returns the number of computers.
+        """
+        return self.store.size
+
+    def __getitem__(self, index) -> ComputerView:
+        """
+        Returns the view of a computer.
+
+        Args:
+            index (int): The index of the computer, negative indices counting from the end.
+
+        Returns:
+            ComputerView: The view.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        index = int(index)
+        if index < 0:
+            index += self.store.size
+        if not 0 <= index < self.store.size:
+            raise IndexError("computer index out of range")
+        return new_view(self.store, index)
+
+    def __iter__(self):
+        """
+        Iterates over the computers in network order.
+
+        Yields:
+            ComputerView: The view of every computer.
+        """
+        store = self.store
+        for index in range(store.size):
+            yield new_view(store, index)
+
+
+class ComputerDict:
+    """
+    The computers of a columnar network by ID, as views; stands in for `network_dict`.
+
+    Attributes:
+        store (NodeStore): The store holding the computers' fields.
+    """
+
+    def __init__(self, store):
+        """
+        Initializes the mapping.
+
+        Args:
+            store (NodeStore): The store holding the computers' fields, whose `index` maps IDs to indices.
+        """
+        self.store = store
+
+    def __len__(self) -> int:
+        """
+        Returns the number of computers.
+        """
+        return self.store.size
+
+    def __contains__(self, comp_id) -> bool:
+        """
+        Returns whether a computer ID is in the network.
+        """
+        return comp_id in self.store.index
+
+    def __iter__(self):
+        """
+        Iterates over the computer IDs.
+        """
+        return iter(self.store.index)
+
+    def get(self, comp_id, default=None):
+        """
+        Returns the view of a computer.
+
+        Args:
+            comp_id (int): The ID of the computer.
+            default (optional): The value returned for an unknown ID. Defaults to None.
+
+        Returns:
+            ComputerView: The view, or `default` if no computer has the ID.
+        """
+        index = self.store.index.get(comp_id)
+        return default if index is None else new_view(self.store, index)
+
+    def __getitem__(self, comp_id) -> ComputerView:
+        """
+        Returns the view of a computer.
+
+        Args:
+            comp_id (int): The ID of the computer.
+
+        Returns:
+            ComputerView: The view.
+
+        Raises:
+            KeyError: If no computer has the ID.
+        """
+        return new_view(self.store, self.store.index[comp_id])
+
+    def values(self):
+        """
+        Returns the computers in network order.
+
+        Returns:
+            ComputerList: The views of the computers.
+        """
+        return ComputerList(self.store)
@@ -0,0 +1,421 @@
+"""
+Conservative parallel discrete-event simulation (PDES) of the network.
+
+This module splits the connected computers into partitions, each simulated by its own worker process with
+its own event queue. The workers advance together in windows: with L the minimum link delay (the lookahead)
+and T the earliest pending arrival time, every worker processes its messages with arrival time < T + L.
+Any message sent in a window arrives at or after T + L, so messages crossing partitions are exchanged in a
+batch at the end of the window.
+
+To reproduce the sequential engine exactly, every message is ordered by the key (arrival_time, rank, seq),
+where rank is the position of the event that sent it in the global processing order (computers' `init`
+calls come first, in network order) and seq is its position among that event's sends. This is the order
+in which the sequential engine assigns its queue counters. At the end of every window the coordinator
+merges the keys of the events processed by all workers to rank them.
+"""
+
+import heapq
+import math
+import multiprocessing
+import random
+import sys
+import traceback
+from collections import deque
+from itertools import repeat
+
+import simulator.initializationModule as initializationModule
+import simulator.communication as communication
+from simulator.computer import Computer
+from simulator.message import Message
+
+
+def partition_computers(network: initializationModule.Initialization, partitions: int) -> dict:
+    """
+    Splits the computers into partitions of equal size, following a breadth-first order for locality.
+
+    Args:
+        network (Initialization): The initialized network.
+        partitions (int): The number of partitions.
+
+    Returns:
+        dict: A dictionary mapping every computer ID to its partition index.
+    """
+    order = []
+    seen = set()
+    for comp in network.connected_computers:
+        if comp.id in seen:
+            continue
+        seen.add(comp.id)
+        queue = deque([comp.id])
+        while queue:
+            comp_id = queue.popleft()
+            order.append(comp_id)
+            for neighbor in network.network_dict[comp_id].connectedEdges:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+
+    size = math.ceil(len(order) / partitions)
+    return {comp_id: position // size for position, comp_id in enumerate(order)}
+
+
+def lookahead(network: initializationModule.Initialization) -> float:
+    """
+    Returns the minimum delay of a link, used as the lookahead of the parallel engine.
+
+    Args:
+        network (Initialization): The initialized network.
+
+    Returns:
+        float: The lookahead.
+
+    Raises:
+        ValueError: If some link has no positive delay.
+    """
+    if len(network.edges_delays) == 0:
+        return 1
+    step = float(network.edges_delays.min())
+    if step <= 0:
+        raise ValueError("The Parallel engine needs positive link delays, set a positive 'Delay Floor'")
+    return step
+
+
+def computer_state(comp: Computer) -> dict:
+    """
+    Returns the attributes of a computer that can be sent to and from a worker process.
+
+    Args:
+        comp (Computer): The computer.
+
+    Returns:
+        dict: The computer's attributes, without its algorithm module and private flags, with its
+        connected edges and delays as lists.
+    """
+    state = {key: value for key, value in comp.__dict__.items() if key not in ('algorithm_file', '_changes', '_edge_slots')}
+    state['connectedEdges'] = list(comp.connectedEdges)
+    state['delays'] = list(comp.delays)
+    return state
+
+
+class PartitionOutbox:
+    """
+    Stands in for the message queue of a partition: records every message sent by the partition's computers.
+
+    Attributes:
+        current (int): The rank of the event being processed if it is already known (`init` calls),
+            otherwise its position in the current window, as -1 - position.
+        sent (list): (parent, arrival_time, source_id, dest_id, content) tuples, in sending order.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty outbox.
+        """
+        self.current = 0
+        self.sent = []
+
+    def push(self, arrival_time, source_id, dest_id, content):
+        """
+        Records a message sent while processing the current event.
+
+        Args:
+            arrival_time (float): The time at which the message arrives.
+            source_id (int): The ID of the source computer.
+            dest_id (int): The ID of the destination computer.
+            content (str): The content of the message.
+        """
+        self.sent.append((self.current, arrival_time, source_id, dest_id, content))
+
+    def push_many(self, arrival_times, source_id, dest_ids, content):
+        """
+        Records the messages of a fan-out sent while processing the current event.
+
+        Args:
+            arrival_times (list): The arrival time of every message.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        current = self.current
+        self.sent.extend((current, arrival_time, source_id, dest_id, content) for arrival_time, dest_id in zip(arrival_times, dest_ids))
+
+    def push_multicast(self, arrival_time, source_id, dest_ids, content):
+        """
+        Records a fan-out whose messages share an arrival time, one record per destination.
+
+        Args:
+            arrival_time (float): The time at which the messages arrive.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        self.push_many(repeat(arrival_time), source_id, dest_ids, content)
+
+    def take(self) -> list:
+        """
+        Returns the recorded messages, each with its position among its parent event's sends, and clears
+        the outbox.
+
+        Returns:
+            list: (parent, seq, arrival_time, source_id, dest_id, content) tuples.
+        """
+        result = []
+        previous_parent = None
+        seq = 0
+        for parent, arrival_time, source_id, dest_id, content in self.sent:
+            seq = seq + 1 if parent == previous_parent else 0
+            previous_parent = parent
+            result.append((parent, seq, arrival_time, source_id, dest_id, content))
+        self.sent = []
+        return result
+
+
+class PartitionNetwork:
+    """
+    The part of the network simulated by a worker process.
+
+    Provides the attributes `Communication` uses, for the partition's computers only.
+
+    Attributes:
+        connected_computers (list): The partition's computers, in network order.
+        network_dict (dict): A dictionary mapping the partition's computer IDs to Computer objects.
+        global_index (dict): A dictionary mapping the partition's computer IDs to their index in the network.
+        message_queue (PartitionOutbox): The outbox recording sent messages.
+    """
+
+    def __init__(self, network_variables: dict, computer_states: list):
+        """
+        Rebuilds the partition's computers.
+
+        Args:
+            network_variables (dict): The network variables of the run.
+            computer_states (list): (index in the network, attribute dictionary) pairs, in network order.
+        """
+        self.delay_type = network_variables.get('Delay', 'Random')
+        self.delay_floor = float(network_variables.get('Delay Floor', 0))
+        self.display_type = 'Text'
+        self.logging_type = 'Short'
+        self.trace_file = None
+        self.track_changes = False
+        self.change_trace_file = None
+        self.message_queue = PartitionOutbox()
+
+        algorithm_module = initializationModule.import_algorithm_module(network_variables['Algorithm'])
+        self.connected_computers = []
+        self.network_dict = {}
+        self.global_index = {}
+        for index, state in computer_states:
+            comp = Computer()
+            comp.__dict__.update(state)
+            comp.algorithm_file = algorithm_module
+            comp.reset_flag()
+            self.connected_computers.append(comp)
+            self.network_dict[comp.id] = comp
+            self.global_index[comp.id] = index
+
+
+def partition_worker(connection, network_variables, computer_states, owner, partition, seed):
+    """
+    Worker process simulating one partition, driven by the coordinator through `connection`.
+
+    Protocol: after running `init` the worker replies ("ready", remote, next_time). Then, for every
+    ("window", end, ranks, incoming) command it ranks the messages sent in the previous window, queues the
+    incoming messages, processes its messages arriving before `end` and replies
+    ("done", keys, remote, next_time). A ("finish",) command makes it reply ("states", states, sent, time).
+
+    Args:
+        connection (multiprocessing.connection.Connection): The connection to the coordinator.
+        network_variables (dict): The network variables of the run.
+        computer_states (list): (index in the network, attribute dictionary) pairs of the partition.
+        owner (dict): A dictionary mapping every computer ID to its partition index.
+        partition (int): The index of this partition.
+        seed (int): Seed for this worker's random delays.
+    """
+    try:
+        random.seed(seed)
+        network = PartitionNetwork(network_variables, computer_states)
+        comm = communication.Communication(network)
+        outbox = network.message_queue
+        heap = []
+        pending = []  # local messages sent in the last window, waiting for their parent's rank
+        sent_count = 0
+        last_time = 0
+
+        def dispatch(sent, ranks):
+            # Keys messages sent to this partition, returns the ones sent to other partitions.
+            remote = []
+            for item in sent:
+                parent, seq, arrival_time, source_id, dest_id, content = item
+                if owner[dest_id] != partition:
+                    remote.append(item)
+                elif parent < 0 and ranks is None:  # the parent's rank is not known yet
+                    pending.append(item)
+                else:
+                    rank = ranks[-1 - parent] if parent < 0 else parent
+                    heapq.heappush(heap, Message(arrival_time, (rank, seq), source_id, dest_id, content))
+            return remote
+
+        def next_time():
+            times = [message.arrival_time for message in heap[:1]] + [item[2] for item in pending]
+            return min(times, default=math.inf)
+
+        for comp in network.connected_computers:
+            outbox.current = network.global_index[comp.id]
+            comm.run_algorithmm(comp, 'init')
+        sent = outbox.take()
+        sent_count += len(sent)
+        remote = dispatch(sent, [])
+        connection.send(("ready", remote, next_time()))
+
+        while True:
+            command = connection.recv()
+            if command[0] == "finish":
+                sys.stdout.flush()
+                states = {comp.id: computer_state(comp) for comp in network.connected_computers}
+                connection.send(("states", states, sent_count, last_time))
+                return
+
+            _, window_end, ranks, incoming = command
+            resolved, pending[:] = list(pending), []
+            dispatch(resolved, ranks)
+            for message in incoming:
+                heapq.heappush(heap, message)
+
+            keys = []
+            while heap and heap[0].arrival_time < window_end:
+                message = heapq.heappop(heap)
+                keys.append((message.arrival_time, message.counter))
+                outbox.current = -1 - (len(keys) - 1)
+                comm.receive_message(message, comm)
+                last_time = message.arrival_time
+
+            sent = outbox.take()
+            sent_count += len(sent)
+            remote = dispatch(sent, None)
+            connection.send(("done", keys, remote, next_time()))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+
+
+def run_partitioned(network: initializationModule.Initialization, partitions=None) -> dict:
+    """
+    Runs the algorithm with the parallel engine, then copies the final node states back into the network.
+
+    Args:
+        network (Initialization): The initialized network. Only the Text display is supported.
+        partitions (int, optional): The number of partitions (worker processes). Defaults to the network's
+            'Partitions' variable.
+
+    Returns:
+        dict: The number of messages sent, the final simulated time and the number of windows.
+
+    Raises:
+        ValueError: If the display type is not Text, changes or messages are traced, messages are logged, the node
+            store is Columnar or the delays have no positive lower bound.
+        RuntimeError: If a worker process fails.
+    """
+    if network.display_type != "Text" or network.change_trace_file:
+        raise ValueError("The Parallel engine only supports the Text display, without a change trace")
+    if network.trace_file or network.logging_type == "Long":
+        raise ValueError("The Parallel engine does not trace or log the delivered messages: use Short or Medium logging, without a trace file")
+    if network.node_store is not None:
+        raise ValueError("The Parallel engine only supports the Objects node store")
+    step = lookahead(network)
+    partitions = max(1, min(partitions or network.partitions, network.computer_number))
+
+    owner = partition_computers(network, partitions)
+    partition_states = [[] for _ in range(partitions)]
+    for index, comp in enumerate(network.connected_computers):
+        partition_states[owner[comp.id]].append((index, computer_state(comp)))
+
+    network_variables = {
+        'Delay': network.delay_type,
+        'Delay Floor': network.delay_floor,
+        'Algorithm': network.algorithm_path,
+    }
+    connections = []
+    processes = []
+    for partition in range(partitions):
+        parent_end, child_end = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=partition_worker,
+            args=(child_end, network_variables, partition_states[partition], owner, partition, random.getrandbits(64)),
+            daemon=True)
+        process.start()
+        connections.append(parent_end)
+        processes.append(process)
+
+    def receive(connection):
+        reply = connection.recv()
+        if reply[0] == "error":
+            raise RuntimeError(f"Parallel engine worker failed:\n{reply[1]}")
+        return reply
+
+    try:
+        incoming = [[] for _ in range(partitions)]
+        ranks = [[] for _ in range(partitions)]
+        rank_base = network.computer_number  # init calls take ranks 0 .. n - 1
+        next_times = []
+        for connection in connections:
+            _, remote, next_time = receive(connection)
+            route(remote, None, owner, incoming)
+            next_times.append(next_time)
+
+        windows = 0
+        while True:
+            start_time = min(next_times + [message.arrival_time for messages in incoming for message in messages])
+            if start_time == math.inf:
+                break
+            for partition, connection in enumerate(connections):
+                connection.send(("window", start_time + step, ranks[partition], incoming[partition]))
+            replies = [receive(connection) for connection in connections]
+            windows += 1
+
+            # rank the events of the window in global (arrival_time, counter) order
+            all_keys = [reply[1] for reply in replies]
+            ranks = [[0] * len(keys) for keys in all_keys]
+            merged = heapq.merge(*[[(key, partition, position) for position, key in enumerate(keys)]
+                                   for partition, keys in enumerate(all_keys)])
+            for rank, (_, partition, position) in enumerate(merged, start=rank_base):
+                ranks[partition][position] = rank
+            rank_base += sum(len(keys) for keys in all_keys)
+
+            incoming = [[] for _ in range(partitions)]
+            next_times = []
+            for partition, (_, _, remote, next_time) in enumerate(replies):
+                route(remote, ranks[partition], owner, incoming)
+                next_times.append(next_time)
+
+        sent = 0
+        for connection in connections:
+            connection.send(("finish",))
+        for connection in connections:
+            _, states, worker_sent, last_time = receive(connection)
+            sent += worker_sent
+            network.current_time = max(network.current_time, last_time)
+            for comp_id, state in states.items():
+                del state['connectedEdges'], state['delays']  # keep the views of the network's adjacency and delay table
+                network.network_dict[comp_id].__dict__.update(state)
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    return {'messages_sent': sent, 'final_time': network.current_time, 'windows': windows}
+
+
+def route(remote: list, ranks, owner: dict, incoming: list):
+    """
+    Keys messages sent across partitions and routes them to the partition of their destination.
+
+    Args:
+        remote (list): (parent, seq, arrival_time, source_id, dest_id, content) tuples.
+        ranks (list): The ranks of the sending partition's events in the last window, or None for messages
+            sent by `init` calls, whose parent is already a rank.
+        owner (dict): A dictionary mapping every computer ID to its partition index.
+        incoming (list): One list of messages per partition, extended in place.
+    """
+    for parent, seq, arrival_time, source_id, dest_id, content in remote:
+        rank = parent if parent >= 0 else ranks[-1 - parent]
+        incoming[owner[dest_id]].append(Message(arrival_time, (rank, seq), source_id, dest_id, content))
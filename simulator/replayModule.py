@@ -0,0 +1,239 @@
+"""
+Recorded node changes, for replaying a run in the graph visualizer.
+
+A headless run with a change trace file records the initial public attributes of every computer and then
+every (computer ID, {field: (old value, new value)}) change, the same records the Graph display collects in
+`Initialization.node_values_change`. `ReplayNetwork` reads such a file back as a stand-in for the network
+of the graph window, streaming the changes from disk as they are applied, so a run can be shown without
+re-running the algorithm and without holding all of its changes in memory.
+
+A change trace is a gzip-compressed stream of pickles: a header dictionary, then lists of change records.
+Change traces are pickles: only replay files you trust.
+"""
+
+import gzip
+import pickle
+
+from simulator.changeLogModule import ChangeLog, MEMORY_RECORDS
+
+CHANGE_TRACE_VERSION = 1
+CHUNK_RECORDS = 1 << 14  # change records per pickled chunk
+
+
+def public_state(comp, algorithm_path) -> dict:
+    """
+    Returns the attributes of a computer shown by the graph window.
+
+    Args:
+        comp (Computer): The computer.
+        algorithm_path (str): The path of the algorithm module, shown instead of the module itself.
+
+    Returns:
+        dict: The public attributes of the computer, with its connected edges and delays as lists.
+    """
+    state = {key: value for key, value in comp.__dict__.items() if not key.startswith('_')}
+    state['algorithm_file'] = algorithm_path
+    state['connectedEdges'] = list(comp.connectedEdges)
+    state['delays'] = list(comp.delays)
+    return state
+
+
+class ChangeTraceWriter:
+    """
+    Writes the changes of the computers to a change trace file.
+
+    The writer takes the place of the network's `node_values_change`: the communication appends the change
+    records to it, and they are written in chunks.
+
+    Attributes:
+        file (gzip.GzipFile): The open change trace file.
+        records (list): The change records not written yet.
+        chunk_records (int): The number of change records per chunk.
+    """
+
+    def __init__(self, path, network, chunk_records=CHUNK_RECORDS):
+        """
+        Creates the change trace file and writes the initial state of the network's computers.
+
+        Args:
+            path (str): The path of the change trace file.
+            network (Initialization): The network, before the algorithm runs.
+            chunk_records (int, optional): The number of change records per chunk. Defaults to CHUNK_RECORDS.
+        """
+        self.file = gzip.open(path, 'wb', compresslevel=1)
+        header = {
+            'version': CHANGE_TRACE_VERSION,
+            'computers': [public_state(comp, network.algorithm_path) for comp in network.connected_computers],
+        }
+        pickle.dump(header, self.file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.records = []
+        self.chunk_records = chunk_records
+
+    def append(self, record):
+        """
+        Records a change.
+
+        Args:
+            record (tuple): The (computer ID, {field: (old value, new value)}) change.
+        """
+        self.records.append(record)
+        if len(self.records) >= self.chunk_records:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered change records as a chunk.
+        """
+        if self.records:
+            pickle.dump(self.records, self.file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.records = []
+
+    def close(self):
+        """
+        Writes the remaining change records and closes the file. Closing twice does nothing.
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+
+class ChangeTraceReader:
+    """
+    Streams the change records of a change trace file.
+
+    The reader takes the place of the network's `node_values_change` in the graph window: records are read
+    chunk by chunk as they are popped, and records given back by undo are kept in a `ChangeLog` in front of
+    the rest of the file.
+
+    Attributes:
+        computers (list): The initial public attributes of every computer.
+        front (ChangeLog): The records read or given back, before the unread part of the file.
+        file (gzip.GzipFile): The open change trace file, or None once it is read to the end.
+    """
+
+    def __init__(self, path, memory_records=MEMORY_RECORDS):
+        """
+        Opens a change trace file and reads its header.
+
+        Args:
+            path (str): The path of the change trace file.
+            memory_records (int, optional): The number of records held in memory before spilling.
+                Defaults to MEMORY_RECORDS.
+
+        Raises:
+            ValueError: If the file is not a change trace.
+        """
+        try:
+            self.file = gzip.open(path, 'rb')
+            header = pickle.load(self.file)
+        except (OSError, pickle.UnpicklingError, EOFError) as error:
+            raise ValueError(f"{path} is not a change trace file: {error}")
+        if not isinstance(header, dict) or header.get('version') != CHANGE_TRACE_VERSION:
+            raise ValueError(f"{path} is not a version {CHANGE_TRACE_VERSION} change trace")
+        self.computers = header['computers']
+        self.front = ChangeLog(memory_records)
+
+    def fill(self):
+        """
+        Reads the next chunk of the file if no record is left in front of it.
+        """
+        while not self.front and self.file is not None:
+            try:
+                chunk = pickle.load(self.file)
+            except EOFError:
+                self.file.close()
+                self.file = None
+                return
+            for record in chunk:
+                self.front.append(record)
+
+    def __bool__(self) -> bool:
+        """
+        Returns whether records are left.
+
+        Returns:
+            bool: True if a record can be popped, False otherwise.
+        """
+        self.fill()
+        return bool(self.front)
+
+    def popleft(self):
+        """
+        Removes and returns the next change record.
+
+        Returns:
+            tuple: The (computer ID, {field: (old value, new value)}) change.
+
+        Raises:
+            IndexError: If no record is left.
+        """
+        self.fill()
+        return self.front.popleft()
+
+    def appendleft(self, record):
+        """
+        Gives back a change record, which will be popped next.
+
+        Args:
+            record (tuple): The (computer ID, {field: (old value, new value)}) change.
+        """
+        self.front.appendleft(record)
+
+
+class ReplayComputer:
+    """
+    The recorded attributes of a computer, standing in for a `Computer` in the graph window.
+    """
+
+    def __init__(self, values: dict):
+        """
+        Initializes the computer with its recorded attributes.
+
+        Args:
+            values (dict): The public attributes of the computer.
+        """
+        self.__dict__.update(values)
+
+
+class ReplayNetwork:
+    """
+    A network read from a change trace, standing in for `Initialization` in the graph window.
+
+    Attributes:
+        connected_computers (list): The `ReplayComputer` of every computer, in their initial state.
+        network_dict (dict): A dictionary mapping computer IDs to their `ReplayComputer`.
+        computer_number (int): The number of computers.
+        node_values_change (ChangeTraceReader): The recorded changes, streamed from the file.
+        display_type (str): Always "Graph".
+        change_log_records (int): The number of undo records held in memory before spilling.
+    """
+
+    def __init__(self, path, memory_records=MEMORY_RECORDS):
+        """
+        Opens a change trace.
+
+        Args:
+            path (str): The path of the change trace file.
+            memory_records (int, optional): The number of records held in memory before spilling.
+                Defaults to MEMORY_RECORDS.
+
+        Raises:
+            ValueError: If the file is not a change trace.
+        """
+        self.node_values_change = ChangeTraceReader(path, memory_records)
+        self.connected_computers = [ReplayComputer(values) for values in self.node_values_change.computers]
+        self.network_dict = {comp.id: comp for comp in self.connected_computers}
+        self.computer_number = len(self.connected_computers)
+        self.display_type = 'Graph'
+        self.change_log_records = memory_records
+
+    def edges(self):
+        """
+        Returns every edge of the network once.
+
+        Returns:
+            list: The (ID, ID) pairs of the edges, the smaller ID first.
+        """
+        return [(comp.id, neighbor) for comp in self.connected_computers for neighbor in comp.connectedEdges
+                if comp.id < neighbor]
@@ -0,0 +1,125 @@
+"""
+Parallel multi-seed replications of a simulation.
+
+This module runs many independent replications of the same network configuration over a process pool,
+each with its own reproducible seed, and aggregates the per-run statistics into a single table.
+"""
+
+import contextlib
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import simulator.headlessModule as headlessModule
+
+STATISTICS = ('messages_sent', 'final_time', 'net_creation_time', 'algorithm_run_time', 'wall_time')
+
+
+def derive_seeds(base_seed, runs) -> list:
+    """
+    Derives independent, reproducible seeds for every replication from a single base seed.
+
+    Args:
+        base_seed (int): The base seed.
+        runs (int): The number of replications.
+
+    Returns:
+        list of int: One seed per replication.
+    """
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(base_seed).spawn(runs)]
+
+
+def run_replication(network_variables: dict, seed: int) -> dict:
+    """
+    Runs a single replication with all of its output discarded.
+
+    Args:
+        network_variables (dict): The network variables for the run.
+        seed (int): The seed of this replication.
+
+    Returns:
+        dict: The seed and the statistics of the run.
+    """
+    network_variables = dict(network_variables, Logging='Short')
+    network_variables.pop('Trace File', None)  # replications run concurrently and are not traced
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        network, _, timings = headlessModule.run_headless(network_variables, seed)
+
+    return {
+        'seed': seed,
+        'messages_sent': network.message_queue.counter,
+        'final_time': network.current_time,
+        'net_creation_time': timings['net_creation'],
+        'algorithm_run_time': timings['algorithm_run'],
+        'wall_time': timings['total'],
+    }
+
+
+def run_replications(network_variables: dict, runs: int, workers=None, base_seed=0) -> list:
+    """
+    Runs replications of the same configuration over a process pool.
+
+    Args:
+        network_variables (dict): The network variables for every run.
+        runs (int): The number of replications.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        base_seed (int, optional): The seed from which the replication seeds are derived. Defaults to 0.
+
+    Returns:
+        list of dict: The statistics of every replication, in replication order.
+    """
+    seeds = derive_seeds(base_seed, runs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_replication, [network_variables] * runs, seeds))
+
+    for index, result in enumerate(results):
+        result['run'] = index
+    return results
+
+
+def summarize(results: list) -> dict:
+    """
+    Aggregates the statistics of the replications.
+
+    Args:
+        results (list of dict): The statistics of every replication.
+
+    Returns:
+        dict: For every statistic, its mean, standard deviation, minimum, maximum and the half-width of
+        its 95% confidence interval (normal approximation).
+    """
+    summary = {}
+    for name in STATISTICS:
+        values = np.array([result[name] for result in results], dtype=float)
+        std = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+        summary[name] = {
+            'mean': float(values.mean()),
+            'std': std,
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'ci95': 1.96 * std / math.sqrt(len(values)),
+        }
+    return summary
+
+
+def format_table(results: list, summary: dict) -> str:
+    """
+    Formats the per-run statistics and their summary as a text table.
+
+    Args:
+        results (list of dict): The statistics of every replication.
+        summary (dict): The summary returned by `summarize`.
+
+    Returns:
+        str: The table.
+    """
+    header = f"{'run':>5} {'seed':>20} " + " ".join(f"{name:>18}" for name in STATISTICS)
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(f"{result['run']:>5} {result['seed']:>20} " + " ".join(f"{result[name]:>18.6g}" for name in STATISTICS))
+    lines.append("-" * len(header))
+    for key in ('mean', 'std', 'ci95', 'min', 'max'):
+        lines.append(f"{key:>26} " + " ".join(f"{summary[name][key]:>18.6g}" for name in STATISTICS))
+    return "\n".join(lines)
@@ -4,27 +4,225 @@ Main module to run the network simulation.
 This module initializes the network, runs the algorithms on each computer, and manages the message queue for the simulation.
 """
 
+from itertools import repeat
+from operator import itemgetter
+
 import simulator.initializationModule as initializationModule
 import simulator.communication as communication
+import simulator.checkpointModule as checkpointModule
+import simulator.parallelModule as parallelModule
+
+
+class RoundBuffer:
+    """
+    Collects the messages sent during a round of the round-synchronous engine.
+
+    While a round is delivered, the buffer stands in for the network's message queue. Every sent message is
+    tagged with the position of the message being processed when it was sent, so the messages can be pushed
+    into the real queue in the order the event-driven engine would have sent them.
+
+    Attributes:
+        current (int): The position, in the round, of the message being processed.
+        sent (list): (position, arrival_time, source_id, dest_id, content, multicast) tuples, in sending order.
+            For a multicast, `dest_id` is the list of destination IDs.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty round buffer.
+        """
+        self.current = 0
+        self.sent = []
+
+    def push(self, arrival_time, source_id, dest_id, content):
+        """
+        Records a message sent while processing the current message.
+
+        Args:
+            arrival_time (float): The time at which the message arrives.
+            source_id (int): The ID of the source computer.
+            dest_id (int): The ID of the destination computer.
+            content (str): The content of the message.
+        """
+        self.sent.append((self.current, arrival_time, source_id, dest_id, content, False))
+
+    def push_many(self, arrival_times, source_id, dest_ids, content):
+        """
+        Records the messages of a fan-out sent while processing the current message.
+
+        Args:
+            arrival_times (list): The arrival time of every message.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        current = self.current
+        self.sent.extend((current, arrival_time, source_id, dest_id, content, False) for arrival_time, dest_id in zip(arrival_times, dest_ids))
+
+    def push_multicast(self, arrival_time, source_id, dest_ids, content):
+        """
+        Records a fan-out whose messages share an arrival time, kept as a single multicast.
 
-def initiateRun(network: initializationModule.Initialization, comm : communication.Communication):
+        Args:
+            arrival_time (float): The time at which the messages arrive.
+            source_id (int): The ID of the source computer.
+            dest_ids (list): The ID of every destination computer.
+            content (str): The content shared by the messages.
+        """
+        self.sent.append((self.current, arrival_time, source_id, dest_ids, content, True))
+
+    def flush(self, message_queue):
+        """
+        Pushes the recorded messages into the message queue, in event-driven sending order.
+
+        Args:
+            message_queue: The network's message queue.
+        """
+        self.sent.sort(key=itemgetter(0))  # stable, keeps the sending order of each message
+        for _, arrival_time, source_id, dest_id, content, multicast in self.sent:
+            if multicast:
+                message_queue.push_multicast(arrival_time, source_id, dest_id, content)
+            else:
+                message_queue.push(arrival_time, source_id, dest_id, content)
+        self.sent.clear()
+
+
+def initiateRun(network: initializationModule.Initialization, comm : communication.Communication, resumed=False):
     """
     Runs the network algorithm on the created network.
 
     This function runs the `init` function on every computer in the network, enqueues messages,
     and processes the messages by running the main algorithm until the message queue is empty.
+    The network's engine type selects between the event-driven, the round-synchronous and the parallel engine.
+    If the network has a checkpoint file, the event-driven and round-synchronous engines write a checkpoint
+    every `checkpoint_every` delivered messages (at the end of a round for the round-synchronous engine).
 
     Args:
         network (Initialization): The initialized network with connected computers.
         comm (Communication): The communication object handling message passing between computers.
+        resumed (bool, optional): Whether the network was restored from a checkpoint, in which case the
+            `init` functions already ran. Defaults to False.
     """
-    # runs init() for every computer which must be defined, and puting messages into the network queue
-    for comp in network.connected_computers:
-        comm.run_algorithmm(comp, 'init')
+    comm.start_run()
+    try:
+        if network.engine_type == "Parallel":
+            stats = parallelModule.run_partitioned(network)
+            network.message_queue.counter = stats['messages_sent']
+            return
+
+        if not resumed:
+            # runs init() for every computer which must be defined, and puting messages into the network queue
+            for comp in network.connected_computers:
+                comm.run_algorithmm(comp, 'init')
+
+            print("************************************************************************************")
+
+        if network.engine_type == "Round":
+            run_rounds(network, comm)
+        else:
+            run_events(network, comm)
+    finally:
+        comm.finish_run()
 
-    print("************************************************************************************")
 
+def run_events(network: initializationModule.Initialization, comm : communication.Communication):
+    """
+    Event-driven engine: pops and delivers one message at a time until the message queue is empty.
+
+    Args:
+        network (Initialization): The initialized network with connected computers.
+        comm (Communication): The communication object handling message passing between computers.
+    """
+    if not network.checkpoint_file:
+        deliver_events(network, comm)
+        return
+
+    while deliver_events(network, comm, network.checkpoint_every):
+        checkpointModule.save_checkpoint(network.checkpoint_file, network)
+
+
+def deliver_events(network: initializationModule.Initialization, comm : communication.Communication, limit=None) -> bool:
+    """
+    Pops and delivers messages one at a time until the message queue is empty or the limit is reached.
+
+    Args:
+        network (Initialization): The initialized network with connected computers.
+        comm (Communication): The communication object handling message passing between computers.
+        limit (int, optional): The largest number of messages to deliver. Defaults to None (no limit).
+
+    Returns:
+        bool: True if messages are left in the queue, False otherwise.
+    """
     ## runs mainAlgorithm
-    while not network.message_queue.empty():
-        message = network.message_queue.pop()
-        comm.receive_message(message, comm)
\ No newline at end of file
+    message_queue = network.message_queue
+    message = None
+    for _ in repeat(None) if limit is None else repeat(None, limit):
+        if message_queue.empty():
+            break
+        message = message_queue.pop()
+        comm.receive_message(message, comm)
+
+    if message is not None:
+        network.current_time = message.arrival_time
+    return not message_queue.empty()
+
+
+def run_rounds(network: initializationModule.Initialization, comm : communication.Communication):
+    """
+    Round-synchronous engine: delivers all the messages of the earliest arrival time at once.
+
+    The messages of a round are grouped by destination and every destination receives its batch in a single
+    call. Messages sent during the round are held back in a `RoundBuffer` and pushed into the queue at the
+    end of the round in the order the event-driven engine would have sent them, so both engines reach the
+    same final node states. Since every delay is positive, no message sent in a round arrives in that round.
+    When every destination's messages are contiguous in the round, grouping does not change the order and
+    messages are sent straight into the queue.
+
+    Args:
+        network (Initialization): The initialized network with connected computers.
+        comm (Communication): The communication object handling message passing between computers.
+    """
+    message_queue = network.message_queue
+    network_dict = network.network_dict
+    log = comm.trace.write if comm.trace is not None else print if network.logging_type == "Long" else None
+    outbox = RoundBuffer()
+    delivered = 0
+    next_checkpoint = network.checkpoint_every
+
+    while not message_queue.empty():
+        if network.checkpoint_file and delivered >= next_checkpoint:
+            checkpointModule.save_checkpoint(network.checkpoint_file, network)
+            next_checkpoint = delivered + network.checkpoint_every
+
+        messages = message_queue.pop_round()
+        network.current_time = messages[0].arrival_time
+        delivered += len(messages)
+
+        batches = {}  # destination ID -> positions of its messages in the round
+        in_order = True  # whether grouping by destination keeps the original message order
+        previous_dest = None
+        for index, message in enumerate(messages):
+            if log is not None:
+                log(message)
+            dest_id = message.dest_id
+            batch = batches.get(dest_id)
+            if batch is None:
+                batches[dest_id] = [index]
+            else:
+                batch.append(index)
+                if dest_id != previous_dest:
+                    in_order = False
+            previous_dest = dest_id
+
+        if in_order:  # messages can be sent straight into the queue
+            for dest_id, batch in batches.items():
+                comm.receive_batch(network_dict.get(dest_id), messages, batch, outbox)
+            continue
+
+        network.message_queue = outbox
+        try:
+            for dest_id, batch in batches.items():
+                comm.receive_batch(network_dict.get(dest_id), messages, batch, outbox)
+        finally:
+            network.message_queue = message_queue
+        outbox.flush(message_queue)
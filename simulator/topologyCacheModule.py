@@ -0,0 +1,182 @@
+"""
+On-disk cache of generated networks.
+
+A seeded network is fully determined by its configuration and seed, so its generated part (the computer
+IDs, the root, the CSR adjacency and the edge delays) can be saved once and loaded by later runs, e.g. when
+sweeping algorithms over the same network. Every cache entry is a directory of raw `.npy` arrays, loaded
+as read-only `numpy.memmap`s so that loading does not read the arrays up front and concurrent processes
+share the same pages, and a `meta.json` file with the cache version, the key of the entry, the root and
+the state of the random number generators after the network was generated, which loading restores so a
+cached run continues exactly like an uncached one.
+
+Entries are keyed by (topology, number of computers, ID type, root type, seed) and the other network
+variables the generated network depends on. File topologies are keyed by the path, size and modification
+time of their edge list instead of the number of computers, and their entries also hold the edge list label
+of every computer, so a cached File network is loaded without reading its edge list.
+"""
+
+import hashlib
+import json
+import os
+import random
+import shutil
+
+import numpy as np
+
+CACHE_VERSION = 2
+ARRAYS = ('computer_ids', 'adjacency_offsets', 'adjacency', 'neighbor_ids', 'edges_delays')
+OPTIONAL_ARRAYS = ('positions', 'node_labels')  # the Distance delays and the File topology
+
+
+def cache_key(network) -> dict:
+    """
+    Returns the network variables that determine a generated network.
+
+    Args:
+        network (Initialization): The network, before its computers are created.
+
+    Returns:
+        dict: The key of the network's cache entry, or None if the edge list of a File topology cannot be
+        found, so that reading it reports the error.
+    """
+    key = {
+        'topology': network.topologyType,
+        'computers': network.computer_number if network.topologyType != "File" else None,
+        'id_type': network.id_type,
+        'root_type': network.root_type,
+        'seed': network.seed,
+        'degree': network.degree,
+        'rewiring': network.rewiring,
+        'delay_type': network.delay_type,
+        'delay_floor': network.delay_floor,
+    }
+    if network.topologyType == "File":
+        try:
+            stat = os.stat(network.topology_file)
+        except (OSError, TypeError):
+            return None
+        key['topology_file'] = [os.path.abspath(network.topology_file), stat.st_size, stat.st_mtime_ns]
+    return key
+
+
+def entry_path(directory, key) -> str:
+    """
+    Returns the directory of a cache entry.
+
+    Args:
+        directory (str): The cache directory.
+        key (dict): The key of the entry.
+
+    Returns:
+        str: The path of the entry's directory.
+    """
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:20]
+    if key['computers'] is None:  # a File topology
+        return os.path.join(directory, f"{key['topology']}-{digest}")
+    return os.path.join(directory, f"{key['topology']}-{key['computers']}-{digest}")
+
+
+def save_topology(path, network, key):
+    """
+    Saves the generated part of a network as a cache entry.
+
+    The entry is written to a temporary directory that is then renamed, so other processes never see a
+    partial entry. If a valid entry for the key is already there, e.g. saved by another process first, it
+    is kept and the new one is discarded; only a stale entry, of another version or key, is replaced.
+
+    Args:
+        path (str): The path of the entry's directory.
+        network (Initialization): The network, right after its delays were created.
+        key (dict): The key of the entry.
+    """
+    temporary_path = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(temporary_path, exist_ok=True)
+    for name in ARRAYS:
+        np.save(os.path.join(temporary_path, name + '.npy'), getattr(network, name))
+    for name in OPTIONAL_ARRAYS:
+        if getattr(network, name, None) is not None:
+            np.save(os.path.join(temporary_path, name + '.npy'), getattr(network, name))
+
+    root = next((index for index, comp in enumerate(network.connected_computers) if comp.is_root), None)
+    python_state = random.getstate()
+    numpy_state = np.random.get_state()
+    meta = {
+        'version': CACHE_VERSION,
+        'key': key,
+        'root': root,
+        'random_state': [python_state[0], list(python_state[1]), python_state[2]],
+        'numpy_random_state': [numpy_state[0], numpy_state[1].tolist(), *numpy_state[2:]],
+        'rng_state': network.rng.bit_generator.state,
+    }
+    with open(os.path.join(temporary_path, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+
+    try:
+        os.rename(temporary_path, path)
+        return
+    except OSError:
+        pass
+    if open_entry(path, key) is None:
+        shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.rename(temporary_path, path)
+            return
+        except OSError:
+            pass
+    shutil.rmtree(temporary_path, ignore_errors=True)
+
+
+def open_entry(path, key) -> dict:
+    """
+    Opens a cache entry, memory-mapping its arrays read-only.
+
+    Args:
+        path (str): The path of the entry's directory.
+        key (dict): The key of the entry.
+
+    Returns:
+        dict: The entry's metadata ('meta') and arrays ('arrays'), or None if there is no valid entry for
+        the key.
+    """
+    try:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION or meta.get('key') != key:
+            return None
+        arrays = {name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r') for name in ARRAYS}
+        for name in OPTIONAL_ARRAYS:
+            optional_path = os.path.join(path, name + '.npy')
+            if os.path.exists(optional_path):
+                arrays[name] = np.load(optional_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    return {'meta': meta, 'arrays': arrays}
+
+
+def load_topology(entry, network):
+    """
+    Loads an open cache entry into a network whose computers were just created.
+
+    The computers get their IDs, root flag and views, and the random number generators are put back in
+    the state they had after the network was generated.
+
+    Args:
+        entry (dict): The entry returned by `open_entry`.
+        network (Initialization): The network, with `len(entry['arrays']['computer_ids'])` computers.
+    """
+    meta = entry['meta']
+    arrays = dict(entry['arrays'])
+    network.assign_computer_ids(arrays.pop('computer_ids'))
+    if meta['root'] is not None:
+        network.connected_computers[meta['root']].is_root = True
+    for name, array in arrays.items():
+        setattr(network, name, array)
+    network.attach_adjacency_views()
+    network.attach_delay_views()
+
+    version, internal_state, gauss_next = meta['random_state']
+    random.setstate((version, tuple(internal_state), gauss_next))
+    name, keys, position, has_gauss, cached_gaussian = meta['numpy_random_state']
+    np.random.set_state((name, np.array(keys, dtype=np.uint32), position, has_gauss, cached_gaussian))
+    network.rng = np.random.default_rng()
+    network.rng.bit_generator.state = meta['rng_state']
@@ -0,0 +1,638 @@
+"""
+Vectorized generators of standard model topologies.
+
+Every generator returns the edges of the topology as two NumPy arrays holding the indices of their
+endpoints, the input of `Initialization.build_adjacency`, without building per-computer lists, so that
+million-node networks are generated in seconds. Duplicate edges and self-loops in the output are dropped
+when the adjacency is built.
+
+Every topology is connected by construction, in a single pass: the models that can come out disconnected
+(Gnp, Gnm, Watts-Strogatz and the Random topology) get one extra edge per extra component, joining it to a
+random computer of the components before it, and Regular joins its components with degree-preserving edge
+swaps.
+
+The random models draw from a NumPy generator and take their size from the 'Degree' network variable, the
+average (Gnp, Gnm), attachment (Barabasi-Albert), lattice (Watts-Strogatz) or exact (Regular) degree:
+
+    Gnp              Erdős–Rényi G(n, p), every edge present with probability p = degree / (n - 1)
+    Gnm              Erdős–Rényi G(n, m), m = n * degree / 2 edges drawn uniformly
+    Barabasi-Albert  preferential attachment, every new computer attaches to degree / 2 earlier ones
+    Watts-Strogatz   ring lattice of the given degree, every edge rewired with probability 'Rewiring'
+    Regular          random degree-regular graph
+    Grid, Torus      2D grid of about sqrt(n) x sqrt(n) computers, without and with wrap-around
+    Hypercube        computers i and j are connected if their indices differ in exactly one bit
+    Ring             every computer is connected to the next one, and the last one to the first
+"""
+
+import math
+
+import numpy as np
+
+TOPOLOGIES = ["Gnp", "Gnm", "Barabasi-Albert", "Watts-Strogatz", "Regular", "Grid", "Torus", "Hypercube", "Ring"]
+DEGREE = 4  # default degree of the Barabasi-Albert, Watts-Strogatz and Regular topologies
+REWIRING = 0.1  # default rewiring probability of the Watts-Strogatz topology
+REGULAR_PAIRINGS = 10  # random stub pairings the Regular topology tries before giving up
+REGULAR_ROUNDS = 1000  # rounds of edge swaps that fix the bad edges of a pairing before it is dropped
+
+
+class UnionFind:
+    """
+    A class to represent the Union-Find (Disjoint Set) data structure over array indices.
+
+    Whole arrays of edges are united at once: every round hooks the larger root of each edge under the
+    smaller one and then compresses the paths, so every root ends up as the smallest index of its set.
+
+    Attributes:
+        parent (numpy.ndarray): The parent pointers for each node.
+    """
+
+    def __init__(self, size):
+        """
+        Initializes the Union-Find structure with a given size.
+        
+        Args:
+            size (int): Number of elements (nodes).
+        """
+        self.parent = np.arange(size, dtype=np.int64)
+
+    def compress(self):
+        """
+        Points every node directly at its root (path compression).
+        """
+        parent = self.parent
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return
+            parent[:] = grandparent
+
+    def union_edges(self, first, second):
+        """
+        Unites the two endpoints of every edge.
+
+        Args:
+            first (numpy.ndarray): The index of one endpoint of every edge.
+            second (numpy.ndarray): The index of the other endpoint of every edge.
+        """
+        parent = self.parent
+        while True:
+            self.compress()
+            first_roots, second_roots = parent[first], parent[second]
+            apart = first_roots != second_roots
+            if not apart.any():
+                return
+            first, second = first[apart], second[apart]
+            first_roots, second_roots = first_roots[apart], second_roots[apart]
+            np.minimum.at(parent, np.maximum(first_roots, second_roots), np.minimum(first_roots, second_roots))
+
+    def roots(self) -> np.ndarray:
+        """
+        Returns the root of every node.
+
+        Returns:
+            numpy.ndarray: The root of every node, the smallest index of its set.
+        """
+        self.compress()
+        return self.parent
+
+
+def component_roots(first, second, n) -> np.ndarray:
+    """
+    Returns the connected components of a graph.
+
+    Args:
+        first (numpy.ndarray): The index of one endpoint of every edge.
+        second (numpy.ndarray): The index of the other endpoint of every edge.
+        n (int): The number of computers.
+
+    Returns:
+        numpy.ndarray: The root of every computer's component, the smallest index in it. The graph is
+        connected if every root is 0.
+    """
+    uf = UnionFind(n)
+    uf.union_edges(np.asarray(first, dtype=np.int64), np.asarray(second, dtype=np.int64))
+    return uf.roots()
+
+
+def join_components(first, second, roots, rng) -> tuple:
+    """
+    Connects a graph by joining every component but the first to a uniformly chosen computer of the
+    components before it, from a uniformly chosen computer of its own.
+
+    Args:
+        first (numpy.ndarray): The index of one endpoint of every edge.
+        second (numpy.ndarray): The index of the other endpoint of every edge.
+        roots (numpy.ndarray): The root of every computer's component, from `component_roots`.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The edges with the joining edges added, as two numpy arrays.
+    """
+    # the computers grouped by component, the components in the order of their roots
+    order = np.argsort(roots, kind='stable')
+    starts = np.flatnonzero(np.concatenate(([True], roots[order][1:] != roots[order][:-1])))
+    if len(starts) <= 1:
+        return first, second
+    ends = np.append(starts[1:], len(order))
+    starts, ends = starts[1:], ends[1:]
+    inside = order[starts + (rng.random(len(starts)) * (ends - starts)).astype(np.int64)]
+    before = order[(rng.random(len(starts)) * starts).astype(np.int64)]
+    return np.concatenate((first, inside)), np.concatenate((second, before))
+
+
+def connect(first, second, n, rng) -> tuple:
+    """
+    Joins the components of a graph, if it has more than one.
+
+    Args:
+        first (numpy.ndarray): The index of one endpoint of every edge.
+        second (numpy.ndarray): The index of the other endpoint of every edge.
+        n (int): The number of computers.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The edges of the connected graph, as two numpy arrays.
+    """
+    roots = component_roots(first, second, n)
+    if not roots.any():
+        return first, second
+    return join_components(first, second, roots, rng)
+
+
+def default_degree(topology, n) -> int:
+    """
+    Returns the degree of a topology when the 'Degree' network variable is not set.
+
+    Gnp and Gnm default to an average degree of 2 ln(n), above their connectivity threshold of ln(n).
+
+    Args:
+        topology (str): The topology type.
+        n (int): The number of computers.
+
+    Returns:
+        int: The default degree.
+    """
+    if topology in ("Gnp", "Gnm"):
+        return max(DEGREE, math.ceil(2 * math.log(max(n, 2))))
+    return DEGREE
+
+
+def generate(topology, n, rng, degree=None, rewiring=REWIRING) -> tuple:
+    """
+    Generates the edges of a model topology.
+
+    Args:
+        topology (str): One of `TOPOLOGIES`.
+        n (int): The number of computers.
+        rng (numpy.random.Generator): The generator of the random models.
+        degree (int, optional): The degree of the random models, see the module docstring. Defaults to
+            `default_degree`. It is capped at n - 1.
+        rewiring (float, optional): The rewiring probability of Watts-Strogatz. Defaults to REWIRING.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+
+    Raises:
+        ValueError: If the topology is unknown or its parameters are invalid.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology {topology}")
+    if n < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if degree is None:
+        degree = default_degree(topology, n)
+    degree = min(int(degree), n - 1)
+    if degree < 1:
+        raise ValueError(f"The {topology} topology needs a positive 'Degree'")
+
+    if topology == "Gnp":
+        return connect(*gnp_edges(n, degree / (n - 1), rng), n, rng)
+    if topology == "Gnm":
+        return connect(*gnm_edges(n, n * degree // 2, rng), n, rng)
+    if topology == "Barabasi-Albert":
+        return barabasi_albert_edges(n, max(1, degree // 2), rng)
+    if topology == "Watts-Strogatz":
+        return connect(*watts_strogatz_edges(n, degree, rewiring, rng), n, rng)
+    if topology == "Regular":
+        return connect_regular(*regular_edges(n, degree, rng), n, rng)
+    if topology == "Grid":
+        return grid_edges(n)
+    if topology == "Torus":
+        return torus_edges(n)
+    if topology == "Hypercube":
+        return hypercube_edges(n)
+    return ring_edges(n)
+
+
+def prufer_edges(sequence, n) -> tuple:
+    """
+    Decodes a Prüfer sequence into the edges of its labeled tree, in linear time.
+
+    Every step joins the smallest leaf to the next element of the sequence. The leaves are found with the
+    degree counts of the computers and a pointer that only moves forward: a computer that becomes a leaf
+    below the pointer is joined at once, and one above it is reached by the pointer later.
+
+    Args:
+        sequence (list): The Prüfer sequence, n - 2 computer indices.
+        n (int): The number of computers.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    if n < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    degree = [1] * n
+    for node in sequence:
+        degree[node] += 1
+
+    first, second = [], []
+    pointer = degree.index(1)
+    leaf = pointer
+    for node in sequence:
+        first.append(leaf)
+        second.append(node)
+        degree[leaf] = 0
+        degree[node] -= 1
+        if degree[node] == 1 and node < pointer:
+            leaf = node
+        else:
+            pointer += 1
+            while degree[pointer] != 1:
+                pointer += 1
+            leaf = pointer
+    first.append(leaf)
+    second.append(n - 1)
+    return np.array(first, dtype=np.int64), np.array(second, dtype=np.int64)
+
+
+def pair_keys_to_edges(keys, n) -> tuple:
+    """
+    Splits edge keys low * n + high into their endpoints.
+
+    Args:
+        keys (numpy.ndarray): The edge keys.
+        n (int): The number of computers.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    return keys // n, keys % n
+
+
+def distinct_keys(keys) -> np.ndarray:
+    """
+    Returns the distinct keys of an array, sorted.
+
+    Args:
+        keys (numpy.ndarray): The keys.
+
+    Returns:
+        numpy.ndarray: The distinct keys, sorted.
+    """
+    keys = np.sort(keys)
+    if len(keys) == 0:
+        return keys
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+
+
+def sorted_contains(sorted_keys, keys) -> np.ndarray:
+    """
+    Tells which keys are in a sorted array, by binary search.
+
+    Args:
+        sorted_keys (numpy.ndarray): The sorted keys to look in.
+        keys (numpy.ndarray): The keys to look for.
+
+    Returns:
+        numpy.ndarray: Whether every key is in `sorted_keys`.
+    """
+    positions = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[positions] == keys
+
+
+def sample_edge_keys(n, m, rng) -> np.ndarray:
+    """
+    Draws m distinct edges uniformly among the n * (n - 1) / 2 possible ones.
+
+    Sparse samples draw random pairs until m distinct edges are found; dense samples choose among all the
+    possible edges.
+
+    Args:
+        n (int): The number of computers.
+        m (int): The number of edges.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        numpy.ndarray: The keys low * n + high of the edges.
+
+    Raises:
+        ValueError: If m is larger than the number of possible edges.
+    """
+    possible = n * (n - 1) // 2
+    if m > possible:
+        raise ValueError(f"{n} computers have at most {possible} edges, not {m}")
+    if m > possible // 2:
+        low, high = np.triu_indices(n, 1)
+        chosen = rng.choice(possible, m, replace=False)
+        return low[chosen].astype(np.int64) * n + high[chosen]
+
+    keys = np.empty(0, dtype=np.int64)
+    while len(keys) < m:
+        missing = m - len(keys)
+        first = rng.integers(0, n, 2 * missing + 16)
+        second = rng.integers(0, n, 2 * missing + 16)
+        distinct = first != second
+        first, second = first[distinct], second[distinct]
+        keys = distinct_keys(np.concatenate((keys, np.minimum(first, second) * n + np.maximum(first, second))))
+    # the distinct edges found are a uniform random set, any m of them a uniform sample
+    return keys[rng.permutation(len(keys))[:m]]
+
+
+def gnp_edges(n, p, rng) -> tuple:
+    """
+    Erdős–Rényi G(n, p): every edge is present independently with probability p.
+
+    The number of edges is drawn from its binomial distribution, then that many distinct edges are drawn
+    uniformly.
+
+    Args:
+        n (int): The number of computers.
+        p (float): The probability of every edge.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f"The edge probability {p} is not between 0 and 1")
+    m = int(rng.binomial(n * (n - 1) // 2, p))
+    return pair_keys_to_edges(sample_edge_keys(n, m, rng), n)
+
+
+def gnm_edges(n, m, rng) -> tuple:
+    """
+    Erdős–Rényi G(n, m): m distinct edges drawn uniformly.
+
+    Args:
+        n (int): The number of computers.
+        m (int): The number of edges.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    return pair_keys_to_edges(sample_edge_keys(n, m, rng), n)
+
+
+def barabasi_albert_edges(n, m, rng) -> tuple:
+    """
+    Barabási–Albert preferential attachment: computers 1 .. n - 1 arrive in order and each one attaches m
+    edges to earlier computers chosen with probability proportional to their degree.
+
+    This is the edge-list formulation of Batagelj and Brandes: the endpoints of the edges are stored in one
+    array, every new edge's source is the arriving computer and its target copies a uniformly chosen
+    earlier endpoint. The copies are resolved all at once by pointer jumping. Computer 1 attaches to
+    computer 0; repeated targets give fewer than m distinct edges.
+
+    Args:
+        n (int): The number of computers.
+        m (int): The number of edges of every arriving computer.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    sources = np.repeat(np.arange(1, n, dtype=np.int64), m)
+    edges = len(sources)
+    endpoints = np.zeros(2 * edges, dtype=np.int64)
+    endpoints[0::2] = sources
+
+    # every target points at a uniformly chosen endpoint of the earlier computers' edges
+    earlier = 2 * (sources - 1) * m
+    pointers = np.arange(2 * edges, dtype=np.int64)
+    copies = earlier > 0
+    pointers[1::2][copies] = (rng.random(int(copies.sum())) * earlier[copies]).astype(np.int64)
+    while True:
+        jumped = pointers[pointers]
+        if np.array_equal(jumped, pointers):
+            break
+        pointers = jumped
+    return sources, endpoints[pointers[1::2]]
+
+
+def watts_strogatz_edges(n, k, beta, rng) -> tuple:
+    """
+    Watts–Strogatz small world: a ring lattice where every computer is connected to its k nearest
+    computers, whose edges are then rewired to a uniformly chosen computer with probability beta.
+
+    Args:
+        n (int): The number of computers.
+        k (int): The degree of the lattice, rounded down to an even number (at least 2).
+        beta (float): The rewiring probability.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    if not 0 <= beta <= 1:
+        raise ValueError(f"The rewiring probability {beta} is not between 0 and 1")
+    nodes = np.arange(n, dtype=np.int64)
+    half = max(1, k // 2)
+    first = np.tile(nodes, half)
+    second = (first + np.repeat(np.arange(1, half + 1, dtype=np.int64), n)) % n
+
+    rewired = rng.random(len(first)) < beta
+    # a uniform computer other than the source: draw among n - 1 and skip the source
+    targets = rng.integers(0, n - 1, int(rewired.sum()))
+    targets += targets >= first[rewired]
+    second[rewired] = targets
+    return first, second
+
+
+def regular_edges(n, d, rng) -> tuple:
+    """
+    Random d-regular graph from the configuration model.
+
+    The n * d edge stubs are paired at random, then every self-loop or repeated edge has its endpoint
+    swapped with that of a random other edge, which keeps all the degrees, until none is left. A swap is
+    only made when it creates no new self-loop or repeated edge, and a pairing whose bad edges are not
+    fixed within REGULAR_ROUNDS rounds is replaced by a new one. A dense graph, d > (n - 1) / 2, is the
+    complement of a sparse (n - 1 - d)-regular one.
+
+    Args:
+        n (int): The number of computers.
+        d (int): The degree of every computer.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+
+    Raises:
+        ValueError: If n * d is odd, d is not below n, or no graph is found within REGULAR_PAIRINGS
+            pairings.
+    """
+    if n * d % 2:
+        raise ValueError(f"A {d}-regular topology needs an even number of edge endpoints, not {n} * {d}")
+    if d >= n:
+        raise ValueError(f"A {d}-regular topology needs more than {d} computers, not {n}")
+    if 2 * d > n - 1:
+        first, second = regular_edges(n, n - 1 - d, rng)
+        low, high = np.triu_indices(n, 1)
+        low, high = low.astype(np.int64), high.astype(np.int64)
+        present = np.isin(low * n + high, np.minimum(first, second) * n + np.maximum(first, second))
+        return low[~present], high[~present]
+
+    for _ in range(REGULAR_PAIRINGS):
+        stubs = rng.permutation(np.repeat(np.arange(n, dtype=np.int64), d))
+        first, second = stubs[0::2].copy(), stubs[1::2].copy()
+        edges = len(first)
+        if edges < 2:
+            return first, second
+
+        for _ in range(REGULAR_ROUNDS):
+            keys = np.minimum(first, second) * n + np.maximum(first, second)
+            order = np.argsort(keys, kind='stable')
+            repeated = np.zeros(edges, dtype=bool)
+            repeated[order[1:]] = keys[order[1:]] == keys[order[:-1]]
+            bad = np.flatnonzero((first == second) | repeated)
+            if len(bad) == 0:
+                return first, second
+            partners = rng.integers(0, edges, len(bad))
+            # swap every bad edge's second endpoint with a partner's; partners are taken at most once
+            partners, unique_positions = np.unique(partners, return_index=True)
+            bad = bad[unique_positions]
+            distinct = ~np.isin(partners, bad)
+            bad, partners = bad[distinct], partners[distinct]
+            flipped = partners[rng.random(len(partners)) < 0.5]  # either endpoint of a partner is swapped
+            first[flipped], second[flipped] = second[flipped], first[flipped].copy()
+
+            bad_low, bad_high = first[bad], second[partners]
+            partner_low, partner_high = first[partners], second[bad]
+            bad_keys = np.minimum(bad_low, bad_high) * n + np.maximum(bad_low, bad_high)
+            partner_keys = np.minimum(partner_low, partner_high) * n + np.maximum(partner_low, partner_high)
+            sorted_keys = keys[order]
+            valid = ((bad_low != bad_high) & (partner_low != partner_high) & (bad_keys != partner_keys)
+                     & ~sorted_contains(sorted_keys, bad_keys) & ~sorted_contains(sorted_keys, partner_keys))
+            # two swaps creating the same edge would repeat it, so neither is made
+            new_keys = np.concatenate((bad_keys[valid], partner_keys[valid]))
+            _, inverse, counts = np.unique(new_keys, return_inverse=True, return_counts=True)
+            single = counts[inverse] == 1
+            half = len(single) // 2
+            valid[valid] = single[:half] & single[half:]
+            bad, partners = bad[valid], partners[valid]
+            second[bad], second[partners] = second[partners], second[bad].copy()
+
+    raise ValueError(f"No {d}-regular topology of {n} computers was found in {REGULAR_PAIRINGS} attempts")
+
+
+def connect_regular(first, second, n, rng) -> tuple:
+    """
+    Joins the components of a regular graph without changing any degree.
+
+    Every component is merged into the components before it by a double edge swap: an edge a-b inside it
+    and an edge c-d before it become a-c and b-d. A swap of two bridges can leave two components, so the
+    components are recomputed until a single one is left.
+
+    Args:
+        first (numpy.ndarray): The index of one endpoint of every edge.
+        second (numpy.ndarray): The index of the other endpoint of every edge.
+        n (int): The number of computers.
+        rng (numpy.random.Generator): The random number generator.
+
+    Returns:
+        tuple: The edges of the connected graph, as two numpy arrays.
+
+    Raises:
+        ValueError: If the graph is a matching of more than two computers, which no swap connects.
+    """
+    while True:
+        roots = component_roots(first, second, n)
+        if not roots.any():
+            return first, second
+        if len(first) * 2 == n:
+            raise ValueError("A 1-regular topology of more than 2 computers cannot be connected")
+        edge_roots = roots[first]
+        merged = edge_roots == 0
+        for root in distinct_keys(edge_roots)[1:]:
+            inside = np.flatnonzero(edge_roots == root)
+            before = np.flatnonzero(merged)
+            inside_edge = inside[rng.integers(len(inside))]
+            before_edge = before[rng.integers(len(before))]
+            second[inside_edge], first[before_edge] = first[before_edge], second[inside_edge]
+            merged[inside] = True
+
+
+def grid_edges(n, wrap=False) -> tuple:
+    """
+    2D grid: the computers fill the rows of a grid of about sqrt(n) x sqrt(n) in order, and every computer
+    is connected to the next one in its row and to the one below it.
+
+    Args:
+        n (int): The number of computers.
+        wrap (bool, optional): Whether the rows and columns wrap around (a torus). Defaults to False.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    columns = max(1, math.ceil(math.sqrt(n)))
+    nodes = np.arange(n, dtype=np.int64)
+    row_starts = nodes // columns * columns
+    row_lengths = np.minimum(columns, n - row_starts)
+    below = nodes + columns
+    if wrap:
+        right = row_starts + (nodes - row_starts + 1) % row_lengths
+        below = np.where(below < n, below, nodes % columns)
+        return np.concatenate((nodes, nodes)), np.concatenate((right, below))
+
+    has_right = nodes + 1 < row_starts + row_lengths
+    has_below = below < n
+    return (np.concatenate((nodes[has_right], nodes[has_below])),
+            np.concatenate((nodes[has_right] + 1, below[has_below])))
+
+
+def torus_edges(n) -> tuple:
+    """
+    2D torus: a grid whose rows and columns wrap around.
+
+    Args:
+        n (int): The number of computers.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    return grid_edges(n, wrap=True)
+
+
+def hypercube_edges(n) -> tuple:
+    """
+    Hypercube: computers whose indices differ in exactly one bit are connected. If n is not a power of two
+    the hypercube is cut to its first n computers, which stay connected.
+
+    Args:
+        n (int): The number of computers.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    nodes = np.arange(n, dtype=np.int64)
+    first, second = [], []
+    for bit in range(max(1, (n - 1).bit_length())):
+        neighbors = nodes ^ (1 << bit)
+        kept = (neighbors > nodes) & (neighbors < n)
+        first.append(nodes[kept])
+        second.append(neighbors[kept])
+    return np.concatenate(first), np.concatenate(second)
+
+
+def ring_edges(n) -> tuple:
+    """
+    Ring: every computer is connected to the next one, and the last one to the first.
+
+    Args:
+        n (int): The number of computers.
+
+    Returns:
+        tuple: The indices of the two endpoints of every edge, as two numpy arrays.
+    """
+    nodes = np.arange(n, dtype=np.int64)
+    return nodes, (nodes + 1) % n
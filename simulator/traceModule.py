@@ -0,0 +1,311 @@
+"""
+Binary message traces.
+
+This module records every delivered message as a fixed-width binary record (arrival time, source ID,
+destination ID, payload ID) instead of printing it, and reads the records back. Payloads are interned: each
+distinct content is stored once, in a table at the end of the file. The converter writes a trace in the
+text format of Long logging, one line per message.
+
+By default the records are written by a background thread (`AsyncTraceWriter`), so the engine only
+appends to an in-memory buffer and never waits for the disk unless the writer falls behind.
+
+A trace file is laid out as:
+
+    header   MAGIC, format version (uint32), record size (uint32)
+    records  RECORD_DTYPE records, in delivery order
+    footer   the payload table (a JSON list of the contents' reprs), its offset (uint64), the record
+             count (uint64), the number of records the writer dropped (uint64) and MAGIC
+"""
+
+import atexit
+import json
+import queue
+import struct
+import threading
+
+import numpy as np
+
+MAGIC = b'DNSTRACE'
+VERSION = 2
+RECORD_DTYPE = np.dtype([('time', '<f8'), ('source', '<i8'), ('dest', '<i8'), ('payload', '<u4')])
+HEADER = struct.Struct('<8sII')
+FOOTER = struct.Struct('<QQQ8s')
+CHUNK_RECORDS = 1 << 16  # records buffered in memory before being written
+BUFFER_SIZE = 1 << 20
+RING_CHUNKS = 8  # chunks an asynchronous writer holds before the engine blocks or drops
+TRACE_WRITERS = ("Sync", "Block", "Drop")
+
+
+class TraceWriter:
+    """
+    Writes delivered messages to a binary trace file in large buffered chunks.
+
+    Attributes:
+        path (str): The path of the trace file.
+        file (file): The open trace file.
+        records (list): The buffered (time, source, dest, payload) records.
+        payload_ids (dict): The interning key of every content mapped to its payload ID.
+        payloads (list): The repr of every distinct content, indexed by payload ID.
+        count (int): The number of records written to the file so far.
+        dropped (int): The number of records dropped instead of written, always 0 for this writer.
+        chunk_records (int): The number of records buffered before they are written.
+    """
+
+    def __init__(self, path, chunk_records=CHUNK_RECORDS):
+        """
+        Creates the trace file and writes its header.
+
+        Args:
+            path (str): The path of the trace file.
+            chunk_records (int, optional): The number of records buffered before they are written.
+                Defaults to CHUNK_RECORDS.
+        """
+        self.path = path
+        self.file = open(path, 'wb', buffering=BUFFER_SIZE)
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize))
+        self.records = []
+        self.payload_ids = {}
+        self.payloads = []
+        self.count = 0
+        self.dropped = 0
+        self.chunk_records = chunk_records
+
+    def write(self, message):
+        """
+        Records a delivered message.
+
+        Args:
+            message (Message): The message.
+        """
+        content = message.content
+        key = content if type(content) is str else (repr(content),)  # the tuple keeps 1 and '1' apart
+        payload = self.payload_ids.get(key)
+        if payload is None:
+            payload = self.payload_ids[key] = len(self.payloads)
+            self.payloads.append(repr(content))
+        self.records.append((message.arrival_time, message.source_id, message.dest_id, payload))
+        if len(self.records) >= self.chunk_records:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered records to the file.
+        """
+        if self.records:
+            self.file.write(np.array(self.records, dtype=RECORD_DTYPE).tobytes())
+            self.count += len(self.records)
+            self.records = []
+
+    def close(self):
+        """
+        Writes the remaining records and the footer, which records the number of dropped records, and
+        closes the file. Closing twice does nothing.
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        table_offset = self.file.tell()
+        self.file.write(json.dumps(self.payloads).encode('utf-8'))
+        self.file.write(FOOTER.pack(table_offset, self.count, self.dropped, MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncTraceWriter(TraceWriter):
+    """
+    A trace writer whose chunks are converted and written by a background thread.
+
+    Full chunks go into a bounded ring (a queue of at most `ring_chunks` chunks) that the writer thread
+    drains. When the ring is full, the engine either waits for the writer (backpressure, "Block") or drops
+    the chunk and counts its records ("Drop"). The trace is always completed when the writer is closed,
+    or at interpreter exit if it never was.
+
+    Attributes:
+        drop (bool): Whether full chunks are dropped instead of waiting for the writer.
+        dropped (int): The number of records dropped because the ring was full.
+        ring (queue.Queue): The chunks waiting to be written.
+        thread (threading.Thread): The writer thread.
+        error (BaseException): The error that stopped the writer thread, if any.
+    """
+
+    def __init__(self, path, chunk_records=CHUNK_RECORDS, ring_chunks=RING_CHUNKS, drop=False):
+        """
+        Creates the trace file and starts the writer thread.
+
+        Args:
+            path (str): The path of the trace file.
+            chunk_records (int, optional): The number of records in a chunk. Defaults to CHUNK_RECORDS.
+            ring_chunks (int, optional): The number of chunks the ring holds. Defaults to RING_CHUNKS.
+            drop (bool, optional): Whether to drop chunks when the ring is full. Defaults to False.
+        """
+        super().__init__(path, chunk_records)
+        self.drop = drop
+        self.ring = queue.Queue(maxsize=ring_chunks)
+        self.error = None
+        self.thread = threading.Thread(target=self.drain, name="trace-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def drain(self):
+        """
+        Writes the chunks of the ring until the None sentinel is received. Runs on the writer thread.
+        """
+        while True:
+            records = self.ring.get()
+            if records is None:
+                return
+            if self.error is None:
+                try:
+                    self.file.write(np.array(records, dtype=RECORD_DTYPE).tobytes())
+                    self.count += len(records)
+                except BaseException as error:  # reported by close(), the ring keeps draining
+                    self.error = error
+
+    def flush(self):
+        """
+        Hands the buffered records to the writer thread.
+        """
+        if not self.records:
+            return
+        records, self.records = self.records, []
+        if self.drop:
+            try:
+                self.ring.put_nowait(records)
+            except queue.Full:
+                self.dropped += len(records)
+        else:
+            self.ring.put(records)
+
+    def close(self):
+        """
+        Hands over the remaining records, waits for the writer thread, then writes the footer and closes
+        the file. Closing twice does nothing.
+
+        Raises:
+            Exception: The error that stopped the writer thread, if any.
+        """
+        if self.file.closed:
+            return
+        atexit.unregister(self.close)
+        if self.records:
+            self.ring.put(self.records)  # the last chunk is never dropped
+            self.records = []
+        self.ring.put(None)
+        self.thread.join()
+        if self.error is not None:
+            self.file.close()
+            raise self.error
+        super().close()
+
+
+def open_trace(path, writer="Block"):
+    """
+    Opens a trace writer.
+
+    Args:
+        path (str): The path of the trace file.
+        writer (str, optional): "Sync" writes on the calling thread, "Block" and "Drop" write on a
+            background thread and, when it falls behind, respectively wait for it or drop records.
+            Defaults to "Block".
+
+    Returns:
+        TraceWriter: The writer.
+
+    Raises:
+        ValueError: If the writer type is unknown.
+    """
+    if writer == "Sync":
+        return TraceWriter(path)
+    if writer in ("Block", "Drop"):
+        return AsyncTraceWriter(path, drop=writer == "Drop")
+    raise ValueError(f"Unknown trace writer: {writer}. Expected one of {', '.join(TRACE_WRITERS)}")
+
+
+class TraceReader:
+    """
+    Reads a binary trace file.
+
+    Attributes:
+        path (str): The path of the trace file.
+        records (numpy.ndarray): The RECORD_DTYPE records, memory-mapped from the file.
+        payloads (list): The repr of every distinct content, indexed by payload ID.
+        dropped (int): The number of records the writer dropped, which are missing from the trace.
+    """
+
+    def __init__(self, path):
+        """
+        Opens a trace file and maps its records.
+
+        Args:
+            path (str): The path of the trace file.
+
+        Raises:
+            ValueError: If the file is not a complete trace file.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or record_size != RECORD_DTYPE.itemsize:
+                raise ValueError(f"{path} is not a version {VERSION} trace file")
+            f.seek(-FOOTER.size, 2)
+            footer_offset = f.tell()
+            table_offset, count, self.dropped, end_magic = FOOTER.unpack(f.read(FOOTER.size))
+            if end_magic != MAGIC:
+                raise ValueError(f"{path} is truncated (the trace was not closed)")
+            f.seek(table_offset)
+            self.payloads = json.loads(f.read(footer_offset - table_offset).decode('utf-8'))
+
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of messages in the trace.
+
+        Returns:
+            int: The number of records.
+        """
+        return len(self.records)
+
+    def lines(self, chunk_records=CHUNK_RECORDS):
+        """
+        Yields the messages in the text format of Long logging.
+
+        Args:
+            chunk_records (int, optional): The number of records converted at a time. Defaults to CHUNK_RECORDS.
+
+        Yields:
+            str: One line per message, without the newline.
+        """
+        payloads = self.payloads
+        for start in range(0, len(self.records), chunk_records):
+            chunk = self.records[start:start + chunk_records]
+            for time, source, dest, payload in zip(chunk['time'].tolist(), chunk['source'].tolist(),
+                                                   chunk['dest'].tolist(), chunk['payload'].tolist()):
+                yield (f"{{'source_id': {source!r}, 'dest_id': {dest!r}, 'arrival_time': {time!r}, "
+                       f"'content': {payloads[payload]}}}")
+
+
+def trace_to_text(trace_path, output):
+    """
+    Converts a binary trace to the text format of Long logging.
+
+    Args:
+        trace_path (str): The path of the trace file.
+        output (file): The text file to write the lines to.
+
+    Returns:
+        tuple: The number of messages written and the number of messages the trace writer dropped.
+    """
+    reader = TraceReader(trace_path)
+    for line in reader.lines():
+        output.write(line)
+        output.write('\n')
+    return len(reader), reader.dropped
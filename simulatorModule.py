@@ -11,6 +11,7 @@ import simulator.runModule as runModule
 import simulator.communication as communication
 import simulator.initializationModule as initializationModule
 import simulator.MainMenu as MainMenu
+import simulator.headlessModule as headlessModule
 from simulator.MainMenu import NETWORK_VARIABLES
 import visualizations.graphVisualization as graphVisualization
 
@@ -21,17 +22,10 @@ def load_network_variables():
     Load default variables from the NETWORK_VARIABLES JSON file.
     
     Returns:
-        dict: A dictionary of network variables loaded from the JSON file.
-        
-    Raises:
-        FileNotFoundError: If the file is not found.
-        json.JSONDecodeError: If the JSON is improperly formatted.
+        dict: A dictionary of network variables loaded from the JSON file, or an empty dictionary
+        if the file is missing or improperly formatted.
     """
-    try:
-        with open(NETWORK_VARIABLES, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+    return headlessModule.load_network_variables(NETWORK_VARIABLES)
 
 def initializeSimulator():
     """
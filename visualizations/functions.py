@@ -1,3 +1,6 @@
+from simulator.computer import MISSING
+
+
 def wheelEvent(self, event):
     """
     Zoom in or out on mouse wheel event.
@@ -62,53 +65,49 @@ def undo_change(self):
     """
     Undo the last change made to a node.
 
-    This method is triggered when the 'undo' button is pressed. It retrieves the last change from the change stack, reverts the node's state, and updates the network.
+    This method is triggered when the 'undo' button is pressed. It retrieves the last change from the change stack, restores the old values of the changed fields, and puts the change back in front of the network's pending changes.
     """
     if self.change_stack:
-        previous_node_item, previous_state = self.change_stack.pop(0)
-        previous_node_item.values = previous_state
-        previous_node_item.color = previous_state['color']
-
-        _, next_state = self.change_stack.pop(0)
-        self.network.node_values_change.insert(0, next_state)
-
-        previous_node_item.update()
+        node_name, changes = self.change_stack.popleft()
+        node_item = self.nodes_map[node_name]
+        for key, (old_value, _) in changes.items():
+            if old_value is MISSING:
+                node_item.values.pop(key, None)
+            else:
+                node_item.values[key] = old_value
+        node_item.color = node_item.values['color']
+
+        self.network.node_values_change.appendleft((int(node_name), changes))
+
+        node_item.update()
               
 def change_node_color(self, times):
     """
     Change the color of a node based on the current state in the network.
 
-    This method is called when a button is clicked and updates the color of a node based on the values in 'node_values_change'. It can update the color multiple times based on the 'times' argument.
+    This method is called when a button is clicked and applies the next changes in 'node_values_change'. It can apply multiple changes based on the 'times' argument.
 
     Args:
         times (int): The number of times to update the node color.
     """
     for _ in range(times):
         if self.network.node_values_change:
-            values_change_dict = self.network.node_values_change.pop(0)
-            node_name = None
-            for key, value in values_change_dict.items():
-                if key == 'id':
-                    node_name = value
-                    break
-            self.update_node_color(node_name, values_change_dict)
+            node_name, changes = self.network.node_values_change.popleft()
+            self.update_node_color(node_name, changes)
             
-def update_node_color(self, node_name, values_change_dict):
+def update_node_color(self, node_name, changes):
     """
-    Update the node's color and state based on the provided values.
+    Update the node's color and state based on the provided changes.
 
-    This method updates the node's color and other values based on the 'values_change_dict', and it stores the current state in the change stack for undo purposes.
+    This method sets the new value of every changed field of the node, and stores the changes in the change stack for undo purposes.
 
     Args:
         node_name (str): The name (ID) of the node whose color is to be updated.
-        values_change_dict (dict): The dictionary containing the updated values for the node.
+        changes (dict): The changed fields of the node mapped to (old value, new value).
     """
     node_item = self.nodes_map[str(node_name)]
-    previous_state = node_item.values.copy()
-    for key, value in values_change_dict.items():
-        node_item.values[key] = value
+    for key, (_, new_value) in changes.items():
+        node_item.values[key] = new_value
     node_item.color = node_item.values['color']
-    next_state = node_item.values.copy()
-    self.change_stack.insert(0, (node_item, previous_state))
-    self.change_stack.insert(1, (node_item, next_state))
+    self.change_stack.appendleft((node_item.name, changes))
     node_item.update()
\ No newline at end of file
@@ -13,6 +13,8 @@ from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 
 import simulator.initializationModule as initializationModule
+from simulator.changeLogModule import ChangeLog
+import simulator.replayModule as replayModule
 from visualizations.node import Node
 from visualizations.edge import Edge
 import visualizations.functions as gf
@@ -30,7 +32,7 @@ class GraphVisualizer(QWidget):
         num_nodes (int): The number of nodes in the network.
         nodes_map (dict): A dictionary mapping node names to Node objects.
         nx_layout (dict): A dictionary mapping layout names to NetworkX layout functions.
-        change_stack (list): A list to keep track of changes for undo functionality.
+        change_stack (ChangeLog): The (node name, changes) applied so far, the latest first, for undo functionality.
         scene (QGraphicsScene): The scene for displaying the nodes and edges.
         view (QGraphicsView): The view that displays the scene.
         graph_scale (int): The scaling factor for the graph visualization.
@@ -50,7 +52,7 @@ class GraphVisualizer(QWidget):
         super().__init__(parent)
         self.setWindowTitle("Simulator for Distributed Networks")
 
-        self.change_stack = []  # used for "undo" button press
+        self.change_stack = ChangeLog(network.change_log_records)  # used for "undo" button press
 
         self.network = network
         self.comm = comm
@@ -81,9 +83,7 @@ class GraphVisualizer(QWidget):
         """
         Adds edges to the graph based on the connections between computers in the network.
         """
-        for comp in self.network.connected_computers:
-            for connected in comp.connectedEdges:
-                self.graph.add_edge(str(comp.id), str(connected))
+        self.graph.add_edges_from((str(first), str(second)) for first, second in self.network.edges())
 
     def init_ui(self):
         """
@@ -206,15 +206,15 @@ class GraphVisualizer(QWidget):
         """
         gf.change_node_color(self, times)
         
-    def update_node_color(self, node_name, values_change_dict):
+    def update_node_color(self, node_name, changes):
         """
         Updates the color and state of a specific node in the graph.
 
         Args:
             node_name (str): The name of the node to update.
-            values_change_dict (dict): The dictionary containing updated node values.
+            changes (dict): The changed fields of the node mapped to (old value, new value).
         """
-        gf.update_node_color(self, node_name, values_change_dict)
+        gf.update_node_color(self, node_name, changes)
 
 
 def visualize_network(network: initializationModule.Initialization, comm):
@@ -234,3 +234,24 @@ def visualize_network(network: initializationModule.Initialization, comm):
     graph_window.show()
     graph_window.resize(1000, 800)
     
+
+
+def replay_change_trace(path):
+    """
+    Visualizes a change trace recorded by an earlier headless run, without re-running the algorithm.
+
+    The changes are streamed from the file as they are applied with the Next Phase and Run controls, and
+    can be undone as in a live run.
+
+    Args:
+        path (str): The path of the change trace file.
+
+    Returns:
+        ReplayNetwork: The network read from the change trace.
+
+    Raises:
+        ValueError: If the file is not a change trace.
+    """
+    network = replayModule.ReplayNetwork(path)
+    visualize_network(network, None)
+    return network
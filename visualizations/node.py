@@ -45,6 +45,8 @@ class NodeInfoWindow(QWidget):
         for key, value in values.items():
             if key.startswith("_"):
                 continue
+            if isinstance(value, memoryview):  # a view of the network's delay table
+                value = value.tolist()
             if key == "algorithm_file":
                 filename = os.path.basename(str(value))
                 text_content += f"{key} : {filename}\n"